@@ -8,12 +8,29 @@ All on-chain interactions go through typed wrapper functions.
 import json
 import os
 import secrets
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from enum import IntEnum
 from pathlib import Path
 
+import requests
 from dotenv import load_dotenv
+from eth_utils import keccak
+from eth_utils.abi import get_abi_output_types
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError, TransactionNotFound
+
+# orjson parses large artifacts several times faster; stdlib json otherwise.
+# Both accept bytes.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 # ─── Paths ────────────────────────────────────────────────────────────────────
 
@@ -40,10 +57,16 @@ TOURNAMENT_V2_ADDRESS = os.getenv("TOURNAMENT_V2_ADDRESS", "")
 ERC8004_IDENTITY_REGISTRY = os.getenv("ERC8004_IDENTITY_REGISTRY", "0x8004A169FB4a3325136EB29fA0ceB6D2e539a432")
 ERC8004_REPUTATION_REGISTRY = os.getenv("ERC8004_REPUTATION_REGISTRY", "0x8004BAa17C55a88189AE136b182e5fdA19dE9b63")
 
+# ─── Multicall3 (same deterministic address on every EVM chain, incl. Monad) ─
+
+MULTICALL3_ADDRESS = os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
+
 # ─── Monad Config ────────────────────────────────────────────────────────────
 
 MONAD_RPC_URL = os.getenv("MONAD_RPC_URL", "https://monad-mainnet.g.alchemy.com/v2/bl9zbJnm4_TpoPKha-QRB")
 MONAD_CHAIN_ID = int(os.getenv("MONAD_CHAIN_ID", "143"))
+# Optional websocket endpoint — enables event-driven game loops instead of fixed polling
+MONAD_WS_URL = os.getenv("MONAD_WS_URL", "")
 
 # ─── Game Constants ──────────────────────────────────────────────────────────
 
@@ -121,7 +144,8 @@ class TournamentV2Status(IntEnum):
 
 # ─── ABI Loading ──────────────────────────────────────────────────────────────
 
-# Lazy-load ABIs (available after forge build)
+# Lazy-load ABIs (available after forge build). Each artifact is parsed on
+# first use only, so a command touching one contract doesn't decode all eight.
 AGENT_REGISTRY_ABI = None
 ESCROW_ABI = None
 RPS_GAME_ABI = None
@@ -131,19 +155,23 @@ TOURNAMENT_ABI = None
 PREDICTION_MARKET_ABI = None
 TOURNAMENT_V2_ABI = None
 _abis_loaded = False
+_abi_cache = {}
 
 def _load_abi(contract_name: str) -> list:
-    """Load ABI from Foundry build artifact."""
+    """Load ABI from Foundry build artifact. Cached per contract."""
+    if contract_name in _abi_cache:
+        return _abi_cache[contract_name]
     artifact_path = CONTRACTS_OUT / f"{contract_name}.sol" / f"{contract_name}.json"
     if not artifact_path.exists():
         raise FileNotFoundError(
             f"ABI not found at {artifact_path}. Run 'forge build' first."
         )
-    with open(artifact_path) as f:
-        return json.load(f)["abi"]
+    abi = _json_loads(artifact_path.read_bytes())["abi"]
+    _abi_cache[contract_name] = abi
+    return abi
 
 def load_abis():
-    """Load all contract ABIs. Call after forge build. Idempotent."""
+    """Eagerly load all contract ABIs. Call after forge build. Idempotent."""
     global AGENT_REGISTRY_ABI, ESCROW_ABI, RPS_GAME_ABI, POKER_GAME_ABI, AUCTION_GAME_ABI, TOURNAMENT_ABI, PREDICTION_MARKET_ABI, TOURNAMENT_V2_ABI, _abis_loaded
     if _abis_loaded:
         return
@@ -161,12 +189,44 @@ def load_abis():
 
 _w3 = None
 _account = None
+_session = None
+
+# Connection pool shared by every RPC call — one pooled keep-alive TLS
+# connection instead of a fresh handshake per poll / state read
+RPC_POOL_SIZE = 10
+
+
+def _make_session() -> requests.Session:
+    """HTTP session for the RPC provider, with keep-alive pooling and connect retries."""
+    session = requests.Session()
+    # Connect errors are retried for every method; read errors are not retried
+    # for POST (urllib3 default), so a sent transaction is never re-submitted here
+    adapter = HTTPAdapter(
+        pool_connections=RPC_POOL_SIZE,
+        pool_maxsize=RPC_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def _make_w3() -> Web3:
+    """Build a Web3 instance on a fresh pooled session."""
+    global _session
+    if _session is not None:
+        _session.close()
+    _session = _make_session()
+    provider = Web3.HTTPProvider(MONAD_RPC_URL, request_kwargs={"timeout": 30}, session=_session)
+    return Web3(provider)
+
 
 def get_w3() -> Web3:
     """Get or create Web3 instance connected to Monad RPC."""
     global _w3
     if _w3 is None:
-        _w3 = Web3(Web3.HTTPProvider(MONAD_RPC_URL, request_kwargs={"timeout": 30}))
+        _w3 = _make_w3()
     return _w3
 
 
@@ -174,7 +234,7 @@ def reconnect_w3() -> Web3:
     """Force reconnect to Monad RPC. Call this after RPC errors."""
     global _w3
     _clear_contract_cache()
-    _w3 = Web3(Web3.HTTPProvider(MONAD_RPC_URL, request_kwargs={"timeout": 30}))
+    _w3 = _make_w3()
     return _w3
 
 
@@ -182,7 +242,7 @@ def _clear_contract_cache():
     """Clear cached contract instances so they're rebuilt with fresh w3."""
     global _registry_contract, _escrow_contract, _rps_contract
     global _poker_contract, _auction_contract, _tournament_contract
-    global _prediction_market_contract, _tournament_v2_contract
+    global _prediction_market_contract, _tournament_v2_contract, _multicall_contract
     _registry_contract = None
     _escrow_contract = None
     _rps_contract = None
@@ -191,6 +251,7 @@ def _clear_contract_cache():
     _tournament_contract = None
     _prediction_market_contract = None
     _tournament_v2_contract = None
+    _multicall_contract = None
 
 def get_account():
     """Get Account from DEPLOYER_PRIVATE_KEY. Lazy-initialized."""
@@ -202,9 +263,22 @@ def get_account():
         _account = get_w3().eth.account.from_key(pk)
     return _account
 
+_address = None
+_address_lower = None
+
 def get_address() -> str:
-    """Get the checksummed address of the fighter agent wallet."""
-    return get_account().address
+    """Get the checksummed address of the fighter agent wallet. Cached after first call."""
+    global _address
+    if _address is None:
+        _address = get_account().address
+    return _address
+
+def get_address_lower() -> str:
+    """Lowercase form of get_address(), for case-insensitive address comparisons."""
+    global _address_lower
+    if _address_lower is None:
+        _address_lower = get_address().lower()
+    return _address_lower
 
 # ─── Contract Instance Getters ────────────────────────────────────────────────
 
@@ -216,82 +290,174 @@ _auction_contract = None
 _tournament_contract = None
 _prediction_market_contract = None
 _tournament_v2_contract = None
+_multicall_contract = None
 
 def get_registry():
     """Get AgentRegistry contract instance. Lazy-initialized."""
     global _registry_contract
     if _registry_contract is None:
-        load_abis()
         addr = Web3.to_checksum_address(AGENT_REGISTRY_ADDRESS)
-        _registry_contract = get_w3().eth.contract(address=addr, abi=AGENT_REGISTRY_ABI)
+        _registry_contract = get_w3().eth.contract(address=addr, abi=_load_abi("AgentRegistry"))
     return _registry_contract
 
 def get_escrow():
     """Get Escrow contract instance. Lazy-initialized."""
     global _escrow_contract
     if _escrow_contract is None:
-        load_abis()
         addr = Web3.to_checksum_address(ESCROW_ADDRESS)
-        _escrow_contract = get_w3().eth.contract(address=addr, abi=ESCROW_ABI)
+        _escrow_contract = get_w3().eth.contract(address=addr, abi=_load_abi("Escrow"))
     return _escrow_contract
 
 def get_rps_game():
     """Get RPSGame contract instance. Lazy-initialized."""
     global _rps_contract
     if _rps_contract is None:
-        load_abis()
         addr = Web3.to_checksum_address(RPS_GAME_ADDRESS)
-        _rps_contract = get_w3().eth.contract(address=addr, abi=RPS_GAME_ABI)
+        _rps_contract = get_w3().eth.contract(address=addr, abi=_load_abi("RPSGame"))
     return _rps_contract
 
 def get_poker_game():
     """Get PokerGame contract instance. Lazy-initialized."""
     global _poker_contract
     if _poker_contract is None:
-        load_abis()
         addr = Web3.to_checksum_address(POKER_GAME_ADDRESS)
-        _poker_contract = get_w3().eth.contract(address=addr, abi=POKER_GAME_ABI)
+        _poker_contract = get_w3().eth.contract(address=addr, abi=_load_abi("PokerGameV2"))
     return _poker_contract
 
 def get_auction_game():
     """Get AuctionGame contract instance. Lazy-initialized."""
     global _auction_contract
     if _auction_contract is None:
-        load_abis()
         addr = Web3.to_checksum_address(AUCTION_GAME_ADDRESS)
-        _auction_contract = get_w3().eth.contract(address=addr, abi=AUCTION_GAME_ABI)
+        _auction_contract = get_w3().eth.contract(address=addr, abi=_load_abi("AuctionGame"))
     return _auction_contract
 
 def get_tournament():
     """Get Tournament contract instance. Lazy-initialized."""
     global _tournament_contract
     if _tournament_contract is None:
-        load_abis()
         addr = Web3.to_checksum_address(TOURNAMENT_ADDRESS)
-        _tournament_contract = get_w3().eth.contract(address=addr, abi=TOURNAMENT_ABI)
+        _tournament_contract = get_w3().eth.contract(address=addr, abi=_load_abi("Tournament"))
     return _tournament_contract
 
 def get_prediction_market():
     """Get PredictionMarket contract instance. Lazy-initialized."""
     global _prediction_market_contract
     if _prediction_market_contract is None:
-        load_abis()
         addr = Web3.to_checksum_address(PREDICTION_MARKET_ADDRESS)
-        _prediction_market_contract = get_w3().eth.contract(address=addr, abi=PREDICTION_MARKET_ABI)
+        _prediction_market_contract = get_w3().eth.contract(address=addr, abi=_load_abi("PredictionMarket"))
     return _prediction_market_contract
 
 def get_tournament_v2():
     """Get TournamentV2 contract instance. Lazy-initialized."""
     global _tournament_v2_contract
     if _tournament_v2_contract is None:
-        load_abis()
         addr = Web3.to_checksum_address(TOURNAMENT_V2_ADDRESS)
-        _tournament_v2_contract = get_w3().eth.contract(address=addr, abi=TOURNAMENT_V2_ABI)
+        _tournament_v2_contract = get_w3().eth.contract(address=addr, abi=_load_abi("TournamentV2"))
     return _tournament_v2_contract
 
+# ─── Multicall3 Batching ─────────────────────────────────────────────────────
+
+# Minimal Multicall3 ABI — only aggregate3 is used
+_MULTICALL3_ABI = [{
+    "type": "function",
+    "name": "aggregate3",
+    "stateMutability": "payable",
+    "inputs": [{
+        "name": "calls",
+        "type": "tuple[]",
+        "components": [
+            {"name": "target", "type": "address"},
+            {"name": "allowFailure", "type": "bool"},
+            {"name": "callData", "type": "bytes"},
+        ],
+    }],
+    "outputs": [{
+        "name": "returnData",
+        "type": "tuple[]",
+        "components": [
+            {"name": "success", "type": "bool"},
+            {"name": "returnData", "type": "bytes"},
+        ],
+    }],
+}]
+
+def get_multicall():
+    """Get Multicall3 contract instance. Lazy-initialized."""
+    global _multicall_contract
+    if _multicall_contract is None:
+        addr = Web3.to_checksum_address(MULTICALL3_ADDRESS)
+        _multicall_contract = get_w3().eth.contract(address=addr, abi=_MULTICALL3_ABI)
+    return _multicall_contract
+
+# Upper bound on concurrent eth_calls when Multicall3 can't be used
+MAX_RPC_WORKERS = 8
+
+# Set once aggregate3 comes back empty: no Multicall3 deployed on this RPC's chain
+_multicall_missing = False
+
+def _call_concurrently(calls: list, allow_failure: bool) -> list:
+    """Run view calls individually but in parallel. Same return shape as multicall()."""
+    def _one(fn):
+        try:
+            return fn.call()
+        except Exception:
+            if allow_failure:
+                return None
+            raise
+
+    with ThreadPoolExecutor(max_workers=min(len(calls), MAX_RPC_WORKERS)) as pool:
+        return list(pool.map(_one, calls))
+
+def multicall(calls: list, allow_failure: bool = False) -> list:
+    """
+    Batch several view calls into a single eth_call via Multicall3.aggregate3.
+
+    Args:
+        calls: Bound contract calls, e.g. [get_rps_game().functions.getRound(gid, 0), ...]
+        allow_failure: If True, reverted calls come back as None instead of
+                       reverting the whole batch
+
+    Returns:
+        Decoded results in call order, shaped exactly like each .call() would return
+    """
+    global _multicall_missing
+    if not calls:
+        return []
+    if _multicall_missing:
+        return _call_concurrently(calls, allow_failure)
+    w3 = get_w3()
+    batch = [(fn.address, allow_failure, fn._encode_transaction_data()) for fn in calls]
+    # Only "no Multicall3 here" and a reverted batch fall back; transport
+    # errors (rate limits, timeouts) propagate rather than fanning out N calls
+    try:
+        raw = get_multicall().functions.aggregate3(batch).call()
+    except BadFunctionCallOutput:
+        # Empty return data — no contract at MULTICALL3_ADDRESS on this chain
+        _multicall_missing = True
+        return _call_concurrently(calls, allow_failure)
+    except ContractLogicError:
+        # A strict batch reverted — re-run individually so the failing call raises
+        return _call_concurrently(calls, allow_failure)
+
+    results = []
+    for fn, (success, data) in zip(calls, raw):
+        if not success:
+            results.append(None)
+            continue
+        output_types = get_abi_output_types(fn.abi)
+        decoded = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, w3.codec.decode(output_types, data))
+        # Match .call(): single return value is unwrapped, multiple come back as a list
+        results.append(decoded[0] if len(decoded) == 1 else list(decoded))
+    return results
+
 # ─── Transaction Helper ──────────────────────────────────────────────────────
 
-def send_tx(func, value=0, retries=3):
+_tx_lock = threading.Lock()
+_next_nonce = None  # Next nonce for our account; None = fetch from the RPC
+
+
+def send_tx(func, value=0, retries=3, send_only=False):
     """
     Build, sign, send, and wait for a contract function call.
     Retries on transient RPC errors (429, timeouts).
@@ -300,9 +466,11 @@ def send_tx(func, value=0, retries=3):
         func: A web3 contract function call (e.g. contract.functions.register(...))
         value: Wei to send with the transaction (for payable functions)
         retries: Number of retry attempts for transient RPC errors
+        send_only: Return the tx hash right after broadcast instead of waiting
+                   for the receipt (caller confirms via state polls / get_tx_status)
 
     Returns:
-        Transaction receipt
+        Transaction receipt (or tx hash when send_only=True)
 
     Raises:
         Exception: If transaction reverts, includes tx hash and revert reason
@@ -311,7 +479,7 @@ def send_tx(func, value=0, retries=3):
 
     for attempt in range(retries):
         try:
-            return _send_tx_once(func, value)
+            return _send_tx_once(func, value, send_only)
         except Exception as e:
             err_str = str(e)
             # Retry on rate limits (429) and transient network errors
@@ -329,35 +497,72 @@ def send_tx(func, value=0, retries=3):
             raise  # Re-raise on non-transient errors or final attempt
 
 
-def _send_tx_once(func, value=0):
-    """Internal: single-attempt send_tx."""
+# Broadcast errors meaning our cached nonce is stale — another process using
+# the same wallet sent a tx, or a send_only tx we counted was dropped
+_NONCE_ERRORS = ("nonce too low", "nonce too high", "invalid nonce", "replacement transaction underpriced")
+
+
+def _is_nonce_error(err: Exception) -> bool:
+    msg = str(err).lower()
+    return any(s in msg for s in _NONCE_ERRORS)
+
+
+def resync_nonce():
+    """Drop the cached nonce so the next send re-reads it from the RPC (e.g. after a dropped tx)."""
+    global _next_nonce
+    with _tx_lock:
+        _next_nonce = None
+
+
+def _send_tx_once(func, value=0, send_only=False):
+    """Internal: single-attempt send_tx (plus one re-try after re-syncing a stale nonce)."""
     w3 = get_w3()
     account = get_account()
 
-    # Build the transaction
-    tx = func.build_transaction({
-        "from": account.address,
-        "value": value,
-        "nonce": w3.eth.get_transaction_count(account.address),
-        "chainId": MONAD_CHAIN_ID,
-    })
-
-    # Estimate gas with 1.2x buffer — fail fast if call would revert
-    try:
-        estimated = w3.eth.estimate_gas(tx)
-        tx["gas"] = int(estimated * 1.2)
-    except Exception as e:
-        err_msg = str(e)
-        # If estimate_gas reverts, the tx WILL revert on-chain — fail early
-        if "revert" in err_msg.lower() or "execution reverted" in err_msg.lower():
-            raise Exception(f"Transaction would revert (estimate_gas): {err_msg}")
-        # Non-revert errors (RPC timeout, etc.) — use fallback gas
-        print(f"    [warn] Gas estimation failed ({err_msg[:100]}), using 500k fallback")
-        tx["gas"] = 500000
-
-    # Sign and send
-    signed = account.sign_transaction(tx)
-    tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+    # Nonce pick → sign → broadcast is serialized so games played from
+    # several threads never reuse a nonce; receipt waits stay outside the lock
+    global _next_nonce
+    with _tx_lock:
+        for nonce_attempt in range(2):
+            # Nonce is fetched once, then incremented locally after each broadcast
+            if _next_nonce is None:
+                _next_nonce = w3.eth.get_transaction_count(account.address, "pending")
+            try:
+                # Build the transaction
+                tx = func.build_transaction({
+                    "from": account.address,
+                    "value": value,
+                    "nonce": _next_nonce,
+                    "chainId": MONAD_CHAIN_ID,
+                })
+
+                # Estimate gas with 1.2x buffer — fail fast if call would revert
+                try:
+                    estimated = w3.eth.estimate_gas(tx)
+                    tx["gas"] = int(estimated * 1.2)
+                except Exception as e:
+                    err_msg = str(e)
+                    # If estimate_gas reverts, the tx WILL revert on-chain — fail early
+                    if "revert" in err_msg.lower() or "execution reverted" in err_msg.lower():
+                        raise Exception(f"Transaction would revert (estimate_gas): {err_msg}")
+                    # Non-revert errors (RPC timeout, etc.) — use fallback gas
+                    print(f"    [warn] Gas estimation failed ({err_msg[:100]}), using 500k fallback")
+                    tx["gas"] = 500000
+
+                # Sign and send
+                signed = account.sign_transaction(tx)
+                tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+            except Exception as e:
+                _next_nonce = None  # Unknown whether it was consumed — re-sync next time
+                if nonce_attempt == 0 and _is_nonce_error(e):
+                    print(f"    [retry] Stale nonce ({str(e)[:60]}), re-syncing from the RPC...")
+                    continue
+                raise
+            _next_nonce += 1
+            break
+
+    if send_only:
+        return tx_hash
 
     # Wait for receipt with retry on 429
     receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
@@ -373,6 +578,22 @@ def _send_tx_once(func, value=0):
 
     return receipt
 
+
+def get_tx_status(tx_hash):
+    """Non-blocking receipt check: 1 = success, 0 = reverted, None = still pending."""
+    try:
+        return get_w3().eth.get_transaction_receipt(tx_hash)["status"]
+    except TransactionNotFound:
+        return None
+
+def is_tx_known(tx_hash) -> bool:
+    """True while the node still has the tx (mempool or chain); False once it was dropped."""
+    try:
+        get_w3().eth.get_transaction(tx_hash)
+        return True
+    except TransactionNotFound:
+        return False
+
 # ─── AgentRegistry Wrappers ──────────────────────────────────────────────────
 
 def register_agent(game_types: list[int], min_wager: int, max_wager: int):
@@ -387,7 +608,9 @@ def get_agent_info(address: str) -> dict:
     wallet, gameTypes, minWager, maxWager, isOpen, exists
     """
     addr = Web3.to_checksum_address(address)
-    result = get_registry().functions.getAgent(addr).call()
+    return _agent_dict(get_registry().functions.getAgent(addr).call())
+
+def _agent_dict(result) -> dict:
     # web3.py returns struct as tuple: (wallet, gameTypes[], minWager, maxWager, isOpen, exists)
     return {
         "wallet": result[0],
@@ -398,6 +621,24 @@ def get_agent_info(address: str) -> dict:
         "exists": result[5],
     }
 
+def batch_get_agents(addresses: list[str], game_type: int = GameType.RPS) -> dict:
+    """
+    Get agent info + ELO for many agents in a single eth_call via Multicall3.
+    Returns {address: (info_dict | None, elo | None)} — None where the read reverted.
+    """
+    registry = get_registry()
+    calls = []
+    for address in addresses:
+        addr = Web3.to_checksum_address(address)
+        calls.append(registry.functions.getAgent(addr))
+        calls.append(registry.functions.elo(addr, game_type))
+    results = multicall(calls, allow_failure=True)
+    out = {}
+    for i, address in enumerate(addresses):
+        info, elo = results[2 * i], results[2 * i + 1]
+        out[address] = (_agent_dict(info) if info is not None else None, elo)
+    return out
+
 def get_open_agents(game_type: int = GameType.RPS) -> list[str]:
     """Get list of open agent addresses for a game type."""
     return get_registry().functions.getOpenAgents(game_type).call()
@@ -407,16 +648,57 @@ def get_elo(address: str, game_type: int = GameType.RPS) -> int:
     addr = Web3.to_checksum_address(address)
     return get_registry().functions.elo(addr, game_type).call()
 
+def get_elos_bulk(addresses: list[str], game_type: int = GameType.RPS) -> list:
+    """
+    Get ELO ratings for many agents in a single eth_call via Multicall3.
+    Returns ELOs in address order; None where the read reverted.
+    """
+    registry = get_registry()
+    return multicall(
+        [registry.functions.elo(Web3.to_checksum_address(a), game_type) for a in addresses],
+        allow_failure=True,
+    )
+
 def get_match_history(address: str) -> list:
     """Get match history for an agent. Returns list of tuples (opponent, gameType, won, wager, timestamp)."""
     addr = Web3.to_checksum_address(address)
     return get_registry().functions.getMatchHistory(addr).call()
 
+def get_match_history_and_elo(address: str, game_type: int = GameType.RPS) -> tuple[list, int]:
+    """Get match history and ELO for an agent in one eth_call. Returns (history, elo)."""
+    registry = get_registry()
+    addr = Web3.to_checksum_address(address)
+    history, elo = multicall([
+        registry.functions.getMatchHistory(addr),
+        registry.functions.elo(addr, game_type),
+    ])
+    return history, elo
+
 def get_match_count(address: str) -> int:
     """Get total match count for an agent."""
     addr = Web3.to_checksum_address(address)
     return get_registry().functions.getMatchCount(addr).call()
 
+def get_agent_overview(address: str) -> dict:
+    """
+    Get agent info, match count, and ELO for every game type in one eth_call.
+    Returns dict with keys: info (None if not registered), matchCount, elos ({GameType: elo})
+    """
+    registry = get_registry()
+    addr = Web3.to_checksum_address(address)
+    game_types = (GameType.RPS, GameType.POKER, GameType.AUCTION)
+    results = multicall(
+        [registry.functions.getAgent(addr), registry.functions.getMatchCount(addr)]
+        + [registry.functions.elo(addr, gt) for gt in game_types],
+        allow_failure=True,
+    )
+    info = results[0]
+    return {
+        "info": _agent_dict(info) if info is not None else None,
+        "matchCount": results[1],
+        "elos": dict(zip(game_types, results[2:])),
+    }
+
 # ─── Escrow Wrappers ─────────────────────────────────────────────────────────
 
 def create_escrow_match(opponent: str, game_contract: str, wager_wei: int):
@@ -479,13 +761,7 @@ def reveal_move(game_id: int, move: int, salt: bytes):
         get_rps_game().functions.reveal(game_id, move, salt)
     )
 
-def get_game(game_id: int) -> dict:
-    """
-    Get RPS game details. Returns dict with keys:
-    escrowMatchId, player1, player2, totalRounds, currentRound,
-    p1Score, p2Score, phase, phaseDeadline, settled
-    """
-    result = get_rps_game().functions.getGame(game_id).call()
+def _game_dict(result) -> dict:
     return {
         "escrowMatchId": result[0],
         "player1": result[1],
@@ -499,12 +775,15 @@ def get_game(game_id: int) -> dict:
         "settled": result[9],
     }
 
-def get_round(game_id: int, round_index: int) -> dict:
+def get_game(game_id: int) -> dict:
     """
-    Get round data. Returns dict with keys:
-    p1Commit, p2Commit, p1Move, p2Move, p1Revealed, p2Revealed
+    Get RPS game details. Returns dict with keys:
+    escrowMatchId, player1, player2, totalRounds, currentRound,
+    p1Score, p2Score, phase, phaseDeadline, settled
     """
-    result = get_rps_game().functions.getRound(game_id, round_index).call()
+    return _game_dict(get_rps_game().functions.getGame(game_id).call())
+
+def _round_dict(result) -> dict:
     return {
         "p1Commit": result[0],
         "p2Commit": result[1],
@@ -514,6 +793,37 @@ def get_round(game_id: int, round_index: int) -> dict:
         "p2Revealed": result[5],
     }
 
+def get_round(game_id: int, round_index: int) -> dict:
+    """
+    Get round data. Returns dict with keys:
+    p1Commit, p2Commit, p1Move, p2Move, p1Revealed, p2Revealed
+    """
+    return _round_dict(get_rps_game().functions.getRound(game_id, round_index).call())
+
+def get_game_with_round(game_id: int, round_index: int) -> tuple[dict, dict]:
+    """
+    Get RPS game details and one round's data in a single eth_call.
+    Returns (game, round) dicts with the same keys as get_game / get_round.
+    """
+    rps = get_rps_game()
+    game, rd = multicall([
+        rps.functions.getGame(game_id),
+        rps.functions.getRound(game_id, round_index),
+    ])
+    return _game_dict(game), _round_dict(rd)
+
+def batch_get_rounds(game_id: int, r_start: int, r_end: int) -> list:
+    """
+    Get rounds [r_start, r_end) in a single eth_call via Multicall3.
+    Returns list of round dicts (same keys as get_round); None for rounds that reverted.
+    """
+    rps = get_rps_game()
+    results = multicall(
+        [rps.functions.getRound(game_id, r) for r in range(r_start, r_end)],
+        allow_failure=True,
+    )
+    return [_round_dict(r) if r is not None else None for r in results]
+
 def get_next_game_id() -> int:
     """Get the next game ID that will be assigned by RPSGame."""
     return get_rps_game().functions.nextGameId().call()
@@ -531,7 +841,8 @@ def make_commit_hash(move_int: int, salt_bytes32: bytes) -> bytes:
     Compute commit hash matching Solidity's keccak256(abi.encodePacked(uint8(move), bytes32(salt))).
     Returns bytes32 hash.
     """
-    return Web3.solidity_keccak(["uint8", "bytes32"], [move_int, salt_bytes32])
+    # encodePacked(uint8, bytes32) is just 1 byte + 32 bytes — hash directly, no ABI encoder
+    return keccak(bytes((move_int,)) + salt_bytes32)
 
 def generate_salt() -> bytes:
     """Generate 32 random bytes for commit-reveal salt."""
@@ -567,6 +878,18 @@ def parse_game_id_from_receipt(receipt) -> int:
         raise ValueError("No GameCreated event found in receipt")
     return logs[0]["args"]["gameId"]
 
+def _find_game_created(game_contract, match_id: int, from_block: int) -> int | None:
+    """Scan GameCreated logs (escrowMatchId is indexed) for a match. Returns gameId or None."""
+    logs = game_contract.events.GameCreated().get_logs(
+        from_block=from_block,
+        argument_filters={"escrowMatchId": match_id},
+    )
+    return logs[0]["args"]["gameId"] if logs else None
+
+def find_game_for_match(match_id: int, from_block: int) -> int | None:
+    """Find the RPS gameId created for an escrow match since from_block, via eth_getLogs."""
+    return _find_game_created(get_rps_game(), match_id, from_block)
+
 
 # ─── PokerGame Wrappers ─────────────────────────────────────────────────────
 
@@ -576,27 +899,30 @@ def create_poker_game(escrow_match_id: int):
         get_poker_game().functions.createGame(escrow_match_id)
     )
 
-def commit_poker_hand(game_id: int, hand_hash: bytes):
-    """Commit a hashed hand value. Returns receipt."""
+def commit_poker_hand(game_id: int, hand_hash: bytes, send_only: bool = False):
+    """Commit a hashed hand value. Returns receipt (tx hash if send_only)."""
     return send_tx(
-        get_poker_game().functions.commitHand(game_id, hand_hash)
+        get_poker_game().functions.commitHand(game_id, hand_hash),
+        send_only=send_only,
     )
 
-def poker_take_action(game_id: int, action: int, value_wei: int = 0):
+def poker_take_action(game_id: int, action: int, value_wei: int = 0, send_only: bool = False):
     """
-    Take a betting action in a poker game. Returns receipt.
+    Take a betting action in a poker game. Returns receipt (tx hash if send_only).
     action: PokerAction enum value (1=Check, 2=Bet, 3=Raise, 4=Call, 5=Fold)
     value_wei: ETH to send with bet/raise (0 for check/fold)
     """
     return send_tx(
         get_poker_game().functions.takeAction(game_id, action),
         value=value_wei,
+        send_only=send_only,
     )
 
-def reveal_poker_hand(game_id: int, hand_value: int, salt: bytes):
-    """Reveal hand value and salt. Returns receipt."""
+def reveal_poker_hand(game_id: int, hand_value: int, salt: bytes, send_only: bool = False):
+    """Reveal hand value and salt. Returns receipt (tx hash if send_only)."""
     return send_tx(
-        get_poker_game().functions.revealHand(game_id, hand_value, salt)
+        get_poker_game().functions.revealHand(game_id, hand_value, salt),
+        send_only=send_only,
     )
 
 def get_poker_game_state(game_id: int) -> dict:
@@ -651,9 +977,13 @@ def parse_poker_game_id_from_receipt(receipt) -> int:
         raise ValueError("No GameCreated event found in poker receipt")
     return logs[0]["args"]["gameId"]
 
+def find_poker_game_for_match(match_id: int, from_block: int) -> int | None:
+    """Find the poker gameId created for an escrow match since from_block, via eth_getLogs."""
+    return _find_game_created(get_poker_game(), match_id, from_block)
+
 def make_poker_hand_hash(hand_value: int, salt_bytes32: bytes) -> bytes:
-    """Compute hand value commit hash matching PokerGame.sol."""
-    return Web3.solidity_keccak(["uint8", "bytes32"], [hand_value, salt_bytes32])
+    """Compute hand value commit hash matching PokerGame.sol: keccak256(abi.encodePacked(uint8, bytes32))."""
+    return keccak(bytes((hand_value,)) + salt_bytes32)
 
 
 # ─── AuctionGame Wrappers ───────────────────────────────────────────────────
@@ -664,26 +994,21 @@ def create_auction_game(escrow_match_id: int):
         get_auction_game().functions.createGame(escrow_match_id)
     )
 
-def commit_auction_bid(game_id: int, bid_hash: bytes):
-    """Commit a hashed bid. Returns receipt."""
+def commit_auction_bid(game_id: int, bid_hash: bytes, send_only: bool = False):
+    """Commit a hashed bid. Returns receipt (tx hash if send_only)."""
     return send_tx(
-        get_auction_game().functions.commitBid(game_id, bid_hash)
+        get_auction_game().functions.commitBid(game_id, bid_hash),
+        send_only=send_only,
     )
 
-def reveal_auction_bid(game_id: int, bid: int, salt: bytes):
-    """Reveal bid amount and salt. Returns receipt."""
+def reveal_auction_bid(game_id: int, bid: int, salt: bytes, send_only: bool = False):
+    """Reveal bid amount and salt. Returns receipt (tx hash if send_only)."""
     return send_tx(
-        get_auction_game().functions.revealBid(game_id, bid, salt)
+        get_auction_game().functions.revealBid(game_id, bid, salt),
+        send_only=send_only,
     )
 
-def get_auction_game_state(game_id: int) -> dict:
-    """
-    Get auction game state. Returns dict with keys:
-    escrowMatchId, player1, player2, prize, p1Bid, p2Bid,
-    p1Committed, p2Committed, p1Revealed, p2Revealed,
-    phase, phaseDeadline, settled
-    """
-    result = get_auction_game().functions.getGame(game_id).call()
+def _auction_game_dict(result) -> dict:
     return {
         "escrowMatchId": result[0],
         "player1": result[1],
@@ -700,6 +1025,24 @@ def get_auction_game_state(game_id: int) -> dict:
         "settled": result[12],
     }
 
+def get_auction_game_state(game_id: int) -> dict:
+    """
+    Get auction game state. Returns dict with keys:
+    escrowMatchId, player1, player2, prize, p1Bid, p2Bid,
+    p1Committed, p2Committed, p1Revealed, p2Revealed,
+    phase, phaseDeadline, settled
+    """
+    return _auction_game_dict(get_auction_game().functions.getGame(game_id).call())
+
+def batch_get_auction_game_states(game_ids) -> list:
+    """
+    Get several auction game states in a single eth_call via Multicall3.
+    Returns list of state dicts in game_ids order; None for reads that reverted.
+    """
+    auc = get_auction_game()
+    results = multicall([auc.functions.getGame(gid) for gid in game_ids], allow_failure=True)
+    return [_auction_game_dict(r) if r is not None else None for r in results]
+
 def get_next_auction_game_id() -> int:
     """Get the next auction game ID."""
     return get_auction_game().functions.nextGameId().call()
@@ -719,8 +1062,8 @@ def parse_auction_game_id_from_receipt(receipt) -> int:
     return logs[0]["args"]["gameId"]
 
 def make_auction_bid_hash(bid_wei: int, salt_bytes32: bytes) -> bytes:
-    """Compute bid commit hash matching AuctionGame.sol."""
-    return Web3.solidity_keccak(["uint256", "bytes32"], [bid_wei, salt_bytes32])
+    """Compute bid commit hash matching AuctionGame.sol: keccak256(abi.encodePacked(uint256, bytes32))."""
+    return keccak(bid_wei.to_bytes(32, "big") + salt_bytes32)
 
 
 # ─── Tournament Wrappers ──────────────────────────────────────────────────
@@ -883,23 +1226,13 @@ def redeem_prediction_market(market_id: int):
         get_prediction_market().functions.redeem(market_id)
     )
 
-def get_market_price(market_id: int) -> dict:
-    """
-    Get current YES/NO prices (scaled to 1e18 = 1.0).
-    Returns dict with keys: yesPrice, noPrice
-    """
-    result = get_prediction_market().functions.getPrice(market_id).call()
+def _market_price_dict(result) -> dict:
     return {
         "yesPrice": result[0],
         "noPrice": result[1],
     }
 
-def get_market(market_id: int) -> dict:
-    """
-    Get full market data. Returns dict with keys:
-    matchId, reserveYES, reserveNO, seedLiquidity, player1, player2, resolved, winner
-    """
-    result = get_prediction_market().functions.getMarket(market_id).call()
+def _market_dict(result) -> dict:
     # Market struct fields in order
     return {
         "matchId": result[0],
@@ -912,17 +1245,66 @@ def get_market(market_id: int) -> dict:
         "winner": result[7],
     }
 
+def _market_balances_dict(result) -> dict:
+    return {
+        "yes": result[0],
+        "no": result[1],
+    }
+
+def get_market_price(market_id: int) -> dict:
+    """
+    Get current YES/NO prices (scaled to 1e18 = 1.0).
+    Returns dict with keys: yesPrice, noPrice
+    """
+    return _market_price_dict(get_prediction_market().functions.getPrice(market_id).call())
+
+def market_price_from_reserves(reserve_yes: int, reserve_no: int) -> dict:
+    """
+    Compute YES/NO prices locally from AMM reserves, mirroring PredictionMarket.getPrice.
+    Returns dict with keys: yesPrice, noPrice
+    """
+    total = reserve_yes + reserve_no
+    if total == 0:
+        return {"yesPrice": 0, "noPrice": 0}
+    return {
+        "yesPrice": reserve_no * 10**18 // total,
+        "noPrice": reserve_yes * 10**18 // total,
+    }
+
+def get_market(market_id: int) -> dict:
+    """
+    Get full market data. Returns dict with keys:
+    matchId, reserveYES, reserveNO, seedLiquidity, player1, player2, resolved, winner
+    """
+    return _market_dict(get_prediction_market().functions.getMarket(market_id).call())
+
 def get_user_market_balances(market_id: int, user_address: str) -> dict:
     """
     Get user's token balances for a market.
     Returns dict with keys: yes, no
     """
     addr = Web3.to_checksum_address(user_address)
-    result = get_prediction_market().functions.getUserBalances(market_id, addr).call()
-    return {
-        "yes": result[0],
-        "no": result[1],
-    }
+    return _market_balances_dict(get_prediction_market().functions.getUserBalances(market_id, addr).call())
+
+def get_market_and_balances(market_id: int, user_address: str) -> tuple[dict, dict]:
+    """Fetch market data and the user's YES/NO balances in one eth_call. Returns (market, balances)."""
+    pm = get_prediction_market()
+    addr = Web3.to_checksum_address(user_address)
+    market, balances = multicall([
+        pm.functions.getMarket(market_id),
+        pm.functions.getUserBalances(market_id, addr),
+    ])
+    return _market_dict(market), _market_balances_dict(balances)
+
+def get_market_price_and_balances(market_id: int, user_address: str) -> tuple[dict, dict]:
+    """Fetch market prices and the user's YES/NO balances in one eth_call. Returns (prices, balances)."""
+    pm = get_prediction_market()
+    addr = Web3.to_checksum_address(user_address)
+    prices, balances = multicall([
+        pm.functions.getPrice(market_id),
+        pm.functions.getUserBalances(market_id, addr),
+    ])
+    return _market_price_dict(prices), _market_balances_dict(balances)
 
 def get_next_market_id() -> int:
     """Get the next market ID that will be assigned."""
@@ -936,6 +1318,22 @@ def parse_market_id_from_receipt(receipt) -> int:
         raise ValueError("No MarketCreated event found in receipt")
     return logs[0]["args"]["marketId"]
 
+def parse_tokens_bought_from_receipt(receipt) -> dict | None:
+    """
+    Extract the TokensBought event from a buy receipt.
+    Returns dict with keys: isYES, monIn, tokensOut — or None if the event is missing.
+    """
+    pm = get_prediction_market()
+    logs = pm.events.TokensBought().process_receipt(receipt)
+    if not logs:
+        return None
+    args = logs[0]["args"]
+    return {
+        "isYES": args["isYES"],
+        "monIn": args["monIn"],
+        "tokensOut": args["tokensOut"],
+    }
+
 
 # ─── TournamentV2 Wrappers ──────────────────────────────────────────────
 
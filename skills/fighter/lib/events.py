@@ -0,0 +1,169 @@
+"""
+events.py — Event-driven waiting for on-chain state changes.
+
+Game loops used to sleep a fixed POLL_INTERVAL between state reads. When
+MONAD_WS_URL is set, ContractEventWatcher keeps an eth_subscribe("logs")
+subscription open in a background thread, filtered to one contract and one
+indexed id (topic1 — gameId / matchId on all arena events), and wakes the
+loop as soon as a matching log arrives. Without a websocket endpoint (or if
+the subscription drops) it degrades to sleeping, with PollBackoff stretching
+the interval while nothing changes.
+"""
+
+import asyncio
+import threading
+import time
+
+from web3 import AsyncWeb3, Web3, WebSocketProvider
+
+from lib.contracts import MONAD_WS_URL
+
+# Longest we ever block on a subscription before re-reading state anyway
+BACKUP_POLL_SECONDS = 30
+
+
+def _id_topic(value: int) -> str:
+    """Encode a uint256 indexed argument as a 32-byte log topic."""
+    return "0x" + value.to_bytes(32, "big").hex()
+
+
+class ContractEventWatcher:
+    """
+    Wakes a polling loop when a contract emits a log for a given indexed id.
+
+    Usage:
+        watcher = ContractEventWatcher(RPS_GAME_ADDRESS, game_id)
+        while True:
+            state = read_state()
+            ...
+            watcher.wait(POLL_INTERVAL, deadline)
+        watcher.stop()
+    """
+
+    def __init__(self, contract_address: str, indexed_id: int):
+        self.contract_address = Web3.to_checksum_address(contract_address)
+        self.indexed_id = indexed_id
+        self._event = threading.Event()
+        self._ready = threading.Event()
+        self._stopped = False
+        self._live = False
+        self._thread = None
+        self._loop = None  # The listener thread's event loop and task, for stop()
+        self._task = None
+        if MONAD_WS_URL:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+            # Subscribe before the caller's first state read so no log is missed
+            self._ready.wait(timeout=5)
+
+    @property
+    def live(self) -> bool:
+        """True while the websocket subscription is active."""
+        return self._live
+
+    def wait(self, poll_interval: float, deadline: int = None) -> bool:
+        """
+        Block until a matching log arrives or the fallback timeout elapses.
+
+        Args:
+            poll_interval: Sleep used when no subscription is active
+            deadline: Optional unix timestamp (e.g. phaseDeadline); we wake by
+                      then so timeouts can still be claimed
+
+        Returns:
+            True if woken by an event, False on timeout / polling fallback
+        """
+        if not self._live:
+            time.sleep(poll_interval)
+            return False
+
+        timeout = BACKUP_POLL_SECONDS
+        if deadline:
+            timeout = min(timeout, max(1, deadline - int(time.time()) + 1))
+        got = self._event.wait(timeout)
+        # Clear before the caller re-reads state — any later log re-arms us
+        self._event.clear()
+        return got
+
+    def stop(self, timeout: float = 5):
+        """
+        Stop listening: cancel the subscription task (it unsubscribes and
+        closes the websocket) and wait up to `timeout` for the thread to exit.
+        No log may ever arrive for a settled game, so we can't wait for one.
+        """
+        self._stopped = True
+        self._live = False
+        self._event.set()
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed — the thread is exiting
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        try:
+            self._task = loop.create_task(self._listen())
+            self._loop = loop
+            if self._stopped:
+                self._task.cancel()  # stop() ran before the task existed
+            loop.run_until_complete(self._task)
+        except (Exception, asyncio.CancelledError):
+            pass  # Subscription lost or stopped — wait() falls back to polling
+        finally:
+            self._live = False
+            self._ready.set()
+            loop.close()
+
+    async def _listen(self):
+        async with AsyncWeb3(WebSocketProvider(MONAD_WS_URL)) as w3:
+            sub_id = await w3.eth.subscribe("logs", {
+                "address": self.contract_address,
+                "topics": [None, _id_topic(self.indexed_id)],
+            })
+            self._live = True
+            self._ready.set()
+            try:
+                async for _ in w3.socket.process_subscriptions():
+                    if self._stopped:
+                        break
+                    self._event.set()
+            finally:
+                # Also runs on cancel from stop(); best effort, the socket closes next
+                try:
+                    await w3.eth.unsubscribe(sub_id)
+                except (Exception, asyncio.CancelledError):
+                    pass
+
+
+class PollBackoff:
+    """
+    Adaptive poll interval for when no subscription is live.
+
+    Doubles the interval (up to max_multiplier x base) while the observed state
+    is unchanged and resets on any change. It never sleeps past an upcoming
+    phase deadline, so timeout claims are not delayed.
+    """
+
+    def __init__(self, max_multiplier: int = 8):
+        self.max_multiplier = max_multiplier
+        self._multiplier = 1
+        self._last_state = None
+
+    def interval(self, base: float, state, deadline: int = None) -> float:
+        """Next sleep in seconds, given the state tuple just observed."""
+        if state == self._last_state:
+            self._multiplier = min(self._multiplier * 2, self.max_multiplier)
+        else:
+            self._multiplier = 1
+            self._last_state = state
+
+        sleep_s = min(base * self._multiplier, BACKUP_POLL_SECONDS)
+        if deadline:
+            remaining = deadline - int(time.time())
+            if remaining > 0:
+                sleep_s = min(sleep_s, remaining + 1)
+        return sleep_s
@@ -6,6 +6,8 @@ and cumulative round history across all games. Persisted to disk as JSON.
 """
 import json
 import os
+import queue
+import threading
 import time
 from collections import Counter
 from pathlib import Path
@@ -13,6 +15,18 @@ from pathlib import Path
 # Default data directory for opponent models
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
+# Only RPS moves 1-3 are valid. Poker hand values and auction bids are
+# large ints that would corrupt the model.
+_VALID_MOVES = frozenset((1, 2, 3))
+
+
+def _write_atomic(path: str, text: str):
+    """Write text to a temp file beside path, then swap it in with os.replace."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
 
 class OpponentModel:
     """
@@ -38,6 +52,16 @@ class OpponentModel:
         self.poker_stats = {}              # {hands_seen, fold_rate, bluff_rate, aggression, avg_bet_size}
         self.auction_stats = {}            # {bids: [(bid, wager, won)], avg_shade_pct}
         self.strategy_cooldowns = {}       # {strategy_name: rounds_remaining}
+        # Derived from round_history, kept in step with it (not persisted)
+        self._response_freq = [[0] * 4 for _ in range(4)]  # [my_move][opp_move] counts, moves 1-3
+        self._win_rate_cache = (0, 0.5)    # (len(match_results), win rate) — results are append-only
+
+    def _count_responses(self, rounds):
+        freq = self._response_freq
+        for my_move, opp_move in rounds:
+            # Persisted history isn't filtered like update() input — skip bad pairs
+            if my_move in _VALID_MOVES and opp_move in _VALID_MOVES:
+                freq[my_move][opp_move] += 1
 
     def update(self, game_round_history: list[tuple[int, int]], won: bool = None,
                my_score: int = 0, opp_score: int = 0):
@@ -62,11 +86,9 @@ class OpponentModel:
                 self.last_updated = int(time.time())
             return
 
-        # Filter out invalid moves — only RPS moves 1-3 are valid.
-        # Poker hand values and auction bids are large ints that would corrupt the model.
-        VALID_MOVES = {1, 2, 3}
+        # Filter out invalid moves (see _VALID_MOVES)
         valid_rounds = [(m, o) for m, o in game_round_history
-                        if m in VALID_MOVES and o in VALID_MOVES]
+                        if m in _VALID_MOVES and o in _VALID_MOVES]
         if not valid_rounds:
             # No valid RPS rounds — still record match result
             if won is not None:
@@ -94,6 +116,7 @@ class OpponentModel:
 
         # Append to cumulative history (only valid RPS rounds)
         self.round_history.extend(valid_rounds)
+        self._count_responses(valid_rounds)
 
         # Record match result
         if won is not None:
@@ -110,12 +133,23 @@ class OpponentModel:
         """Return cumulative round history across all games vs this opponent."""
         return list(self.round_history)
 
+    def get_response_freq(self, my_move: int) -> list[int]:
+        """
+        How often the opponent played each move in rounds where we played
+        my_move (1-3), across all games, as a list indexed by opponent move
+        (index 0 unused). Maintained incrementally — don't mutate.
+        """
+        return self._response_freq[my_move]
+
     def get_win_rate(self) -> float:
         """Calculate win rate from match results. Returns 0.5 if no data."""
-        if not self.match_results:
+        n = len(self.match_results)
+        if n == 0:
             return 0.5
-        wins = sum(1 for r in self.match_results if r["won"])
-        return wins / len(self.match_results)
+        if self._win_rate_cache[0] != n:
+            wins = sum(1 for r in self.match_results if r["won"])
+            self._win_rate_cache = (n, wins / n)
+        return self._win_rate_cache[1]
 
     def get_total_games(self) -> int:
         """Total number of games played against this opponent."""
@@ -203,6 +237,7 @@ class OpponentModel:
         model.match_results = data.get("match_results", [])
         # round_history stored as list of [my, opp] pairs in JSON
         model.round_history = [tuple(r) for r in data.get("round_history", [])]
+        model._count_responses(model.round_history)
         model.last_updated = data.get("last_updated", 0)
         # Adaptive learning fields (backward-compatible defaults)
         model.strategy_performance = data.get("strategy_performance", {})
@@ -216,8 +251,8 @@ class OpponentModel:
         if path is None:
             DATA_DIR.mkdir(parents=True, exist_ok=True)
             path = str(DATA_DIR / f"{self.opponent_addr}.json")
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        # Temp file + rename: a crash mid-write keeps the previous model
+        _write_atomic(path, json.dumps(self.to_dict(), indent=2))
 
     @classmethod
     def load(cls, opponent_addr: str, path: str = None) -> "OpponentModel":
@@ -234,12 +269,20 @@ class OpponentModel:
 class OpponentModelStore:
     """
     Manages loading and saving all opponent models.
-    Models are cached in memory after first load.
+    Models are cached in memory after first load. Changed models are marked
+    dirty — which snapshots them on the caller's thread — and the snapshots
+    are written by a background thread (one write per address, however often
+    it is marked); flush() writes whatever is still pending and is registered
+    with atexit by the CLI.
     """
 
     def __init__(self, data_dir: str = None):
         self.data_dir = Path(data_dir) if data_dir else DATA_DIR
         self._cache = {}  # {lowercase_addr: OpponentModel}
+        self._dirty = {}  # lowercase addr → JSON snapshot not yet on disk
+        self._lock = threading.RLock()  # guards _dirty and serializes file writes
+        self._queue = queue.Queue()
+        self._writer = None
 
     def get(self, opponent_addr: str) -> OpponentModel:
         """Get or load an opponent model. Returns empty model for unknown opponents."""
@@ -249,13 +292,64 @@ class OpponentModelStore:
             self._cache[addr] = OpponentModel.load(addr, path)
         return self._cache[addr]
 
+    def _snapshot(self, addr: str) -> str:
+        return json.dumps(self._cache[addr].to_dict(), indent=2)
+
+    def _write(self, addr: str, snapshot: str):
+        """Write one snapshot; on failure it goes back to _dirty for the next flush()."""
+        with self._lock:
+            try:
+                self.data_dir.mkdir(parents=True, exist_ok=True)
+                _write_atomic(str(self.data_dir / f"{addr}.json"), snapshot)
+            except Exception:
+                self._dirty.setdefault(addr, snapshot)  # Unless a newer one is queued
+                raise
+
     def save(self, opponent_addr: str):
         """Save a specific opponent's model to disk."""
         addr = opponent_addr.lower()
-        if addr in self._cache:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-            path = str(self.data_dir / f"{addr}.json")
-            self._cache[addr].save(path)
+        with self._lock:
+            if addr not in self._cache:
+                return
+            self._dirty.pop(addr, None)
+            self._write(addr, self._snapshot(addr))
+
+    def mark_dirty(self, opponent_addr: str):
+        """Snapshot a changed model; the background writer saves it shortly."""
+        addr = opponent_addr.lower()
+        with self._lock:
+            # Serialized here, on the thread that mutates the model, so the
+            # writer never iterates a model mid-update
+            queued = addr in self._dirty
+            self._dirty[addr] = self._snapshot(addr)
+            if queued:
+                return  # Writer will pick up the newer snapshot — coalesce
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, daemon=True)
+                self._writer.start()
+        self._queue.put(addr)
+
+    def _write_loop(self):
+        while True:
+            addr = self._queue.get()
+            try:
+                # Pop and write under one hold so a newer snapshot can't be
+                # written by save() before this older one lands on top of it
+                with self._lock:
+                    snapshot = self._dirty.pop(addr, None)  # flush() may have beaten us to it
+                    if snapshot is not None:
+                        self._write(addr, snapshot)
+            except Exception:
+                pass  # Back in _dirty — flush() at exit retries it
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Write only the models that changed since they were loaded/saved."""
+        with self._lock:
+            pending = list(self._dirty)
+        for addr in pending:
+            self.save(addr)
 
     def save_all(self):
         """Save all cached models to disk."""
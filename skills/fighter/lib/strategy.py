@@ -362,8 +362,8 @@ def choose_hand_value(
     return hand_value
 
 
-def categorize_hand(hand_value: int) -> str:
-    """Categorize a hand value into strength tier."""
+def _hand_tier(hand_value: int) -> str:
+    """Threshold comparison behind categorize_hand (used to build the table)."""
     if hand_value <= HAND_WEAK:
         return "weak"
     elif hand_value <= HAND_MEDIUM:
@@ -374,6 +374,17 @@ def categorize_hand(hand_value: int) -> str:
         return "premium"
 
 
+# Strength tier for every legal hand value (0-100), built once at import
+_HAND_CATEGORY = tuple(_hand_tier(v) for v in range(101))
+
+
+def categorize_hand(hand_value: int) -> str:
+    """Categorize a hand value into strength tier."""
+    if 0 <= hand_value <= 100:
+        return _HAND_CATEGORY[hand_value]
+    return _hand_tier(hand_value)
+
+
 def choose_poker_action(
     hand_value: int,
     phase: str,
@@ -47,16 +47,25 @@ Social Commands:
     moltbook-post                          Post challenge invite to Moltbook
     moltx-post                             Post challenge invite to MoltX
     moltx-link-wallet                      Link EVM wallet to MoltX (EIP-712)
+
+Options:
+    --poll-interval <seconds>              Base game-state poll interval (default: 3)
 """
+import atexit
 import os
+import re
 import sys
 import time
-from pathlib import Path
+from itertools import islice
+from operator import itemgetter
+from types import MappingProxyType
 
 # ─── Path setup ──────────────────────────────────────────────────────────────
 # Add skill's lib/ to sys.path so imports work when run from project root
-_skill_dir = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(_skill_dir))
+# (abspath, not resolve(): no per-component symlink stat()s on every CLI start)
+_scripts_dir = os.path.dirname(os.path.abspath(__file__))
+_skill_dir = os.path.dirname(_scripts_dir)
+sys.path.insert(0, _skill_dir)
 
 from lib.contracts import (
     GamePhase,
@@ -67,6 +76,7 @@ from lib.contracts import (
     PokerPhase,
     PokerAction,
     AuctionPhase,
+    ESCROW_ADDRESS,
     RPS_GAME_ADDRESS,
     POKER_GAME_ADDRESS,
     AUCTION_GAME_ADDRESS,
@@ -77,19 +87,24 @@ from lib.contracts import (
     create_rps_game,
     generate_salt,
     get_address,
+    get_address_lower,
     get_agent_info,
+    get_agent_overview,
+    batch_get_agents,
     get_balance,
     get_elo,
+    get_elos_bulk,
     get_escrow_match,
     get_game,
-    get_match_count,
-    get_match_history,
-    get_next_game_id,
+    get_game_with_round,
+    get_match_history_and_elo,
     get_open_agents,
     get_round,
+    batch_get_rounds,
     make_commit_hash,
     mon_to_wei,
     parse_game_id_from_receipt,
+    find_game_for_match,
     parse_match_id_from_receipt,
     register_agent,
     reveal_move,
@@ -100,15 +115,19 @@ from lib.contracts import (
     poker_take_action,
     reveal_poker_hand,
     get_poker_game_state,
-    get_next_poker_game_id,
     claim_poker_timeout,
     parse_poker_game_id_from_receipt,
+    find_poker_game_for_match,
     make_poker_hand_hash,
     # Auction wrappers
     create_auction_game,
     commit_auction_bid,
     reveal_auction_bid,
     get_auction_game_state,
+    get_tx_status,
+    is_tx_known,
+    resync_nonce,
+    batch_get_auction_game_states,
     get_next_auction_game_id,
     claim_auction_timeout,
     parse_auction_game_id_from_receipt,
@@ -140,8 +159,12 @@ from lib.contracts import (
     get_market_price,
     get_market,
     get_user_market_balances,
+    get_market_and_balances,
+    get_market_price_and_balances,
+    market_price_from_reserves,
     get_next_market_id,
     parse_market_id_from_receipt,
+    parse_tokens_bought_from_receipt,
     # TournamentV2 wrappers
     TournamentV2Format,
     TournamentV2Status,
@@ -172,6 +195,7 @@ from lib.strategy import (
     choose_poker_action,
     choose_auction_bid,
 )
+from lib.events import ContractEventWatcher, PollBackoff
 from lib.opponent_model import OpponentModelStore
 from lib.bankroll import recommend_wager, estimate_win_prob, format_recommendation
 from lib.moltbook import (
@@ -197,7 +221,7 @@ from lib.output import (
     print_opponent_model_state,
 )
 # Psychology module lives in same scripts/ dir — add it to path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, _scripts_dir)
 from psychology import (
     get_commit_delay,
     should_seed_pattern,
@@ -210,9 +234,43 @@ from psychology import (
 # ─── Constants ────────────────────────────────────────────────────────────────
 
 POLL_INTERVAL = 3  # seconds between game state polls
+TX_DROP_TIMEOUT = 60  # seconds a sent tx may go without a receipt before it is re-sent
+
+# Display names / enums indexed by on-chain GameType value
+_GAME_TYPE_NAMES = ("RPS", "Poker", "Auction")
+_GAME_TYPE_ENUM = (GameType.RPS, GameType.POKER, GameType.AUCTION)
+# CLI game-type argument → GameType
+_TYPE_MAP = MappingProxyType({"rps": GameType.RPS, "poker": GameType.POKER, "auction": GameType.AUCTION})
+
+_ZERO_ADDRESS = "0x" + "0" * 40
+_EMPTY_COMMIT = bytes(32)  # commit hash slot before a player has committed
+
+# Poker betting: strategy action string → PokerAction, and per-phase labels
+_POKER_ACTION_MAP = MappingProxyType({
+    "check": PokerAction.CHECK,
+    "bet": PokerAction.BET,
+    "raise": PokerAction.RAISE,
+    "call": PokerAction.CALL,
+    "fold": PokerAction.FOLD,
+})
+_ROUND_NAME = MappingProxyType({
+    PokerPhase.BETTING_ROUND1: "Betting 1",
+    PokerPhase.BETTING_ROUND2: "Betting 2",
+})
+_STRATEGY_PHASE = MappingProxyType({
+    PokerPhase.BETTING_ROUND1: "round1",
+    PokerPhase.BETTING_ROUND2: "round2",
+})
+
+# Revert messages that mean "the match has no winner" — resolve as draw
+_DRAW_REVERT_RE = re.compile(r"draw|not settled|address\(0\)|winner", re.IGNORECASE)
+# Generic revert (e.g. hex-encoded reason) — draw resolution is still worth a try
+_GENERIC_REVERT_RE = re.compile(r"execution reverted", re.IGNORECASE)
 
 # Shared model store — persists opponent data across games
 _model_store = OpponentModelStore()
+# Persist updated models once at exit instead of rewriting after every game
+atexit.register(_model_store.flush)
 
 
 # ─── Social Posting Helper ───────────────────────────────────────────────────
@@ -242,20 +300,26 @@ def cmd_status():
     print(f"Balance: {wei_to_mon(balance):.6f} MON")
 
     try:
-        info = get_agent_info(addr)
-        game_type_names = [["RPS", "Poker", "Auction"][gt] for gt in info["gameTypes"]]
-        matches = get_match_count(addr)
-        print(f"Status:  Registered (open={info['isOpen']})")
-        print(f"Games:   {', '.join(game_type_names)}")
-        print(f"Wager:   {wei_to_mon(info['minWager']):.6f} - {wei_to_mon(info['maxWager']):.6f} MON")
-        # Show ELO for each registered game type
-        elo_map = {0: GameType.RPS, 1: GameType.POKER, 2: GameType.AUCTION}
-        for gt_idx in info["gameTypes"]:
-            gt = elo_map.get(gt_idx)
-            if gt is not None:
-                name = ["RPS", "Poker", "Auction"][gt_idx]
-                print(f"ELO {name:7s}: {get_elo(addr, gt)}")
-        print(f"Matches: {matches}")
+        # Agent info + match count + all ELOs in a single eth_call
+        overview = get_agent_overview(addr)
+        info = overview["info"]
+        if info is None:
+            print("Status:  Not registered")
+        else:
+            game_type_names = [_GAME_TYPE_NAMES[gt] for gt in info["gameTypes"]]
+            print(f"Status:  Registered (open={info['isOpen']})")
+            print(f"Games:   {', '.join(game_type_names)}")
+            print(f"Wager:   {wei_to_mon(info['minWager']):.6f} - {wei_to_mon(info['maxWager']):.6f} MON")
+            # Show ELO for each registered game type
+            for gt_idx in info["gameTypes"]:
+                if gt_idx < len(_GAME_TYPE_ENUM):
+                    gt = _GAME_TYPE_ENUM[gt_idx]
+                    name = _GAME_TYPE_NAMES[gt_idx]
+                    elo = overview["elos"][gt]
+                    if elo is None:  # Failed inside the batch — read it alone
+                        elo = get_elo(addr, gt)
+                    print(f"ELO {name:7s}: {elo}")
+            print(f"Matches: {overview['matchCount']}")
     except Exception as e:
         err = str(e)
         if "agent not found" in err.lower() or "revert" in err.lower():
@@ -276,12 +340,11 @@ def cmd_register():
     addr = get_address()
 
     # Parse optional game types from args (default: all)
-    game_types = [GameType.RPS, GameType.POKER, GameType.AUCTION]
-    type_names = ["RPS", "Poker", "Auction"]
+    game_types = list(_GAME_TYPE_ENUM)
+    type_names = list(_GAME_TYPE_NAMES)
     if len(sys.argv) >= 3:
         type_names = [t.strip() for t in sys.argv[2].split(",")]
-        type_map = {"rps": GameType.RPS, "poker": GameType.POKER, "auction": GameType.AUCTION}
-        game_types = [type_map[t.lower()] for t in type_names if t.lower() in type_map]
+        game_types = [_TYPE_MAP[t.lower()] for t in type_names if t.lower() in _TYPE_MAP]
         type_names = [t.capitalize() for t in type_names]
 
     # Check if already registered
@@ -312,32 +375,37 @@ def cmd_register():
 def cmd_find_opponents():
     """List all open agents for a game type (default: RPS), excluding self."""
     # Parse optional game type from args
-    type_map = {"rps": GameType.RPS, "poker": GameType.POKER, "auction": GameType.AUCTION}
     game_type_name = sys.argv[2].lower() if len(sys.argv) >= 3 else "rps"
-    game_type = type_map.get(game_type_name, GameType.RPS)
+    game_type = _TYPE_MAP.get(game_type_name, GameType.RPS)
 
-    addr = get_address()
     agents = get_open_agents(game_type)
 
     # Filter out self
-    opponents = [a for a in agents if a.lower() != addr.lower()]
+    my_lc = get_address_lower()
+    opponents = [a for a in agents if a.lower() != my_lc]
 
     if not opponents:
         print(f"No open opponents found for {game_type_name.upper()}.")
         return
 
     print(f"Found {len(opponents)} {game_type_name.upper()} opponent(s):\n")
+    # One batched eth_call for every opponent's info + ELO
+    try:
+        agent_data = batch_get_agents(opponents, game_type)
+    except Exception:
+        agent_data = {}
+    lines = []
     for opp in opponents:
         try:
-            info = get_agent_info(opp)
-            elo_val = get_elo(opp, game_type)
-            print(f"  {opp}")
-            print(f"    ELO:   {elo_val}")
-            print(f"    Wager: {wei_to_mon(info['minWager']):.6f} - {wei_to_mon(info['maxWager']):.6f} MON")
-            print()
+            info, elo_val = agent_data[opp]
+            if info is None or elo_val is None:
+                raise ValueError("read reverted")
+            lines.append(f"  {opp}\n"
+                         f"    ELO:   {elo_val}\n"
+                         f"    Wager: {wei_to_mon(info['minWager']):.6f} - {wei_to_mon(info['maxWager']):.6f} MON\n\n")
         except Exception:
-            print(f"  {opp}  (info unavailable)")
-            print()
+            lines.append(f"  {opp}  (info unavailable)\n\n")
+    sys.stdout.write("".join(lines))
 
 
 def cmd_challenge():
@@ -394,6 +462,7 @@ def cmd_challenge():
 
     # Step 2: Wait for opponent to accept
     print("\n[2/4] Waiting for opponent to accept...")
+    watcher = ContractEventWatcher(ESCROW_ADDRESS, match_id)
     while True:
         m = get_escrow_match(match_id)
         if m["status"] == MatchStatus.ACTIVE:
@@ -401,10 +470,12 @@ def cmd_challenge():
             break
         if m["status"] == MatchStatus.CANCELLED:
             print("  Match was cancelled.")
+            watcher.stop()
             return
         sys.stdout.write(".")
         sys.stdout.flush()
-        time.sleep(POLL_INTERVAL)
+        watcher.wait(POLL_INTERVAL)
+    watcher.stop()
 
     # Step 3: Create the RPS game
     print("\n[3/4] Creating RPS game...")
@@ -454,7 +525,7 @@ def cmd_accept():
 
     # Wait for game creation or create it ourselves
     print("\n[2/3] Waiting for game creation...")
-    game_id = _wait_for_game_or_create(match_id, rounds)
+    game_id = _wait_for_game_or_create(match_id, rounds, receipt["blockNumber"])
     print(f"  Game ID: {game_id}")
 
     # Play the game
@@ -465,16 +536,16 @@ def cmd_accept():
 def cmd_history():
     """Show match history, win/loss count, win rate, and ELO."""
     addr = get_address()
-    history = get_match_history(addr)
+    # History + ELO in one round trip
+    history, elo_val = get_match_history_and_elo(addr, GameType.RPS)
 
     if not history:
         print("No match history yet.")
         return
 
-    wins = sum(1 for m in history if m[2])  # m[2] = won (bool)
+    wins = sum(m[2] for m in history)  # m[2] = won (bool)
     losses = len(history) - wins
     win_rate = (wins / len(history)) * 100 if history else 0
-    elo_val = get_elo(addr, GameType.RPS)
 
     print(f"Match History ({len(history)} matches)\n")
     print(f"  Wins:     {wins}")
@@ -484,9 +555,9 @@ def cmd_history():
 
     # Show recent matches (most recent first)
     print("Recent matches:")
-    for m in reversed(history[-10:]):
+    for m in islice(reversed(history), 10):
         opponent = m[0]
-        game_type = ["RPS", "Poker", "Auction"][m[1]]
+        game_type = _GAME_TYPE_NAMES[m[1]]
         result = "WIN" if m[2] else "LOSS"
         wager = wei_to_mon(m[3])
         ts = time.strftime("%Y-%m-%d %H:%M", time.localtime(m[4]))
@@ -498,10 +569,10 @@ def cmd_select_match():
     Rank open opponents by expected value (EV).
     Shows win probability, recommended wager, and EV for each.
     """
-    addr = get_address()
     balance = get_balance()
     agents = get_open_agents(GameType.RPS)
-    opponents = [a for a in agents if a.lower() != addr.lower()]
+    my_lc = get_address_lower()
+    opponents = [a for a in agents if a.lower() != my_lc]
 
     if not opponents:
         print("No open opponents found for RPS.")
@@ -510,11 +581,15 @@ def cmd_select_match():
     print(f"Ranking opponents by expected value...\n")
     print(f"  Your balance: {wei_to_mon(balance):.6f} MON\n")
 
+    # One batched eth_call for every opponent's info + ELO
+    agent_data = batch_get_agents(opponents, GameType.RPS)
+
     rankings = []
     for opp in opponents:
         try:
-            info = get_agent_info(opp)
-            elo_val = get_elo(opp, GameType.RPS)
+            info, elo_val = agent_data[opp]
+            if info is None or elo_val is None:
+                raise ValueError("agent read reverted")
             win_prob = estimate_win_prob(opp, _model_store)
             min_w = info["minWager"]
             max_w = info["maxWager"]
@@ -527,6 +602,7 @@ def cmd_select_match():
 
             rankings.append({
                 "addr": opp,
+                "short": f"{opp[:10]}...",
                 "elo": elo_val,
                 "win_prob": win_prob,
                 "wager": wager,
@@ -537,21 +613,23 @@ def cmd_select_match():
             print(f"  {opp[:10]}... — error: {e}")
 
     # Sort by EV descending
-    rankings.sort(key=lambda x: x["ev"], reverse=True)
+    rankings.sort(key=itemgetter("ev"), reverse=True)
 
+    # Build the whole table, then write it in one go
+    lines = []
     for i, r in enumerate(rankings):
         ev_mon = r["ev"] / 10**18
         wager_mon = r["wager"] / 10**18
         marker = " <-- BEST" if i == 0 and r["ev"] > 0 else ""
-        print(f"  #{i+1} {r['addr']}")
-        print(f"      ELO: {r['elo']}  |  Win Prob: {r['win_prob']:.1%}  |  Games Played: {r['games']}")
-        print(f"      Wager: {wager_mon:.6f} MON  |  EV: {ev_mon:+.6f} MON{marker}")
-        print()
+        lines.append(f"  #{i+1} {r['addr']}\n"
+                     f"      ELO: {r['elo']}  |  Win Prob: {r['win_prob']:.1%}  |  Games Played: {r['games']}\n"
+                     f"      Wager: {wager_mon:.6f} MON  |  EV: {ev_mon:+.6f} MON{marker}\n\n")
+    sys.stdout.write("".join(lines))
 
     # Recommend the best
     if rankings and rankings[0]["ev"] > 0:
         best = rankings[0]
-        print(f"Recommendation: Challenge {best['addr'][:10]}... with {wei_to_mon(best['wager']):.6f} MON")
+        print(f"Recommendation: Challenge {best['short']} with {wei_to_mon(best['wager']):.6f} MON")
     elif rankings:
         print("No positive-EV opponents found. Use minimum wager for data gathering.")
 
@@ -606,6 +684,9 @@ def _play_game(game_id: int, opponent_addr: str = None):
     Loads opponent model, uses strategy for each move, updates model after.
     """
     my_addr = get_address()
+    my_addr_lc = get_address_lower()
+    i_am_p1 = None  # resolved on first state read — seats don't change mid-game
+    round_idx = 0  # round we expect to be current, fetched alongside the game
 
     # Load opponent model for strategy use
     model = _model_store.get(opponent_addr) if opponent_addr else None
@@ -614,214 +695,229 @@ def _play_game(game_id: int, opponent_addr: str = None):
     saved_moves = {}
     saved_salts = {}
     saved_strategies = {}  # {round_num: strategy_name} for adaptive learning
+    # Salt for the next commit is drawn ahead of time, off the commit critical path
+    next_salt = generate_salt()
     # Track round results as they happen
     game_round_history = []
 
     # Psychology: timing state persists across rounds within this game
     timing_state = {}
 
-    while True:
-        game = get_game(game_id)
-
-        # Game is settled — show result and update model
-        if game["settled"]:
-            _print_game_result(game, my_addr)
-
-            # Update opponent model with game results
-            if opponent_addr and model is not None:
-                i_am_p1 = game["player1"].lower() == my_addr.lower()
-                my_score = game["p1Score"] if i_am_p1 else game["p2Score"]
-                opp_score = game["p2Score"] if i_am_p1 else game["p1Score"]
-                won = my_score > opp_score
-
-                # Build complete round history from on-chain data
-                full_history = _build_round_history_from_chain(
-                    game_id, game["totalRounds"], i_am_p1
-                )
-                model.update(full_history, won=won,
-                             my_score=my_score, opp_score=opp_score)
-
-                # Record per-round strategy performance for adaptive learning
-                for r_idx, (my_m, opp_m) in enumerate(full_history):
-                    strat = saved_strategies.get(r_idx)
-                    if strat and strat not in ("random", "anti-exploit", "pattern-seed"):
-                        # Determine round result
-                        from lib.strategy import COUNTER
-                        if COUNTER[opp_m] == my_m:
-                            model.record_rps_strategy(strat, "wins")
-                        elif COUNTER[my_m] == opp_m:
-                            model.record_rps_strategy(strat, "losses")
-                        else:
-                            model.record_rps_strategy(strat, "draws")
-
-                # Manage strategy cooldowns: decrement existing, apply new ones
-                for s_name in list(model.strategy_cooldowns.keys()):
-                    model.strategy_cooldowns[s_name] -= 1
-                    if model.strategy_cooldowns[s_name] <= 0:
-                        del model.strategy_cooldowns[s_name]
-                # Cooldown strategies with 3+ losses and 0 wins vs this opponent
-                for s_name, perf in model.strategy_performance.items():
-                    if perf.get("losses", 0) >= 3 and perf.get("wins", 0) == 0:
-                        model.strategy_cooldowns[s_name] = 2
-
-                _model_store.save(opponent_addr)
-                print(f"  Opponent model updated ({model.get_total_games()} games total)")
-
-            # Auto-post match result to Moltbook + MoltX (rate-limited, never fails)
-            try:
-                i_am_p1_mb = game["player1"].lower() == my_addr.lower()
-                s1 = game["p1Score"] if i_am_p1_mb else game["p2Score"]
-                s2 = game["p2Score"] if i_am_p1_mb else game["p1Score"]
-                res = "WIN" if s1 > s2 else ("LOSS" if s2 > s1 else "DRAW")
-                em = get_escrow_match(game["escrowMatchId"])
-                _post_to_social("RPS", opponent_addr or "", res, wei_to_mon(em["wager"]))
-            except Exception:
-                pass  # Never let social errors break gameplay
-
-            # Psychology: check if we should tilt-challenge after a win
-            if opponent_addr and model is not None:
+    # Wake on any RPSGame log for this game instead of sleeping blind
+    watcher = ContractEventWatcher(RPS_GAME_ADDRESS, game_id)
+    backoff = PollBackoff()
+    try:
+        while True:
+            # Game + expected round in one eth_call; the round is re-read
+            # only when the game has moved past the one we guessed
+            game, rd = get_game_with_round(game_id, round_idx)
+            if game["currentRound"] != round_idx:
+                round_idx = game["currentRound"]
+                rd = get_round(game_id, round_idx)
+            if i_am_p1 is None:
+                i_am_p1 = game["player1"].lower() == my_addr_lc
+
+            # Game is settled — show result and update model
+            if game["settled"]:
+                _print_game_result(game, my_addr)
+
+                # Update opponent model with game results
+                if opponent_addr and model is not None:
+                    my_score = game["p1Score"] if i_am_p1 else game["p2Score"]
+                    opp_score = game["p2Score"] if i_am_p1 else game["p1Score"]
+                    won = my_score > opp_score
+
+                    # Build complete round history from on-chain data
+                    full_history = _build_round_history_from_chain(
+                        game_id, game["totalRounds"], i_am_p1
+                    )
+                    model.update(full_history, won=won,
+                                 my_score=my_score, opp_score=opp_score)
+
+                    # Record per-round strategy performance for adaptive learning
+                    for r_idx, (my_m, opp_m) in enumerate(full_history):
+                        strat = saved_strategies.get(r_idx)
+                        if strat and strat not in ("random", "anti-exploit", "pattern-seed"):
+                            # Determine round result
+                            from lib.strategy import COUNTER
+                            if COUNTER[opp_m] == my_m:
+                                model.record_rps_strategy(strat, "wins")
+                            elif COUNTER[my_m] == opp_m:
+                                model.record_rps_strategy(strat, "losses")
+                            else:
+                                model.record_rps_strategy(strat, "draws")
+
+                    # Manage strategy cooldowns: decrement existing, apply new ones
+                    for s_name in list(model.strategy_cooldowns.keys()):
+                        model.strategy_cooldowns[s_name] -= 1
+                        if model.strategy_cooldowns[s_name] <= 0:
+                            del model.strategy_cooldowns[s_name]
+                    # Cooldown strategies with 3+ losses and 0 wins vs this opponent
+                    for s_name, perf in model.strategy_performance.items():
+                        if perf.get("losses", 0) >= 3 and perf.get("wins", 0) == 0:
+                            model.strategy_cooldowns[s_name] = 2
+
+                    _model_store.mark_dirty(opponent_addr)
+                    print(f"  Opponent model updated ({model.get_total_games()} games total)")
+
+                # Auto-post match result to Moltbook + MoltX (rate-limited, never fails)
                 try:
-                    balance = get_balance()
-                    tilt = should_tilt_challenge(opponent_addr, model, balance)
-                    if tilt["recommend"]:
-                        tilt_mon = wei_to_mon(tilt["wager_wei"])
-                        print(f"\n  [TILT] {tilt['reason']}")
-                        print(f"  [TILT] Recommended re-challenge: {tilt_mon:.6f} MON")
+                    s1 = game["p1Score"] if i_am_p1 else game["p2Score"]
+                    s2 = game["p2Score"] if i_am_p1 else game["p1Score"]
+                    res = "WIN" if s1 > s2 else ("LOSS" if s2 > s1 else "DRAW")
+                    em = get_escrow_match(game["escrowMatchId"])
+                    _post_to_social("RPS", opponent_addr or "", res, wei_to_mon(em["wager"]))
                 except Exception:
-                    pass  # Never let psychology errors break gameplay
-            return
+                    pass  # Never let social errors break gameplay
+
+                # Psychology: check if we should tilt-challenge after a win
+                if opponent_addr and model is not None:
+                    try:
+                        balance = get_balance()
+                        tilt = should_tilt_challenge(opponent_addr, model, balance)
+                        if tilt["recommend"]:
+                            tilt_mon = wei_to_mon(tilt["wager_wei"])
+                            print(f"\n  [TILT] {tilt['reason']}")
+                            print(f"  [TILT] Recommended re-challenge: {tilt_mon:.6f} MON")
+                    except Exception:
+                        pass  # Never let psychology errors break gameplay
+                return
 
-        current_round = game["currentRound"]
-        phase = game["phase"]
-        deadline = game["phaseDeadline"]
-        now = int(time.time())
+            current_round = game["currentRound"]
+            phase = game["phase"]
+            deadline = game["phaseDeadline"]
+            now = int(time.time())
 
-        # Check for timeout opportunity
-        if now > deadline and phase != GamePhase.COMPLETE:
-            rd = get_round(game_id, current_round)
-            i_am_p1 = game["player1"].lower() == my_addr.lower()
+            # Unpack the current round once, from our seat's point of view
+            p1_commit, p2_commit = rd["p1Commit"], rd["p2Commit"]
+            p1_revealed, p2_revealed = rd["p1Revealed"], rd["p2Revealed"]
+            if i_am_p1:
+                my_commit, opp_commit, my_revealed, opp_revealed = p1_commit, p2_commit, p1_revealed, p2_revealed
+            else:
+                my_commit, opp_commit, my_revealed, opp_revealed = p2_commit, p1_commit, p2_revealed, p1_revealed
+            my_committed = my_commit != _EMPTY_COMMIT
+            opp_committed = opp_commit != _EMPTY_COMMIT
+
+            # Check for timeout opportunity
+            if now > deadline and phase != GamePhase.COMPLETE:
+                if phase == GamePhase.COMMIT:
+                    if my_committed and not opp_committed:
+                        print(f"  Round {current_round + 1}: Opponent timed out on commit — claiming...")
+                        claim_timeout(game_id)
+                        continue
+                elif phase == GamePhase.REVEAL:
+                    if my_revealed and not opp_revealed:
+                        print(f"  Round {current_round + 1}: Opponent timed out on reveal — claiming...")
+                        claim_timeout(game_id)
+                        continue
+
+            # ── Commit phase — use strategy engine ──
             if phase == GamePhase.COMMIT:
-                my_committed = rd["p1Commit"] != b'\x00' * 32 if i_am_p1 else rd["p2Commit"] != b'\x00' * 32
-                opp_committed = rd["p2Commit"] != b'\x00' * 32 if i_am_p1 else rd["p1Commit"] != b'\x00' * 32
-                if my_committed and not opp_committed:
-                    print(f"  Round {current_round + 1}: Opponent timed out on commit — claiming...")
-                    claim_timeout(game_id)
-                    continue
+                if not my_committed:
+                    # Build round history for strategy
+                    round_history = _build_round_history_from_chain(
+                        game_id, current_round, i_am_p1
+                    )
+
+                    # Use strategy engine to pick move
+                    move_int, strategy_name, confidence = strategy_choose_move(
+                        opponent_addr or "", round_history, model
+                    )
+
+                    # Psychology: check if we should seed a pattern instead
+                    total_rounds = game["totalRounds"]
+                    if should_seed_pattern(current_round, total_rounds):
+                        move_int = get_seeded_move()
+                        strategy_name = "pattern-seed"
+                        confidence = 1.0
+
+                    # Map from strategy.py int to Move enum
+                    move = move_int
+                    salt = next_salt
+                    commit_hash = make_commit_hash(move, salt)
+
+                    # Save for reveal
+                    saved_moves[current_round] = move
+                    saved_salts[current_round] = salt
+                    saved_strategies[current_round] = strategy_name
+
+                    # Psychology: apply timing delay before committing
+                    delay = get_commit_delay(current_round, game["totalRounds"], timing_state)
+                    if delay > 0:
+                        print(f"    [psych] Timing delay: {delay:.1f}s ({timing_state.get('mode', '?')})")
+                        time.sleep(delay)
+
+                    # Show strategy reasoning before committing
+                    print_strategy_reasoning(strategy_name, confidence)
+                    print(f"  Round {current_round + 1}/{game['totalRounds']}: "
+                          f"Committing {MOVE_NAMES[move]}...")
+                    commit_move(game_id, commit_hash)
+                    print(f"    Committed.")
+                    # Refill while we wait for the reveal phase
+                    next_salt = generate_salt()
+
+            # ── Reveal phase ──
             elif phase == GamePhase.REVEAL:
-                my_revealed = rd["p1Revealed"] if i_am_p1 else rd["p2Revealed"]
-                opp_revealed = rd["p2Revealed"] if i_am_p1 else rd["p1Revealed"]
-                if my_revealed and not opp_revealed:
-                    print(f"  Round {current_round + 1}: Opponent timed out on reveal — claiming...")
-                    claim_timeout(game_id)
-                    continue
-
-        # ── Commit phase — use strategy engine ──
-        if phase == GamePhase.COMMIT:
-            rd = get_round(game_id, current_round)
-            i_am_p1 = game["player1"].lower() == my_addr.lower()
-            my_committed = rd["p1Commit"] != b'\x00' * 32 if i_am_p1 else rd["p2Commit"] != b'\x00' * 32
-
-            if not my_committed:
-                # Build round history for strategy
-                round_history = _build_round_history_from_chain(
-                    game_id, current_round, i_am_p1
-                )
-
-                # Use strategy engine to pick move
-                move_int, strategy_name, confidence = strategy_choose_move(
-                    opponent_addr or "", round_history, model
-                )
-
-                # Psychology: check if we should seed a pattern instead
-                total_rounds = game["totalRounds"]
-                if should_seed_pattern(current_round, total_rounds):
-                    move_int = get_seeded_move()
-                    strategy_name = "pattern-seed"
-                    confidence = 1.0
-
-                # Map from strategy.py int to Move enum
-                move = move_int
-                salt = generate_salt()
-                commit_hash = make_commit_hash(move, salt)
-
-                # Save for reveal
-                saved_moves[current_round] = move
-                saved_salts[current_round] = salt
-                saved_strategies[current_round] = strategy_name
-
-                # Psychology: apply timing delay before committing
-                delay = get_commit_delay(current_round, game["totalRounds"], timing_state)
-                if delay > 0:
-                    print(f"    [psych] Timing delay: {delay:.1f}s ({timing_state.get('mode', '?')})")
-                    time.sleep(delay)
-
-                # Show strategy reasoning before committing
-                print_strategy_reasoning(strategy_name, confidence)
-                print(f"  Round {current_round + 1}/{game['totalRounds']}: "
-                      f"Committing {MOVE_NAMES[move]}...")
-                commit_move(game_id, commit_hash)
-                print(f"    Committed.")
-
-        # ── Reveal phase ──
-        elif phase == GamePhase.REVEAL:
-            rd = get_round(game_id, current_round)
-            i_am_p1 = game["player1"].lower() == my_addr.lower()
-            my_revealed = rd["p1Revealed"] if i_am_p1 else rd["p2Revealed"]
-
-            if not my_revealed:
-                move = saved_moves.get(current_round)
-                salt = saved_salts.get(current_round)
-                if move is None or salt is None:
-                    print(f"  Round {current_round + 1}: ERROR — missing saved move/salt for reveal!")
-                    return
-
-                print(f"  Round {current_round + 1}/{game['totalRounds']}: Revealing {MOVE_NAMES[move]}...")
-                reveal_move(game_id, move, salt)
-                print(f"    Revealed.")
-
-        # Wait before polling again
-        time.sleep(POLL_INTERVAL)
+                if not my_revealed:
+                    move = saved_moves.get(current_round)
+                    salt = saved_salts.get(current_round)
+                    if move is None or salt is None:
+                        print(f"  Round {current_round + 1}: ERROR — missing saved move/salt for reveal!")
+                        return
+
+                    print(f"  Round {current_round + 1}/{game['totalRounds']}: Revealing {MOVE_NAMES[move]}...")
+                    reveal_move(game_id, move, salt)
+                    print(f"    Revealed.")
+
+            # Wait for the next game event (adaptive poll without websocket)
+            poll_s = backoff.interval(POLL_INTERVAL, (tuple(game.values()), tuple(rd.values())), deadline)
+            watcher.wait(poll_s, deadline)
+    finally:
+        watcher.stop()
 
 
 def _build_round_history_from_chain(game_id: int, up_to_round: int,
                                      i_am_p1: bool) -> list[tuple[int, int]]:
     """
-    Build round history by querying on-chain getRound() data.
+    Build round history from on-chain getRound() data (one batched eth_call).
     Returns list of (my_move, opp_move) tuples for completed rounds.
     """
     history = []
-    for r in range(up_to_round):
-        try:
-            rd = get_round(game_id, r)
-            p1_move = rd["p1Move"]
-            p2_move = rd["p2Move"]
-            p1_revealed = rd["p1Revealed"]
-            p2_revealed = rd["p2Revealed"]
-
-            if p1_revealed and p2_revealed and p1_move > 0 and p2_move > 0:
-                if i_am_p1:
-                    history.append((p1_move, p2_move))
-                else:
-                    history.append((p2_move, p1_move))
-        except Exception:
+    if up_to_round <= 0:
+        return history
+    try:
+        rounds = batch_get_rounds(game_id, 0, up_to_round)
+    except Exception:
+        return history
+    for rd in rounds:
+        if rd is None:
             continue
+        p1_move = rd["p1Move"]
+        p2_move = rd["p2Move"]
+        p1_revealed = rd["p1Revealed"]
+        p2_revealed = rd["p2Revealed"]
+
+        if p1_revealed and p2_revealed and p1_move > 0 and p2_move > 0:
+            if i_am_p1:
+                history.append((p1_move, p2_move))
+            else:
+                history.append((p2_move, p1_move))
     return history
 
 
-def _wait_for_game_or_create(match_id: int, rounds: int) -> int:
+def _wait_for_game_or_create(match_id: int, rounds: int, from_block: int) -> int:
     """
     Wait up to 10s for the challenger to create the RPS game.
     If they don't, create it ourselves. Returns game_id.
+    from_block: block of our accept tx — the game can't exist before it.
     """
-    start_game_id = get_next_game_id()
     waited = 0
 
     while waited < 10:
-        current_next = get_next_game_id()
-        for gid in range(start_game_id, current_next):
-            g = get_game(gid)
-            if g["escrowMatchId"] == match_id:
-                return gid
+        # One eth_getLogs per tick, filtered on the indexed escrowMatchId
+        gid = find_game_for_match(match_id, from_block)
+        if gid is not None:
+            return gid
         time.sleep(2)
         waited += 2
 
@@ -877,6 +973,7 @@ def cmd_challenge_poker():
 
     # Step 2: Wait for opponent to accept
     print("\n[2/4] Waiting for opponent to accept...")
+    watcher = ContractEventWatcher(ESCROW_ADDRESS, match_id)
     while True:
         m = get_escrow_match(match_id)
         if m["status"] == MatchStatus.ACTIVE:
@@ -884,10 +981,12 @@ def cmd_challenge_poker():
             break
         if m["status"] == MatchStatus.CANCELLED:
             print("  Match was cancelled.")
+            watcher.stop()
             return
         sys.stdout.write(".")
         sys.stdout.flush()
-        time.sleep(POLL_INTERVAL)
+        watcher.wait(POLL_INTERVAL)
+    watcher.stop()
 
     # Step 3: Create the poker game
     print("\n[3/4] Creating Poker game...")
@@ -932,7 +1031,7 @@ def cmd_accept_poker():
 
     # Wait for game creation or create it ourselves
     print("\n[2/3] Waiting for poker game creation...")
-    game_id = _wait_for_poker_game_or_create(match_id)
+    game_id = _wait_for_poker_game_or_create(match_id, receipt["blockNumber"])
     print(f"  Game ID: {game_id}")
 
     # Play the game
@@ -940,20 +1039,19 @@ def cmd_accept_poker():
     _play_poker_game(game_id, opponent, wager_wei)
 
 
-def _wait_for_poker_game_or_create(match_id: int) -> int:
+def _wait_for_poker_game_or_create(match_id: int, from_block: int) -> int:
     """
     Wait up to 10s for the challenger to create the poker game.
     If they don't, create it ourselves. Returns game_id.
+    from_block: block of our accept tx — the game can't exist before it.
     """
-    start_game_id = get_next_poker_game_id()
     waited = 0
 
     while waited < 10:
-        current_next = get_next_poker_game_id()
-        for gid in range(start_game_id, current_next):
-            g = get_poker_game_state(gid)
-            if g["escrowMatchId"] == match_id:
-                return gid
+        # One eth_getLogs per tick, filtered on the indexed escrowMatchId
+        gid = find_poker_game_for_match(match_id, from_block)
+        if gid is not None:
+            return gid
         time.sleep(2)
         waited += 2
 
@@ -963,6 +1061,35 @@ def _wait_for_poker_game_or_create(match_id: int) -> int:
     return parse_poker_game_id_from_receipt(receipt)
 
 
+def _pending_tx_outcome(pending_tx: tuple, mine: tuple) -> str | None:
+    """
+    Settle a (tx_hash, my_progress, sent_at) broadcast without blocking on it.
+
+    Only our own progress (committed/revealed flags, turn, phase) counts as
+    the tx landing — an opponent's move changes the game state too.
+
+    Returns:
+        None while still in flight; "landed" once our progress moved;
+        "mined" when the receipt succeeded but the state read predates it;
+        "reverted"; or "dropped" once TX_DROP_TIMEOUT passed with no receipt
+        and the node no longer knows the tx (a slow one keeps waiting)
+    """
+    tx_hash, sent_mine, sent_at = pending_tx
+    if mine != sent_mine:
+        return "landed"
+    status = get_tx_status(tx_hash)
+    if status == 1:
+        return "mined"
+    if status == 0:
+        return "reverted"
+    if time.monotonic() - sent_at > TX_DROP_TIMEOUT and not is_tx_known(tx_hash):
+        # Gone from the mempool, so its nonce was never used — don't queue the
+        # re-send behind the gap. A tx still pending keeps its nonce and is awaited.
+        resync_nonce()
+        return "dropped"
+    return None
+
+
 def _play_poker_game(game_id: int, opponent_addr: str, wager_wei: int):
     """
     Play a full Budget Poker V2 game (3 rounds, 150-point hand budget).
@@ -970,6 +1097,7 @@ def _play_poker_game(game_id: int, opponent_addr: str, wager_wei: int):
     Uses strategy engine for budget-aware hand selection and betting decisions.
     """
     my_addr = get_address()
+    my_addr_lc = get_address_lower()
 
     # Load opponent model for strategy decisions
     model = _model_store.get(opponent_addr) if opponent_addr else None
@@ -978,155 +1106,174 @@ def _play_poker_game(game_id: int, opponent_addr: str, wager_wei: int):
     # Keys: round number → {hand_value, salt, hand_hash}
     round_data = {}
     last_committed_round = -1  # Track which round we last committed to
+    # Betting decisions: (round, phase, current_bet) → choose_poker_action result
+    decisions = {}
+    # (tx_hash, my_progress, sent_at) of an action broadcast but not yet
+    # reflected on-chain — the state poll confirms it, so we never block on the receipt
+    pending_tx = None
+    last_state = None  # State seen on the previous tick — idle ticks skip the phase logic
+
+    # Wake on any PokerGameV2 log for this game instead of sleeping blind
+    watcher = ContractEventWatcher(POKER_GAME_ADDRESS, game_id)
+    backoff = PollBackoff()
+    try:
+        while True:
+            game = get_poker_game_state(game_id)
+            i_am_p1 = game["player1"].lower() == my_addr_lc
+            # Our/their struct fields, read once per tick
+            me, opp = ("p1", "p2") if i_am_p1 else ("p2", "p1")
+            my_score, opp_score = game[me + "Score"], game[opp + "Score"]
+            my_committed, opp_committed = game[me + "Committed"], game[opp + "Committed"]
+            my_revealed, opp_revealed = game[me + "Revealed"], game[opp + "Revealed"]
+            state = tuple(game.values())
+            my_turn = game["currentTurn"].lower() == my_addr_lc
+            mine = (game["currentRound"], game["phase"], my_committed, my_revealed, my_turn)
+
+            if pending_tx is not None:
+                outcome = _pending_tx_outcome(pending_tx, mine)
+                if outcome is not None:
+                    pending_tx = None
+                if outcome == "mined":
+                    last_state = state  # Read predates our tx — act on the next one
+                elif outcome in ("reverted", "dropped"):
+                    print(f"  [warn] Tx {outcome} — retrying")
+                    last_committed_round = -1
+                    last_state = None  # Force a fresh decision on this tick
+            state_changed = state != last_state
+            last_state = state
+
+            # Game is settled — show result and update model
+            if game["settled"]:
+                _print_poker_result(game, my_addr)
+
+                # Update opponent model with match result
+                if opponent_addr and model is not None:
+                    won = my_score > opp_score
+                    model.update([], won=won, my_score=my_score, opp_score=opp_score)
+
+                    # Profile poker opponent: capture betting aggression
+                    opp_extra = game[opp + "ExtraBets"]
+                    em = get_escrow_match(game["escrowMatchId"])
+                    model.update_poker_stats(
+                        opp_hand=0, opp_extra_bets=opp_extra,
+                        folded=False, won=won, wager=em["wager"],
+                    )
+
+                    _model_store.mark_dirty(opponent_addr)
+                    print(f"  Opponent model updated ({model.get_total_games()} games total)")
+
+                # Auto-post poker match result to social feeds
+                try:
+                    res = "WIN" if my_score > opp_score else ("LOSS" if opp_score > my_score else "DRAW")
+                    _post_to_social("Poker", opponent_addr or "", res, wei_to_mon(wager_wei))
+                except Exception:
+                    pass  # Never let social errors break gameplay
 
-    while True:
-        game = get_poker_game_state(game_id)
-        i_am_p1 = game["player1"].lower() == my_addr.lower()
-
-        # Game is settled — show result and update model
-        if game["settled"]:
-            _print_poker_result(game, my_addr)
-
-            # Update opponent model with match result
-            if opponent_addr and model is not None:
-                my_score = game["p1Score"] if i_am_p1 else game["p2Score"]
-                opp_score = game["p2Score"] if i_am_p1 else game["p1Score"]
-                won = my_score > opp_score
-                model.update([], won=won, my_score=my_score, opp_score=opp_score)
-
-                # Profile poker opponent: capture betting aggression
-                opp_extra = game["p2ExtraBets"] if i_am_p1 else game["p1ExtraBets"]
-                em = get_escrow_match(game["escrowMatchId"])
-                model.update_poker_stats(
-                    opp_hand=0, opp_extra_bets=opp_extra,
-                    folded=False, won=won, wager=em["wager"],
-                )
-
-                _model_store.save(opponent_addr)
-                print(f"  Opponent model updated ({model.get_total_games()} games total)")
-
-            # Auto-post poker match result to social feeds
-            try:
-                my_s = game["p1Score"] if i_am_p1 else game["p2Score"]
-                opp_s = game["p2Score"] if i_am_p1 else game["p1Score"]
-                res = "WIN" if my_s > opp_s else ("LOSS" if opp_s > my_s else "DRAW")
-                _post_to_social("Poker", opponent_addr or "", res, wei_to_mon(wager_wei))
-            except Exception:
-                pass  # Never let social errors break gameplay
-
-            return
+                return
 
-        phase = game["phase"]
-        current_round = game["currentRound"]
-        total_rounds = game["totalRounds"]
-        my_budget = game["p1Budget"] if i_am_p1 else game["p2Budget"]
-        my_score = game["p1Score"] if i_am_p1 else game["p2Score"]
-        opp_score = game["p2Score"] if i_am_p1 else game["p1Score"]
-        now = int(time.time())
-        deadline = game["phaseDeadline"]
-
-        # Check for timeout opportunity
-        if now > deadline and phase != PokerPhase.COMPLETE:
-            if phase == PokerPhase.COMMIT:
-                my_committed = game["p1Committed"] if i_am_p1 else game["p2Committed"]
-                opp_committed = game["p2Committed"] if i_am_p1 else game["p1Committed"]
-                if my_committed and not opp_committed:
-                    print("  Opponent timed out on commit — claiming...")
-                    claim_poker_timeout(game_id)
-                    continue
+            phase = game["phase"]
+            current_round = game["currentRound"]
+            total_rounds = game["totalRounds"]
+            my_budget = game[me + "Budget"]
+            now = int(time.time())
+            deadline = game["phaseDeadline"]
+
+            # Check for timeout opportunity
+            if now > deadline and phase != PokerPhase.COMPLETE:
+                if phase == PokerPhase.COMMIT:
+                    if my_committed and not opp_committed:
+                        print("  Opponent timed out on commit — claiming...")
+                        claim_poker_timeout(game_id)
+                        continue
+                elif phase in (PokerPhase.BETTING_ROUND1, PokerPhase.BETTING_ROUND2):
+                    if not my_turn:
+                        print("  Opponent timed out on betting — claiming...")
+                        claim_poker_timeout(game_id)
+                        continue
+                elif phase == PokerPhase.SHOWDOWN:
+                    if my_revealed and not opp_revealed:
+                        print("  Opponent timed out on reveal — claiming...")
+                        claim_poker_timeout(game_id)
+                        continue
+
+            # ── Commit phase — choose budget-aware hand value for this round ──
+            if pending_tx is not None or not state_changed:
+                pass  # Our last action is still in flight, or nothing new to act on
+
+            elif phase == PokerPhase.COMMIT:
+                if not my_committed and current_round != last_committed_round:
+                    # Generate fresh hand value + salt for this round
+                    hand_value = choose_hand_value(
+                        budget=my_budget,
+                        current_round=current_round,
+                        total_rounds=total_rounds,
+                        my_score=my_score,
+                        opp_score=opp_score,
+                    )
+                    salt = generate_salt()
+                    hand_hash = make_poker_hand_hash(hand_value, salt)
+                    round_data[current_round] = {
+                        "hand_value": hand_value,
+                        "salt": salt,
+                        "hand_hash": hand_hash,
+                    }
+                    last_committed_round = current_round
+
+                    print(f"  Round {current_round + 1}/{total_rounds} — Budget: {my_budget}, Score: {my_score}-{opp_score}")
+                    print(f"  Committing hand (value={hand_value})...")
+                    pending_tx = (commit_poker_hand(game_id, hand_hash, send_only=True), mine, time.monotonic())
+                    print(f"    Commit sent.")
+
+            # ── Betting rounds — use poker strategy ──
             elif phase in (PokerPhase.BETTING_ROUND1, PokerPhase.BETTING_ROUND2):
-                if game["currentTurn"].lower() != my_addr.lower():
-                    print("  Opponent timed out on betting — claiming...")
-                    claim_poker_timeout(game_id)
-                    continue
+                if my_turn:
+                    round_name = _ROUND_NAME[phase]
+                    current_bet = game["currentBet"]
+                    rd = round_data.get(current_round, {})
+                    hand_value = rd.get("hand_value", 50)
+
+                    # Use strategy engine to decide action — once per decision
+                    # point, so a retry after a revert replays the same choice
+                    decision_key = (current_round, phase, current_bet)
+                    if decision_key not in decisions:
+                        decisions[decision_key] = choose_poker_action(
+                            hand_value=hand_value,
+                            phase=_STRATEGY_PHASE[phase],
+                            current_bet=current_bet,
+                            pot=0,  # V2 doesn't track aggregate pot — pass 0
+                            wager=wager_wei,
+                            opponent_addr=opponent_addr,
+                            model=model,
+                        )
+                    action, amount_wei, strategy_name, confidence = decisions[decision_key]
+
+                    action_int = _POKER_ACTION_MAP[action]
+                    send_value = amount_wei if action in ("bet", "raise") else (current_bet if action == "call" else 0)
+
+                    print(f"  {round_name} [{strategy_name} {confidence:.0%}]: {action.upper()}"
+                          + (f" ({wei_to_mon(send_value):.6f} MON)" if send_value > 0 else ""))
+
+                    pending_tx = (poker_take_action(game_id, action_int, send_value, send_only=True), mine, time.monotonic())
+                    print(f"    Action sent.")
+
+            # ── Showdown — reveal our hand for this round ──
             elif phase == PokerPhase.SHOWDOWN:
-                my_revealed = game["p1Revealed"] if i_am_p1 else game["p2Revealed"]
-                opp_revealed = game["p2Revealed"] if i_am_p1 else game["p1Revealed"]
-                if my_revealed and not opp_revealed:
-                    print("  Opponent timed out on reveal — claiming...")
-                    claim_poker_timeout(game_id)
-                    continue
-
-        # ── Commit phase — choose budget-aware hand value for this round ──
-        if phase == PokerPhase.COMMIT:
-            my_committed = game["p1Committed"] if i_am_p1 else game["p2Committed"]
-
-            if not my_committed and current_round != last_committed_round:
-                # Generate fresh hand value + salt for this round
-                hand_value = choose_hand_value(
-                    budget=my_budget,
-                    current_round=current_round,
-                    total_rounds=total_rounds,
-                    my_score=my_score,
-                    opp_score=opp_score,
-                )
-                salt = generate_salt()
-                hand_hash = make_poker_hand_hash(hand_value, salt)
-                round_data[current_round] = {
-                    "hand_value": hand_value,
-                    "salt": salt,
-                    "hand_hash": hand_hash,
-                }
-                last_committed_round = current_round
-
-                print(f"  Round {current_round + 1}/{total_rounds} — Budget: {my_budget}, Score: {my_score}-{opp_score}")
-                print(f"  Committing hand (value={hand_value})...")
-                commit_poker_hand(game_id, hand_hash)
-                print(f"    Committed.")
-
-        # ── Betting rounds — use poker strategy ──
-        elif phase in (PokerPhase.BETTING_ROUND1, PokerPhase.BETTING_ROUND2):
-            if game["currentTurn"].lower() == my_addr.lower():
-                round_name = "Betting 1" if phase == PokerPhase.BETTING_ROUND1 else "Betting 2"
-                current_bet = game["currentBet"]
-                rd = round_data.get(current_round, {})
-                hand_value = rd.get("hand_value", 50)
-
-                # Use strategy engine to decide action
-                action, amount_wei, strategy_name, confidence = choose_poker_action(
-                    hand_value=hand_value,
-                    phase=("round1" if phase == PokerPhase.BETTING_ROUND1 else "round2"),
-                    current_bet=current_bet,
-                    pot=0,  # V2 doesn't track aggregate pot — pass 0
-                    wager=wager_wei,
-                    opponent_addr=opponent_addr,
-                    model=model,
-                )
-
-                # Map string action to PokerAction enum
-                action_map = {
-                    "check": PokerAction.CHECK,
-                    "bet": PokerAction.BET,
-                    "raise": PokerAction.RAISE,
-                    "call": PokerAction.CALL,
-                    "fold": PokerAction.FOLD,
-                }
-                action_int = action_map[action]
-                send_value = amount_wei if action in ("bet", "raise") else (current_bet if action == "call" else 0)
-
-                print(f"  {round_name} [{strategy_name} {confidence:.0%}]: {action.upper()}"
-                      + (f" ({wei_to_mon(send_value):.6f} MON)" if send_value > 0 else ""))
-
-                poker_take_action(game_id, action_int, send_value)
-                print(f"    Action submitted.")
-
-        # ── Showdown — reveal our hand for this round ──
-        elif phase == PokerPhase.SHOWDOWN:
-            my_revealed = game["p1Revealed"] if i_am_p1 else game["p2Revealed"]
-
-            if not my_revealed:
-                rd = round_data.get(current_round, {})
-                hand_value = rd.get("hand_value")
-                salt = rd.get("salt")
-                if hand_value is None or salt is None:
-                    print(f"  ERROR: No saved hand data for round {current_round}. Cannot reveal.")
-                    return
-                print(f"  Revealing hand (value={hand_value})...")
-                reveal_poker_hand(game_id, hand_value, salt)
-                print(f"    Revealed.")
-
-        # Wait before polling again
-        time.sleep(POLL_INTERVAL)
+                if not my_revealed:
+                    rd = round_data.get(current_round, {})
+                    hand_value = rd.get("hand_value")
+                    salt = rd.get("salt")
+                    if hand_value is None or salt is None:
+                        print(f"  ERROR: No saved hand data for round {current_round}. Cannot reveal.")
+                        return
+                    print(f"  Revealing hand (value={hand_value})...")
+                    pending_tx = (reveal_poker_hand(game_id, hand_value, salt, send_only=True), mine, time.monotonic())
+                    print(f"    Reveal sent.")
+
+            # Wait for the next game event (adaptive poll without websocket)
+            poll_s = backoff.interval(POLL_INTERVAL, state, deadline)
+            watcher.wait(poll_s, deadline)
+    finally:
+        watcher.stop()
 
 
 def _print_poker_result(game: dict, my_addr: str):
@@ -1179,6 +1326,7 @@ def cmd_challenge_auction():
 
     # Step 2: Wait for opponent to accept
     print("\n[2/4] Waiting for opponent to accept...")
+    watcher = ContractEventWatcher(ESCROW_ADDRESS, match_id)
     while True:
         m = get_escrow_match(match_id)
         if m["status"] == MatchStatus.ACTIVE:
@@ -1186,10 +1334,12 @@ def cmd_challenge_auction():
             break
         if m["status"] == MatchStatus.CANCELLED:
             print("  Match was cancelled.")
+            watcher.stop()
             return
         sys.stdout.write(".")
         sys.stdout.flush()
-        time.sleep(POLL_INTERVAL)
+        watcher.wait(POLL_INTERVAL)
+    watcher.stop()
 
     # Step 3: Create the auction game
     print("\n[3/4] Creating Auction game...")
@@ -1247,15 +1397,18 @@ def _wait_for_auction_game_or_create(match_id: int) -> int:
     Wait up to 10s for the challenger to create the auction game.
     If they don't, create it ourselves. Returns game_id.
     """
-    start_game_id = get_next_auction_game_id()
+    scanned_to = get_next_auction_game_id()  # games below this were already checked
     waited = 0
 
     while waited < 10:
         current_next = get_next_auction_game_id()
-        for gid in range(start_game_id, current_next):
-            g = get_auction_game_state(gid)
-            if g["escrowMatchId"] == match_id:
-                return gid
+        if current_next > scanned_to:
+            # Every newly created game in one Multicall3 eth_call
+            new_ids = range(scanned_to, current_next)
+            for gid, g in zip(new_ids, batch_get_auction_game_states(new_ids)):
+                if g is not None and g["escrowMatchId"] == match_id:
+                    return gid
+            scanned_to = current_next
         time.sleep(2)
         waited += 2
 
@@ -1271,6 +1424,7 @@ def _play_auction_game(game_id: int, opponent_addr: str, wager_wei: int):
     Uses strategy engine for bid sizing.
     """
     my_addr = get_address()
+    my_addr_lc = get_address_lower()
 
     # Load opponent model for strategy decisions
     model = _model_store.get(opponent_addr) if opponent_addr else None
@@ -1287,90 +1441,107 @@ def _play_auction_game(game_id: int, opponent_addr: str, wager_wei: int):
     bid_pct = (bid_wei / wager_wei * 100) if wager_wei > 0 else 0
     print(f"  Bid: {wei_to_mon(bid_wei):.6f} MON ({bid_pct:.1f}% of wager) [{strategy_name} {confidence:.0%}]")
 
-    while True:
-        game = get_auction_game_state(game_id)
-
-        # Game is settled — show result and update model
-        if game["settled"]:
-            _print_auction_result(game, my_addr)
-
-            # Update opponent model (match result only — no round history
-            # for auctions since bid amounts are not RPS moves and would
-            # corrupt the move_counts/transitions used by the RPS strategy engine)
-            if opponent_addr and model is not None:
-                i_am_p1 = game["player1"].lower() == my_addr.lower()
-                my_bid = game["p1Bid"] if i_am_p1 else game["p2Bid"]
-                opp_bid = game["p2Bid"] if i_am_p1 else game["p1Bid"]
-                won = my_bid > opp_bid
-                model.update([], won=won,
-                             my_score=1 if won else 0,
-                             opp_score=0 if won else 1)
-
-                # Profile auction opponent: capture revealed bid for shade modeling
-                em = get_escrow_match(game["escrowMatchId"])
-                model.update_auction_stats(
-                    opp_bid=opp_bid, wager=em["wager"], won=won,
-                )
-
-                _model_store.save(opponent_addr)
-                print(f"  Opponent model updated ({model.get_total_games()} games total)")
-
-            # Auto-post auction match result to social feeds
-            try:
-                i_am_p1_au = game["player1"].lower() == my_addr.lower()
-                my_b = game["p1Bid"] if i_am_p1_au else game["p2Bid"]
-                opp_b = game["p2Bid"] if i_am_p1_au else game["p1Bid"]
-                res = "WIN" if my_b > opp_b else ("LOSS" if opp_b > my_b else "DRAW")
-                _post_to_social("Auction", opponent_addr or "", res, wei_to_mon(wager_wei))
-            except Exception:
-                pass  # Never let social errors break gameplay
+    # Wake on any AuctionGame log for this game instead of sleeping blind
+    watcher = ContractEventWatcher(AUCTION_GAME_ADDRESS, game_id)
+    # (tx_hash, my_progress, sent_at) of a commit/reveal broadcast but not yet reflected on-chain
+    pending_tx = None
+    last_state = None  # State seen on the previous tick — idle ticks skip the phase logic
+    backoff = PollBackoff()
+    try:
+        while True:
+            game = get_auction_game_state(game_id)
+            i_am_p1 = game["player1"].lower() == my_addr_lc
+            # Our/their struct fields, read once per tick
+            me, opp = ("p1", "p2") if i_am_p1 else ("p2", "p1")
+            my_committed, opp_committed = game[me + "Committed"], game[opp + "Committed"]
+            my_revealed, opp_revealed = game[me + "Revealed"], game[opp + "Revealed"]
+            state = tuple(game.values())
+            mine = (game["phase"], my_committed, my_revealed)
+
+            if pending_tx is not None:
+                outcome = _pending_tx_outcome(pending_tx, mine)
+                if outcome is not None:
+                    pending_tx = None
+                if outcome == "mined":
+                    last_state = state  # Read predates our tx — act on the next one
+                elif outcome in ("reverted", "dropped"):
+                    print(f"  [warn] Tx {outcome} — retrying")
+                    last_state = None  # Force a fresh decision on this tick
+            state_changed = state != last_state
+            last_state = state
+
+            # Game is settled — show result and update model
+            if game["settled"]:
+                _print_auction_result(game, my_addr)
+
+                # Update opponent model (match result only — no round history
+                # for auctions since bid amounts are not RPS moves and would
+                # corrupt the move_counts/transitions used by the RPS strategy engine)
+                if opponent_addr and model is not None:
+                    my_bid, opp_bid = game[me + "Bid"], game[opp + "Bid"]
+                    won = my_bid > opp_bid
+                    model.update([], won=won,
+                                 my_score=1 if won else 0,
+                                 opp_score=0 if won else 1)
+
+                    # Profile auction opponent: capture revealed bid for shade modeling
+                    em = get_escrow_match(game["escrowMatchId"])
+                    model.update_auction_stats(
+                        opp_bid=opp_bid, wager=em["wager"], won=won,
+                    )
+
+                    _model_store.mark_dirty(opponent_addr)
+                    print(f"  Opponent model updated ({model.get_total_games()} games total)")
+
+                # Auto-post auction match result to social feeds
+                try:
+                    my_b, opp_b = game[me + "Bid"], game[opp + "Bid"]
+                    res = "WIN" if my_b > opp_b else ("LOSS" if opp_b > my_b else "DRAW")
+                    _post_to_social("Auction", opponent_addr or "", res, wei_to_mon(wager_wei))
+                except Exception:
+                    pass  # Never let social errors break gameplay
 
-            return
+                return
 
-        phase = game["phase"]
-        now = int(time.time())
-        deadline = game["phaseDeadline"]
-
-        # Check for timeout opportunity
-        if now > deadline and phase != AuctionPhase.COMPLETE:
-            i_am_p1 = game["player1"].lower() == my_addr.lower()
-            if phase == AuctionPhase.COMMIT:
-                my_committed = game["p1Committed"] if i_am_p1 else game["p2Committed"]
-                opp_committed = game["p2Committed"] if i_am_p1 else game["p1Committed"]
-                if my_committed and not opp_committed:
-                    print("  Opponent timed out on commit — claiming...")
-                    claim_auction_timeout(game_id)
-                    continue
+            phase = game["phase"]
+            now = int(time.time())
+            deadline = game["phaseDeadline"]
+
+            # Check for timeout opportunity
+            if now > deadline and phase != AuctionPhase.COMPLETE:
+                if phase == AuctionPhase.COMMIT:
+                    if my_committed and not opp_committed:
+                        print("  Opponent timed out on commit — claiming...")
+                        claim_auction_timeout(game_id)
+                        continue
+                elif phase == AuctionPhase.REVEAL:
+                    if my_revealed and not opp_revealed:
+                        print("  Opponent timed out on reveal — claiming...")
+                        claim_auction_timeout(game_id)
+                        continue
+
+            # ── Commit phase — submit our bid hash ──
+            if pending_tx is not None or not state_changed:
+                pass  # Our last commit/reveal is still in flight, or nothing new to act on
+
+            elif phase == AuctionPhase.COMMIT:
+                if not my_committed:
+                    print(f"  Committing bid...")
+                    pending_tx = (commit_auction_bid(game_id, bid_hash, send_only=True), mine, time.monotonic())
+                    print(f"    Commit sent.")
+
+            # ── Reveal phase — reveal our bid ──
             elif phase == AuctionPhase.REVEAL:
-                my_revealed = game["p1Revealed"] if i_am_p1 else game["p2Revealed"]
-                opp_revealed = game["p2Revealed"] if i_am_p1 else game["p1Revealed"]
-                if my_revealed and not opp_revealed:
-                    print("  Opponent timed out on reveal — claiming...")
-                    claim_auction_timeout(game_id)
-                    continue
-
-        # ── Commit phase — submit our bid hash ──
-        if phase == AuctionPhase.COMMIT:
-            i_am_p1 = game["player1"].lower() == my_addr.lower()
-            my_committed = game["p1Committed"] if i_am_p1 else game["p2Committed"]
-
-            if not my_committed:
-                print(f"  Committing bid...")
-                commit_auction_bid(game_id, bid_hash)
-                print(f"    Committed.")
-
-        # ── Reveal phase — reveal our bid ──
-        elif phase == AuctionPhase.REVEAL:
-            i_am_p1 = game["player1"].lower() == my_addr.lower()
-            my_revealed = game["p1Revealed"] if i_am_p1 else game["p2Revealed"]
+                if not my_revealed:
+                    print(f"  Revealing bid ({wei_to_mon(bid_wei):.6f} MON)...")
+                    pending_tx = (reveal_auction_bid(game_id, bid_wei, salt, send_only=True), mine, time.monotonic())
+                    print(f"    Reveal sent.")
 
-            if not my_revealed:
-                print(f"  Revealing bid ({wei_to_mon(bid_wei):.6f} MON)...")
-                reveal_auction_bid(game_id, bid_wei, salt)
-                print(f"    Revealed.")
-
-        # Wait before polling again
-        time.sleep(POLL_INTERVAL)
+            # Wait for the next game event (adaptive poll without websocket)
+            poll_s = backoff.interval(POLL_INTERVAL, state, deadline)
+            watcher.wait(poll_s, deadline)
+    finally:
+        watcher.stop()
 
 
 def _print_auction_result(game: dict, my_addr: str):
@@ -1414,7 +1585,6 @@ def cmd_tournaments():
             # Show Registration and Active tournaments
             if status in (TournamentStatus.REGISTRATION, TournamentStatus.ACTIVE):
                 found += 1
-                game_type_names = ["RPS", "Poker", "Auction"]
                 print(f"Tournament #{tid}")
                 print(f"  Status:      {status.name}")
                 print(f"  Players:     {t['playerCount']}/{t['maxPlayers']}")
@@ -1507,6 +1677,7 @@ def cmd_play_tournament():
     tid = int(sys.argv[2])
     t = get_tournament_info(tid)
     my_addr = get_address()
+    my_lc = get_address_lower()
 
     if t["status"] != TournamentStatus.ACTIVE:
         print(f"Error: Tournament #{tid} is not Active (status: {TournamentStatus(t['status']).name})")
@@ -1520,7 +1691,7 @@ def cmd_play_tournament():
     my_match = None
     for i in range(match_count):
         m = get_bracket_match(tid, current_round, i)
-        if m["player1"].lower() == my_addr.lower() or m["player2"].lower() == my_addr.lower():
+        if m["player1"].lower() == my_lc or m["player2"].lower() == my_lc:
             if not m["reported"]:
                 my_match_idx = i
                 my_match = m
@@ -1545,7 +1716,7 @@ def cmd_play_tournament():
         game_name = "Auction"
 
     # Determine opponent
-    opponent = my_match["player2"] if my_match["player1"].lower() == my_addr.lower() else my_match["player1"]
+    opponent = my_match["player2"] if my_match["player1"].lower() == my_lc else my_match["player1"]
 
     print(f"Tournament #{tid} — Round {current_round}, Match {my_match_idx}")
     print(f"  Game:     {game_name}")
@@ -1583,7 +1754,7 @@ def cmd_play_tournament():
 
         # Determine winner
         game_state = get_game(game_id)
-        i_am_p1 = game_state["player1"].lower() == my_addr.lower()
+        i_am_p1 = game_state["player1"].lower() == my_lc
         my_score = game_state["p1Score"] if i_am_p1 else game_state["p2Score"]
         opp_score = game_state["p2Score"] if i_am_p1 else game_state["p1Score"]
         winner = my_addr if my_score > opp_score else opponent
@@ -1591,7 +1762,7 @@ def cmd_play_tournament():
         print(f"\n[5/5] Reporting result to tournament...")
         receipt = report_tournament_result(tid, current_round, my_match_idx, escrow_match_id, winner)
         print(f"  TX: {receipt['transactionHash'].hex()}")
-        print(f"  Winner: {'YOU' if winner.lower() == my_addr.lower() else opponent[:10] + '...'}")
+        print(f"  Winner: {'YOU' if winner.lower() == my_lc else opponent[:10] + '...'}")
 
     elif game_name == "Poker":
         print("\n[1/5] Creating escrow match (Poker)...")
@@ -1622,7 +1793,7 @@ def cmd_play_tournament():
 
         # Determine winner from poker game state
         pstate = get_poker_game_state(game_id)
-        i_am_p1 = pstate["player1"].lower() == my_addr.lower()
+        i_am_p1 = pstate["player1"].lower() == my_lc
         my_hand = pstate["p1HandValue"] if i_am_p1 else pstate["p2HandValue"]
         opp_hand = pstate["p2HandValue"] if i_am_p1 else pstate["p1HandValue"]
         winner = my_addr if my_hand > opp_hand else opponent
@@ -1630,7 +1801,7 @@ def cmd_play_tournament():
         print(f"\n[5/5] Reporting result to tournament...")
         receipt = report_tournament_result(tid, current_round, my_match_idx, escrow_match_id, winner)
         print(f"  TX: {receipt['transactionHash'].hex()}")
-        print(f"  Winner: {'YOU' if winner.lower() == my_addr.lower() else opponent[:10] + '...'}")
+        print(f"  Winner: {'YOU' if winner.lower() == my_lc else opponent[:10] + '...'}")
 
     elif game_name == "Auction":
         print("\n[1/5] Creating escrow match (Auction)...")
@@ -1661,7 +1832,7 @@ def cmd_play_tournament():
 
         # Determine winner from auction game state
         astate = get_auction_game_state(game_id)
-        i_am_p1 = astate["player1"].lower() == my_addr.lower()
+        i_am_p1 = astate["player1"].lower() == my_lc
         my_bid = astate["p1Bid"] if i_am_p1 else astate["p2Bid"]
         opp_bid = astate["p2Bid"] if i_am_p1 else astate["p1Bid"]
         winner = my_addr if my_bid > opp_bid else opponent
@@ -1669,7 +1840,7 @@ def cmd_play_tournament():
         print(f"\n[5/5] Reporting result to tournament...")
         receipt = report_tournament_result(tid, current_round, my_match_idx, escrow_match_id, winner)
         print(f"  TX: {receipt['transactionHash'].hex()}")
-        print(f"  Winner: {'YOU' if winner.lower() == my_addr.lower() else opponent[:10] + '...'}")
+        print(f"  Winner: {'YOU' if winner.lower() == my_lc else opponent[:10] + '...'}")
 
     # Check if tournament advanced or completed
     t = get_tournament_info(tid)
@@ -1683,6 +1854,11 @@ def cmd_play_tournament():
         print(f"\nRound {t['currentRound']} — tournament continues.")
 
 
+def _fmt_player(addr: str) -> str:
+    """Short form of a bracket slot address; empty slots show as TBD."""
+    return "TBD" if addr == _ZERO_ADDRESS else f"{addr[:10]}..."
+
+
 def cmd_tournament_status():
     """
     Show full tournament bracket with results per round.
@@ -1715,11 +1891,10 @@ def cmd_tournament_status():
 
     # Show bracket rounds
     if t["status"] in (TournamentStatus.ACTIVE, TournamentStatus.COMPLETE):
-        game_names = {0: "RPS", 1: "Poker", 2: "Auction"}
         total_rounds = t["totalRounds"]
         for rnd in range(total_rounds):
             mc = get_match_count_for_round(tid, rnd)
-            game_name = game_names.get(rnd % 3, "Unknown")
+            game_name = _GAME_TYPE_NAMES[rnd % 3]
             wager = get_round_wager(tid, rnd)
             print(f"\n{'─' * 50}")
             print(f"Round {rnd} — {game_name} (wager: {wei_to_mon(wager):.6f} MON)")
@@ -1727,14 +1902,8 @@ def cmd_tournament_status():
 
             for mi in range(mc):
                 m = get_bracket_match(tid, rnd, mi)
-                p1 = m["player1"][:10] + "..." if m["player1"] != "0x" + "0" * 40 else "TBD"
-                p2 = m["player2"][:10] + "..." if m["player2"] != "0x" + "0" * 40 else "TBD"
-
-                if m["reported"]:
-                    winner_short = m["winner"][:10] + "..."
-                    print(f"  Match {mi}: {p1} vs {p2}  →  Winner: {winner_short}")
-                else:
-                    print(f"  Match {mi}: {p1} vs {p2}  →  Pending")
+                tail = f"  →  Winner: {_fmt_player(m['winner'])}" if m["reported"] else "  →  Pending"
+                print(f"  Match {mi}: {_fmt_player(m['player1'])} vs {_fmt_player(m['player2'])}{tail}")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1784,8 +1953,10 @@ def cmd_bet():
         print("Error: side must be 'yes' or 'no'")
         sys.exit(1)
 
-    # Show current prices before buying
-    prices = get_market_price(market_id)
+    # Market + our balances in one eth_call; pre-trade prices derived from reserves
+    addr = get_address()
+    market, balances = get_market_and_balances(market_id, addr)
+    prices = market_price_from_reserves(market["reserveYES"], market["reserveNO"])
     yes_pct = prices["yesPrice"] / 1e18 * 100
     no_pct = prices["noPrice"] / 1e18 * 100
     print(f"Market #{market_id} prices: YES {yes_pct:.1f}% / NO {no_pct:.1f}%")
@@ -1798,13 +1969,25 @@ def cmd_bet():
 
     print(f"  TX: {receipt['transactionHash'].hex()}")
 
-    # Show updated balances
-    addr = get_address()
-    balances = get_user_market_balances(market_id, addr)
+    # Derive post-trade state from the TokensBought event instead of re-reading.
+    # Assumes no other trade landed between our read and our buy.
+    trade = parse_tokens_bought_from_receipt(receipt)
+    if trade is not None:
+        reserve_yes, reserve_no = market["reserveYES"], market["reserveNO"]
+        if trade["isYES"]:
+            reserve_yes -= trade["tokensOut"]
+            reserve_no += trade["monIn"]
+            balances["yes"] += trade["tokensOut"]
+        else:
+            reserve_no -= trade["tokensOut"]
+            reserve_yes += trade["monIn"]
+            balances["no"] += trade["tokensOut"]
+        prices = market_price_from_reserves(reserve_yes, reserve_no)
+    else:
+        prices, balances = get_market_price_and_balances(market_id, addr)
+
     print(f"  Your balances: YES={balances['yes']}  NO={balances['no']}")
 
-    # Show updated prices
-    prices = get_market_price(market_id)
     yes_pct = prices["yesPrice"] / 1e18 * 100
     no_pct = prices["noPrice"] / 1e18 * 100
     print(f"  New prices:    YES {yes_pct:.1f}% / NO {no_pct:.1f}%")
@@ -1838,8 +2021,7 @@ def cmd_market_status():
     print(f"  Prices:          YES {yes_pct:.1f}% / NO {no_pct:.1f}%")
     print(f"  Resolved:        {market['resolved']}")
     if market["resolved"]:
-        zero_addr = "0x" + "0" * 40
-        if market["winner"] == zero_addr:
+        if market["winner"] == _ZERO_ADDRESS:
             print(f"  Outcome:         DRAW")
         else:
             print(f"  Winner:          {market['winner']}")
@@ -1875,10 +2057,8 @@ def cmd_resolve_market():
         print(f"  Winner: {market['winner']}")
     except Exception as e:
         err = str(e)
-        # Check for draw/no-winner errors — includes hex-encoded revert messages
-        if ("draw" in err.lower() or "not settled" in err.lower()
-                or "address(0)" in err or "winner" in err.lower()
-                or "execution reverted" in err.lower()):
+        # Check for draw/no-winner errors — generic reverts cover hex-encoded messages
+        if _DRAW_REVERT_RE.search(err) or _GENERIC_REVERT_RE.search(err):
             # Try resolving as draw
             print("  No winner found — attempting draw resolution...")
             try:
@@ -2004,8 +2184,7 @@ def cmd_tournament_v2_status():
     print(f"  Prize Pool:  {wei_to_mon(t['prizePool']):.6f} MON")
     print(f"  Creator:     {t['creator']}")
 
-    zero_addr = "0x" + "0" * 40
-    if t["winner"] != zero_addr:
+    if t["winner"] != _ZERO_ADDRESS:
         print(f"  Winner:      {t['winner']}")
 
     # Show participants
@@ -2030,12 +2209,11 @@ def cmd_tournament_v2_status():
         reported = get_rr_matches_reported(tid)
         print(f"\nRound-Robin Matches ({reported}/{total} reported):")
 
-        game_names = {0: "RPS", 1: "Poker", 2: "Auction"}
         for mi in range(total):
             m = get_rr_match(tid, mi)
             p1 = m["player1"][:10] + "..."
             p2 = m["player2"][:10] + "..."
-            game_name = game_names.get(mi % 3, "???")
+            game_name = _GAME_TYPE_NAMES[mi % 3]
 
             if m["reported"]:
                 winner_short = m["winner"][:10] + "..."
@@ -2051,23 +2229,25 @@ def cmd_pump_targets():
     """
     addr = get_address()
     agents = get_open_agents(GameType.RPS)
-    opponents = [a for a in agents if a.lower() != addr.lower()]
+    my_lc = get_address_lower()
+    opponents = [a for a in agents if a.lower() != my_lc]
 
     if not opponents:
         print("No open opponents found for RPS.")
         return
 
-    our_elo = get_elo(addr, GameType.RPS)
+    # Our ELO + every opponent's in one batched eth_call
+    our_elo, *opp_elos = get_elos_bulk([addr] + opponents, GameType.RPS)
+    if our_elo is None:
+        our_elo = get_elo(addr, GameType.RPS)
     print(f"Your ELO: {our_elo}\n")
 
-    # Build agent list with ELO data
-    agents_data = []
-    for opp in opponents:
-        try:
-            elo_val = get_elo(opp, GameType.RPS)
-            agents_data.append({"addr": opp, "elo": elo_val})
-        except Exception:
-            continue
+    # Build agent list with ELO data (skip reads that reverted)
+    agents_data = [
+        {"addr": opp, "elo": elo_val}
+        for opp, elo_val in zip(opponents, opp_elos)
+        if elo_val is not None
+    ]
 
     targets = get_elo_pumping_targets(agents_data, our_elo)
 
@@ -2236,55 +2416,73 @@ def cmd_moltx_link_wallet():
 # Main
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Static command table — built once at import
+COMMANDS = {
+    "status": cmd_status,
+    "register": cmd_register,
+    "find-opponents": cmd_find_opponents,
+    "challenge": cmd_challenge,
+    "accept": cmd_accept,
+    "challenge-poker": cmd_challenge_poker,
+    "accept-poker": cmd_accept_poker,
+    "challenge-auction": cmd_challenge_auction,
+    "accept-auction": cmd_accept_auction,
+    "history": cmd_history,
+    "select-match": cmd_select_match,
+    "recommend": cmd_recommend,
+    # Tournament commands
+    "tournaments": cmd_tournaments,
+    "create-tournament": cmd_create_tournament,
+    "join-tournament": cmd_join_tournament,
+    "play-tournament": cmd_play_tournament,
+    "tournament-status": cmd_tournament_status,
+    # Prediction Market commands
+    "create-market": cmd_create_market,
+    "bet": cmd_bet,
+    "market-status": cmd_market_status,
+    "resolve-market": cmd_resolve_market,
+    "redeem": cmd_redeem,
+    # TournamentV2 commands
+    "create-round-robin": cmd_create_round_robin,
+    "create-double-elim": cmd_create_double_elim,
+    "tournament-v2-status": cmd_tournament_v2_status,
+    "tournament-v2-register": cmd_tournament_v2_register,
+    # Psychology commands
+    "pump-targets": cmd_pump_targets,
+    # Social commands (Moltbook + MoltX)
+    "social-register": cmd_social_register,
+    "social-status": cmd_social_status,
+    "moltbook-post": cmd_moltbook_post,
+    "moltx-post": cmd_moltx_post,
+    "moltx-link-wallet": cmd_moltx_link_wallet,
+}
+
+
 def main():
+    global POLL_INTERVAL
+    # Global option, accepted anywhere on the command line
+    if "--poll-interval" in sys.argv:
+        idx = sys.argv.index("--poll-interval")
+        try:
+            interval = float(sys.argv[idx + 1])
+        except (IndexError, ValueError):
+            interval = None
+        # Zero busy-polls and a negative value makes time.sleep() raise
+        if interval is None or not 0 < interval < float("inf"):
+            print("Error: --poll-interval requires a positive number of seconds")
+            sys.exit(1)
+        POLL_INTERVAL = interval
+        del sys.argv[idx:idx + 2]
+
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
 
     command = sys.argv[1]
 
-    commands = {
-        "status": cmd_status,
-        "register": cmd_register,
-        "find-opponents": cmd_find_opponents,
-        "challenge": cmd_challenge,
-        "accept": cmd_accept,
-        "challenge-poker": cmd_challenge_poker,
-        "accept-poker": cmd_accept_poker,
-        "challenge-auction": cmd_challenge_auction,
-        "accept-auction": cmd_accept_auction,
-        "history": cmd_history,
-        "select-match": cmd_select_match,
-        "recommend": cmd_recommend,
-        # Tournament commands
-        "tournaments": cmd_tournaments,
-        "create-tournament": cmd_create_tournament,
-        "join-tournament": cmd_join_tournament,
-        "play-tournament": cmd_play_tournament,
-        "tournament-status": cmd_tournament_status,
-        # Prediction Market commands
-        "create-market": cmd_create_market,
-        "bet": cmd_bet,
-        "market-status": cmd_market_status,
-        "resolve-market": cmd_resolve_market,
-        "redeem": cmd_redeem,
-        # TournamentV2 commands
-        "create-round-robin": cmd_create_round_robin,
-        "create-double-elim": cmd_create_double_elim,
-        "tournament-v2-status": cmd_tournament_v2_status,
-        "tournament-v2-register": cmd_tournament_v2_register,
-        # Psychology commands
-        "pump-targets": cmd_pump_targets,
-        # Social commands (Moltbook + MoltX)
-        "social-register": cmd_social_register,
-        "social-status": cmd_social_status,
-        "moltbook-post": cmd_moltbook_post,
-        "moltx-post": cmd_moltx_post,
-        "moltx-link-wallet": cmd_moltx_link_wallet,
-    }
-
-    if command in commands:
-        commands[command]()
+    handler = COMMANDS.get(command)
+    if handler is not None:
+        handler()
     else:
         print(f"Unknown command: {command}")
         print(__doc__)
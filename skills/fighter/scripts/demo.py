@@ -1,164 +1,278 @@
-#!/usr/bin/env python3.13
-"""
-demo.py — Scripted showcase of the Gaming Arena Fighter Agent.
-
-Runs a 3-5 minute demo sequence that demonstrates:
-1. Agent status and registration
-2. Opponent discovery and EV ranking
-3. RPS strategy display
-4. Prediction market creation and status
-5. TournamentV2 display
-6. Psychology module (pump targets)
-7. Final stats summary
-
-Usage: python3.13 skills/fighter/scripts/demo.py
-"""
-import subprocess
-import sys
-import time
-
-# ─── Config ──────────────────────────────────────────────────────────────────
-
-ARENA = "skills/fighter/scripts/arena.py"
-PYTHON = "python3.13"
-
-# Delay between demo steps (seconds) — controls pacing
-STEP_DELAY = 2
-SECTION_DELAY = 4
-
-
-def run_cmd(args: list[str], label: str = None):
-    """Run a command and print its output with optional label."""
-    if label:
-        print(f"\n{'─' * 60}")
-        print(f"  {label}")
-        print(f"{'─' * 60}\n")
-        time.sleep(1)
-
-    cmd = [PYTHON] + args
-    print(f"$ {' '.join(cmd)}\n")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        # Only show stderr if it's not empty/whitespace
-        err = result.stderr.strip()
-        if err:
-            print(f"[stderr] {err}")
-
-    time.sleep(STEP_DELAY)
-    return result
-
-
-def narrate(text: str):
-    """Print narration text with visual separator."""
-    print(f"\n{'═' * 60}")
-    print(f"  {text}")
-    print(f"{'═' * 60}")
-    time.sleep(SECTION_DELAY)
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# Demo Sequence
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def main():
-    print()
-    print("=" * 60)
-    print("  MOLTEEE — Gaming Arena Agent Demo")
-    print("  Autonomous AI Agent on Monad")
-    print("=" * 60)
-    time.sleep(SECTION_DELAY)
-
-    # ── Step 1: Agent Status ──
-    narrate("Step 1: Check Agent Status")
-    print("The fighter agent checks its wallet balance, registration,")
-    print("and ELO ratings across all game types.\n")
-    run_cmd([ARENA, "status"], "arena.py status")
-
-    # ── Step 2: Find Opponents ──
-    narrate("Step 2: Discover Opponents")
-    print("The agent scans the on-chain AgentRegistry for open opponents.")
-    print("It queries each game type to find potential challengers.\n")
-    run_cmd([ARENA, "find-opponents"], "arena.py find-opponents")
-    run_cmd([ARENA, "find-opponents", "poker"], "arena.py find-opponents poker")
-
-    # ── Step 3: EV Ranking ──
-    narrate("Step 3: Rank Opponents by Expected Value")
-    print("The strategy engine evaluates each opponent using:")
-    print("  - Historical win rate from persistent opponent models")
-    print("  - Kelly criterion for optimal wager sizing")
-    print("  - Expected value (EV) calculation per matchup\n")
-    run_cmd([ARENA, "select-match"], "arena.py select-match")
-
-    # ── Step 4: Wager Recommendation ──
-    narrate("Step 4: Kelly Criterion Wager Sizing")
-    print("For the best opponent, the agent calculates the exact wager")
-    print("using the Kelly criterion — balancing edge vs. bankroll risk.\n")
-    # We'll try recommend on a known address; if none exist, skip gracefully
-    result = run_cmd([ARENA, "find-opponents"], None)
-    # Extract first opponent address from output if available
-    lines = (result.stdout or "").split("\n")
-    opp_addr = None
-    for line in lines:
-        line = line.strip()
-        if line.startswith("0x") and len(line) >= 42:
-            opp_addr = line[:42]
-            break
-
-    if opp_addr:
-        run_cmd([ARENA, "recommend", opp_addr], "arena.py recommend <opponent>")
-    else:
-        print("  (No opponents available for wager recommendation demo)")
-
-    # ── Step 5: Match History ──
-    narrate("Step 5: Match History & Win Rate")
-    print("The agent reviews its past performance — wins, losses,")
-    print("win rate, and ELO progression over time.\n")
-    run_cmd([ARENA, "history"], "arena.py history")
-
-    # ── Step 6: Prediction Market ──
-    narrate("Step 6: Prediction Markets")
-    print("The PredictionMarket contract enables betting on match outcomes.")
-    print("Uses a constant-product AMM (like Uniswap) for YES/NO tokens.\n")
-    # Show market status if any exist
-    run_cmd([ARENA, "market-status", "0"], "arena.py market-status 0")
-
-    # ── Step 7: TournamentV2 ──
-    narrate("Step 7: Tournament System")
-    print("TournamentV2 supports two formats:")
-    print("  - Round-Robin: every player plays every other player")
-    print("  - Double-Elimination: eliminated after 2 losses\n")
-    run_cmd([ARENA, "tournaments"], "arena.py tournaments")
-
-    # ── Step 8: Psychology Module ──
-    narrate("Step 8: Psychology & ELO Pumping")
-    print("The psychology module adds tactical edges:")
-    print("  - Commit timing delays (fast/slow/erratic/escalating)")
-    print("  - Pattern seeding + exploitation")
-    print("  - Tilt challenge recommendations after wins")
-    print("  - ELO pumping target identification\n")
-    run_cmd([ARENA, "pump-targets"], "arena.py pump-targets")
-
-    # ── Final Summary ──
-    narrate("Demo Complete!")
-    print("Molteee demonstrates a fully autonomous gaming agent that:")
-    print()
-    print("  1. Discovers and evaluates opponents on-chain")
-    print("  2. Plays 3 game types with adaptive strategy engines")
-    print("  3. Manages bankroll using Kelly criterion")
-    print("  4. Builds persistent opponent models")
-    print("  5. Creates and trades on prediction markets")
-    print("  6. Competes in round-robin & double-elim tournaments")
-    print("  7. Uses psychological tactics for competitive edge")
-    print("  8. Posts results to ERC-8004 reputation registry")
-    print()
-    print("All gameplay settled on Monad (chain 143).")
-    print("Built for the Moltiverse Hackathon — Gaming Arena Agent Bounty")
-    print()
-    print("=" * 60)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3.13
+"""
+demo.py — Scripted showcase of the Gaming Arena Fighter Agent.
+
+Runs a 3-5 minute demo sequence that demonstrates:
+1. Agent status and registration
+2. Opponent discovery and EV ranking
+3. RPS strategy display
+4. Prediction market creation and status
+5. TournamentV2 display
+6. Psychology module (pump targets)
+7. Final stats summary
+
+Usage: python3.13 skills/fighter/scripts/demo.py
+"""
+import io
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+# ─── Config ──────────────────────────────────────────────────────────────────
+
+ARENA = "skills/fighter/scripts/arena.py"
+PYTHON = "python3.13"
+
+# Delay between demo steps (seconds) — controls pacing
+STEP_DELAY = 2
+SECTION_DELAY = 4
+
+# First wallet address in a command's output (find-opponents lists one per entry)
+_ADDR_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+# Import arena once and call its CLI in-process — saves an interpreter start
+# plus the web3 import for every step. Falls back to subprocesses if the
+# import fails (e.g. demo run with a different interpreter than its deps).
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+try:
+    import arena
+except Exception:
+    arena = None
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """
+    sys.stdout/sys.stderr stand-in: writes from a thread that set a capture
+    buffer go to that buffer, everything else to the real stream. Lets
+    background steps capture their output while narration keeps printing.
+    """
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def capture(self, buf):
+        self._local.buf = buf
+
+    def _target(self):
+        buf = getattr(self._local, "buf", None)
+        return buf if buf is not None else self._real
+
+    def write(self, s):
+        return self._target().write(s)
+
+    def flush(self):
+        self._target().flush()
+
+
+if arena is not None:
+    sys.stdout = _ThreadLocalStream(sys.stdout)
+    sys.stderr = _ThreadLocalStream(sys.stderr)
+
+
+# arena.main() reads its command from the process-global sys.argv, so
+# in-process runs (prefetch worker and main thread alike) take turns
+_in_process_lock = threading.Lock()
+
+
+def _run_in_process(args: list[str]) -> subprocess.CompletedProcess:
+    """Run `arena.py <subcmd> ...` via arena.main(), capturing output like subprocess.run."""
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    with _in_process_lock:
+        sys.stdout.capture(out)
+        sys.stderr.capture(err)
+        saved_argv = sys.argv
+        sys.argv = list(args)
+        try:
+            arena.main()
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                err.write(f"{e.code}\n")  # sys.exit("msg") prints msg, exits 1
+                code = 1
+        except Exception:
+            err.write(traceback.format_exc())
+            code = 1
+        finally:
+            sys.argv = saved_argv
+            sys.stdout.capture(None)
+            sys.stderr.capture(None)
+    return subprocess.CompletedProcess(args, code, out.getvalue(), err.getvalue())
+
+
+def _execute(args: list[str]) -> subprocess.CompletedProcess:
+    """Run one demo command, in-process when arena imported cleanly."""
+    if arena is not None and args[0] == ARENA:
+        return _run_in_process(args)
+    return subprocess.run([PYTHON] + args, capture_output=True, text=True)
+
+
+# Read-only steps started up front: command tuple → Future[CompletedProcess]
+_prefetched = {}
+
+
+def prefetch(commands: list[list[str]]):
+    """
+    Start independent read-only steps in the background so their RPC time
+    overlaps the narration pauses; run_cmd() then prints them in order.
+    """
+    # In-process steps take turns on sys.argv (_in_process_lock), so one
+    # worker is enough; separate interpreters can fan out
+    workers = 1 if arena is not None else 4
+    executor = ThreadPoolExecutor(max_workers=workers)
+    for args in commands:
+        _prefetched[tuple(args)] = executor.submit(_execute, args)
+    executor.shutdown(wait=False)
+
+
+def run_cmd(args: list[str], label: str = None):
+    """Run a command and print its output with optional label."""
+    if label:
+        print(f"\n{'─' * 60}")
+        print(f"  {label}")
+        print(f"{'─' * 60}\n")
+        time.sleep(1)
+
+    cmd = [PYTHON] + args
+    print(f"$ {' '.join(cmd)}\n")
+    future = _prefetched.get(tuple(args))
+    result = future.result() if future is not None else _execute(args)
+
+    if result.stdout:
+        print(result.stdout)
+    if result.stderr:
+        # Only show stderr if it's not empty/whitespace
+        err = result.stderr.strip()
+        if err:
+            print(f"[stderr] {err}")
+
+    time.sleep(STEP_DELAY)
+    return result
+
+
+def narrate(text: str):
+    """Print narration text with visual separator."""
+    print(f"\n{'═' * 60}")
+    print(f"  {text}")
+    print(f"{'═' * 60}")
+    time.sleep(SECTION_DELAY)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Demo Sequence
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    print()
+    print("=" * 60)
+    print("  MOLTEEE — Gaming Arena Agent Demo")
+    print("  Autonomous AI Agent on Monad")
+    print("=" * 60)
+
+    # Every step below except `recommend` is an independent read — start them
+    # now, in display order, and let them finish during the narration
+    prefetch([
+        [ARENA, "status"],
+        [ARENA, "find-opponents"],
+        [ARENA, "find-opponents", "poker"],
+        [ARENA, "select-match"],
+        [ARENA, "history"],
+        [ARENA, "market-status", "0"],
+        [ARENA, "tournaments"],
+        [ARENA, "pump-targets"],
+    ])
+    time.sleep(SECTION_DELAY)
+
+    # ── Step 1: Agent Status ──
+    narrate("Step 1: Check Agent Status")
+    print("The fighter agent checks its wallet balance, registration,")
+    print("and ELO ratings across all game types.\n")
+    run_cmd([ARENA, "status"], "arena.py status")
+
+    # ── Step 2: Find Opponents ──
+    narrate("Step 2: Discover Opponents")
+    print("The agent scans the on-chain AgentRegistry for open opponents.")
+    print("It queries each game type to find potential challengers.\n")
+    run_cmd([ARENA, "find-opponents"], "arena.py find-opponents")
+    run_cmd([ARENA, "find-opponents", "poker"], "arena.py find-opponents poker")
+
+    # ── Step 3: EV Ranking ──
+    narrate("Step 3: Rank Opponents by Expected Value")
+    print("The strategy engine evaluates each opponent using:")
+    print("  - Historical win rate from persistent opponent models")
+    print("  - Kelly criterion for optimal wager sizing")
+    print("  - Expected value (EV) calculation per matchup\n")
+    run_cmd([ARENA, "select-match"], "arena.py select-match")
+
+    # ── Step 4: Wager Recommendation ──
+    narrate("Step 4: Kelly Criterion Wager Sizing")
+    print("For the best opponent, the agent calculates the exact wager")
+    print("using the Kelly criterion — balancing edge vs. bankroll risk.\n")
+    # We'll try recommend on a known address; if none exist, skip gracefully
+    result = run_cmd([ARENA, "find-opponents"], None)
+    # Extract first opponent address from output if available
+    m = _ADDR_RE.search(result.stdout or "")
+    opp_addr = m.group(0) if m else None
+
+    if opp_addr:
+        run_cmd([ARENA, "recommend", opp_addr], "arena.py recommend <opponent>")
+    else:
+        print("  (No opponents available for wager recommendation demo)")
+
+    # ── Step 5: Match History ──
+    narrate("Step 5: Match History & Win Rate")
+    print("The agent reviews its past performance — wins, losses,")
+    print("win rate, and ELO progression over time.\n")
+    run_cmd([ARENA, "history"], "arena.py history")
+
+    # ── Step 6: Prediction Market ──
+    narrate("Step 6: Prediction Markets")
+    print("The PredictionMarket contract enables betting on match outcomes.")
+    print("Uses a constant-product AMM (like Uniswap) for YES/NO tokens.\n")
+    # Show market status if any exist
+    run_cmd([ARENA, "market-status", "0"], "arena.py market-status 0")
+
+    # ── Step 7: TournamentV2 ──
+    narrate("Step 7: Tournament System")
+    print("TournamentV2 supports two formats:")
+    print("  - Round-Robin: every player plays every other player")
+    print("  - Double-Elimination: eliminated after 2 losses\n")
+    run_cmd([ARENA, "tournaments"], "arena.py tournaments")
+
+    # ── Step 8: Psychology Module ──
+    narrate("Step 8: Psychology & ELO Pumping")
+    print("The psychology module adds tactical edges:")
+    print("  - Commit timing delays (fast/slow/erratic/escalating)")
+    print("  - Pattern seeding + exploitation")
+    print("  - Tilt challenge recommendations after wins")
+    print("  - ELO pumping target identification\n")
+    run_cmd([ARENA, "pump-targets"], "arena.py pump-targets")
+
+    # ── Final Summary ──
+    narrate("Demo Complete!")
+    print("Molteee demonstrates a fully autonomous gaming agent that:")
+    print()
+    print("  1. Discovers and evaluates opponents on-chain")
+    print("  2. Plays 3 game types with adaptive strategy engines")
+    print("  3. Manages bankroll using Kelly criterion")
+    print("  4. Builds persistent opponent models")
+    print("  5. Creates and trades on prediction markets")
+    print("  6. Competes in round-robin & double-elim tournaments")
+    print("  7. Uses psychological tactics for competitive edge")
+    print("  8. Posts results to ERC-8004 reputation registry")
+    print()
+    print("All gameplay settled on Monad (chain 143).")
+    print("Built for the Moltiverse Hackathon — Gaming Arena Agent Bounty")
+    print()
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
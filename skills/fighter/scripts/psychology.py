@@ -10,11 +10,17 @@ Provides four tactical functions:
 
 These are integrated into arena.py's game loop for RPS matches.
 """
+import bisect
 import json
 import random
 import time
 from pathlib import Path
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # ─── Config loading ──────────────────────────────────────────────────────────
 # Load timing/seeding config from JSON file; fall back to defaults if missing
 
@@ -46,10 +52,10 @@ _DEFAULT_CONFIG = {
 
 def _load_config() -> dict:
     """Load psychology config from JSON file, merging with defaults."""
-    config = dict(_DEFAULT_CONFIG)
+    # Copy each section too — updating a shallow copy would edit the defaults
+    config = {section: dict(values) for section, values in _DEFAULT_CONFIG.items()}
     try:
-        with open(_CONFIG_PATH) as f:
-            file_config = json.load(f)
+        file_config = _json_loads(_CONFIG_PATH.read_bytes())
         # Merge top-level keys
         for section in config:
             if section in file_config and isinstance(file_config[section], dict):
@@ -59,8 +65,17 @@ def _load_config() -> dict:
     return config
 
 
-# Module-level config loaded once at import time
-_config = _load_config()
+# Loaded on first use, then shared for the life of the process — CLI
+# commands that never touch psychology skip the file read entirely
+_config = None
+
+
+def _get_config() -> dict:
+    """Return the merged psychology config, loading it on first call."""
+    global _config
+    if _config is None:
+        _config = _load_config()
+    return _config
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -71,52 +86,58 @@ _config = _load_config()
 TIMING_MODES = ("fast", "slow", "erratic", "escalating")
 
 
+def _sample_delays(mode: str, n: int, tc: dict) -> list[float]:
+    """Draw the commit delays for rounds 0..n-1 under a timing mode."""
+    if mode == "fast":
+        # Constant short delay — pressure the opponent
+        return [tc["fast_delay"]] * n
+    if mode == "slow":
+        # Constant long delay — make opponent anxious / second-guess
+        lo, hi = tc["slow_delay_min"], tc["slow_delay_max"]
+        return [random.uniform(lo, hi) for _ in range(n)]
+    if mode == "erratic":
+        # Random delay each round — unpredictable rhythm
+        lo, hi = tc["erratic_delay_min"], tc["erratic_delay_max"]
+        return [random.uniform(lo, hi) for _ in range(n)]
+    if mode == "escalating":
+        # Start fast, get progressively slower each round
+        base, increment = tc["escalating_base"], tc["escalating_increment"]
+        return [base + i * increment for i in range(n)]
+    # Fallback — should not reach here
+    return [1.0] * n
+
+
 def get_commit_delay(round_num: int, total_rounds: int, state: dict) -> float:
     """
     Calculate how many seconds to wait before committing a move.
 
     The delay varies by timing mode to disrupt the opponent's ability to
-    read our tempo. Mode is auto-selected per game and stored in `state`.
+    read our tempo. Mode is auto-selected per game and stored in `state`,
+    along with every round's delay, drawn once when the mode is picked.
 
     Args:
         round_num:    Current round number (0-indexed)
         total_rounds: Total rounds in the game
         state:        Mutable dict for tracking timing state across rounds.
-                      Keys used: "mode" (str), "round_count" (int)
+                      Keys used: "mode" (str), "round_count" (int),
+                      "_delays" (list of per-round delays)
 
     Returns:
         Seconds to sleep before committing
     """
-    tc = _config["timing"]
-
     # Pick a mode once per game (stored in state)
     if "mode" not in state:
         state["mode"] = random.choice(TIMING_MODES)
         state["round_count"] = 0
 
-    mode = state["mode"]
     state["round_count"] = round_num
-
-    if mode == "fast":
-        # Constant short delay — pressure the opponent
-        return tc["fast_delay"]
-
-    elif mode == "slow":
-        # Constant long delay — make opponent anxious / second-guess
-        return random.uniform(tc["slow_delay_min"], tc["slow_delay_max"])
-
-    elif mode == "erratic":
-        # Random delay each round — unpredictable rhythm
-        return random.uniform(tc["erratic_delay_min"], tc["erratic_delay_max"])
-
-    elif mode == "escalating":
-        # Start fast, get progressively slower each round
-        base = tc["escalating_base"]
-        increment = tc["escalating_increment"]
-        return base + (round_num * increment)
-
-    # Fallback — should not reach here
-    return 1.0
+    delays = state.get("_delays")
+    if delays is None or round_num >= len(delays):
+        # First call this game (or more rounds than planned) — sample the schedule
+        delays = state["_delays"] = _sample_delays(
+            state["mode"], max(total_rounds, round_num + 1), _get_config()["timing"]
+        )
+    return delays[round_num]
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -143,7 +164,7 @@ def should_seed_pattern(round_num: int, total_rounds: int) -> bool:
     Returns:
         True if we should seed, False if we should exploit
     """
-    seed_fraction = _config["seeding"]["seed_fraction"]
+    seed_fraction = _get_config()["seeding"]["seed_fraction"]
     seed_cutoff = int(total_rounds * seed_fraction)
     # Always seed at least the first round in games with >= 3 rounds
     seed_cutoff = max(seed_cutoff, 1) if total_rounds >= 3 else 0
@@ -157,7 +178,7 @@ def get_seeded_move() -> int:
     We consistently play the configured seed move (default: Rock) so the
     opponent sees an obvious pattern and adjusts their strategy to counter it.
     """
-    return _config["seeding"]["seed_move"]
+    return _get_config()["seeding"]["seed_move"]
 
 
 def get_exploitation_move(model) -> int:
@@ -181,14 +202,11 @@ def get_exploitation_move(model) -> int:
 
     # If we have model data, check what the opponent actually plays after our seed
     if model is not None:
-        history = model.get_all_round_history()
-        # Look at rounds where we played the seed move
-        opp_responses = [opp for my, opp in history if my == seed_move]
-        if len(opp_responses) >= 2:
+        # Opponent's responses in rounds where we played the seed move
+        counts = model.get_response_freq(seed_move)
+        if counts[1] + counts[2] + counts[3] >= 2:
             # Find opponent's most common response to our seed move
-            from collections import Counter
-            freq = Counter(opp_responses)
-            predicted_opp_move = freq.most_common(1)[0][0]
+            predicted_opp_move = max((1, 2, 3), key=counts.__getitem__)
             return COUNTER[predicted_opp_move]
 
     # No model data — assume rational opponent counters our seed
@@ -201,6 +219,9 @@ def get_exploitation_move(model) -> int:
 # 3. Tilt Challenge Recommendation
 # ═══════════════════════════════════════════════════════════════════════════════
 
+_MIN_MEANINGFUL_WEI = 10**15  # 0.001 MON — smaller tilt wagers aren't worth a challenge
+_BPS = 10000  # Wager fractions are applied to wei balances in basis points (integer math)
+
 def should_tilt_challenge(
     opponent_addr: str,
     model,
@@ -223,30 +244,32 @@ def should_tilt_challenge(
         - wager_wei (int): Recommended wager for the tilt challenge
         - reason (str): Human-readable explanation
     """
-    tc = _config["tilt"]
+    tc = _get_config()["tilt"]
     multiplier = tc["wager_multiplier"]
     max_fraction = tc["max_bankroll_fraction"]
 
     # Need model data to evaluate
-    if model is None or model.get_total_games() < 1:
+    results = model.match_results if model is not None else None
+    if not results:
         return {
             "recommend": False,
             "wager_wei": 0,
             "reason": "No model data — cannot evaluate tilt opportunity",
         }
 
-    # Check our win rate against this opponent
-    win_rate = model.get_win_rate()
-    total_games = model.get_total_games()
-
-    # Only tilt-challenge if we just won (last result was a win)
-    if not model.match_results or not model.match_results[-1].get("won"):
+    # Only tilt-challenge if we just won (last result was a win) — cheapest
+    # check, and the common miss, so it runs before any stats
+    if not results[-1].get("won"):
         return {
             "recommend": False,
             "wager_wei": 0,
             "reason": "Last match was not a win — no tilt opportunity",
         }
 
+    # Check our win rate against this opponent
+    total_games = len(results)
+    win_rate = model.get_win_rate()
+
     # Estimate wager: double the last match's implied wager (from EV)
     # If we have edge, we can afford to bet more
     if win_rate <= 0.5:
@@ -256,20 +279,22 @@ def should_tilt_challenge(
             "reason": f"No edge (win rate {win_rate:.0%}) — tilt-challenge too risky",
         }
 
-    # Calculate tilt wager: base = fraction * bankroll, capped by Kelly limit
-    edge = 2 * win_rate - 1
-    kelly_fraction = edge / 2  # Half-Kelly for safety
-    safe_wager = int(our_balance_wei * min(kelly_fraction, max_fraction))
+    # Calculate tilt wager: base = fraction * bankroll, capped by Kelly limit.
+    # Half-Kelly = (2 * win_rate - 1) / 2 = win_rate - 0.5. Fractions are
+    # scaled to basis points so large wei balances never pass through a float.
+    kelly_bps = int(win_rate * _BPS) - _BPS // 2
+    max_bps = int(max_fraction * _BPS)
+    safe_wager = our_balance_wei * min(kelly_bps, max_bps) // _BPS
 
     # Apply the tilt multiplier (up to the max_fraction cap)
-    tilt_wager = int(safe_wager * multiplier)
-    tilt_wager = min(tilt_wager, int(our_balance_wei * max_fraction))
+    tilt_wager = safe_wager * int(multiplier * _BPS) // _BPS
+    tilt_wager = min(tilt_wager, our_balance_wei * max_bps // _BPS)
 
     # Floor: minimum 1 wei
     tilt_wager = max(tilt_wager, 1)
 
     # Only recommend if wager is meaningful
-    if tilt_wager < 1000000000000000:  # < 0.001 MON
+    if tilt_wager < _MIN_MEANINGFUL_WEI:
         return {
             "recommend": False,
             "wager_wei": tilt_wager,
@@ -290,9 +315,25 @@ def should_tilt_challenge(
 # 4. ELO Pumping Targets
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Last agents list seen by get_elo_pumping_targets, sorted by ELO:
+# (((addr, elo), ...) fingerprint, agents ascending by ELO, their ELOs)
+_pumping_cache = ((), [], [])
+
+
+def _agents_by_elo(agents_list: list[dict]) -> tuple[list[dict], list]:
+    """Agents sorted by ELO (ties in input order), re-sorted only when the list changes."""
+    global _pumping_cache
+    key = tuple((agent["addr"], agent["elo"]) for agent in agents_list)
+    if key != _pumping_cache[0]:
+        ordered = sorted(agents_list, key=lambda agent: agent["elo"])
+        _pumping_cache = (key, ordered, [agent["elo"] for agent in ordered])
+    return _pumping_cache[1], _pumping_cache[2]
+
+
 def get_elo_pumping_targets(
     agents_list: list[dict],
     our_elo: int,
+    limit: int = 20,
 ) -> list[dict]:
     """
     Filter and rank agents whose ELO is significantly below ours for easy wins.
@@ -302,29 +343,23 @@ def get_elo_pumping_targets(
 
     Args:
         agents_list: List of dicts, each with keys:
-                     "addr" (str), "elo" (int)
+                     "addr" (str), "elo" (int) — both required; callers
+                     build these from registry reads, so rows aren't
+                     re-validated here
         our_elo:     Our current ELO rating
+        limit:       Maximum number of targets to return
 
     Returns:
-        List of dicts sorted by ELO gap (descending):
+        Up to `limit` dicts sorted by ELO gap (descending):
         [{"addr": "0x...", "elo": 950, "gap": 65}, ...]
     """
-    min_gap = _config["pumping"]["min_elo_gap"]
-
-    targets = []
-    for agent in agents_list:
-        addr = agent.get("addr", "")
-        elo = agent.get("elo", 0)
-        gap = our_elo - elo
-
-        # Only include agents significantly below us
-        if gap >= min_gap:
-            targets.append({
-                "addr": addr,
-                "elo": elo,
-                "gap": gap,
-            })
-
-    # Sort by gap descending — weakest first (easiest wins)
-    targets.sort(key=lambda x: x["gap"], reverse=True)
-    return targets
+    min_gap = _get_config()["pumping"]["min_elo_gap"]
+
+    # Ascending ELO = descending gap (weakest first, easiest wins); everyone
+    # at or below our_elo - min_gap is a target
+    ordered, elos = _agents_by_elo(agents_list)
+    cutoff = min(bisect.bisect_right(elos, our_elo - min_gap), limit)
+    return [
+        {"addr": agent["addr"], "elo": agent["elo"], "gap": our_elo - agent["elo"]}
+        for agent in ordered[:cutoff]
+    ]
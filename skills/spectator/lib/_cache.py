@@ -0,0 +1,145 @@
+"""
+_cache.py — Memoization for spectator contract reads.
+
+On-chain records that reached a terminal state (settled/cancelled matches,
+resolved markets) can never change, so they are kept for the life of the
+process — and, for reads that opt in, on disk in data/chain_cache.json so
+later runs skip the RPC entirely. Everything else expires after a short TTL
+so repeated reads within one command share a single RPC without going stale.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from functools import wraps
+from pathlib import Path
+
+# Seconds a non-terminal read stays fresh
+DEFAULT_TTL = 5.0
+
+_caches = []  # every cached_read() wrapper's entry dict, for clear_mutable()
+
+# ─── Disk cache for terminal records ─────────────────────────────────────────
+
+CHAIN_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "chain_cache.json"
+
+# Bump when a cached record's shape changes; older files are discarded
+CHAIN_CACHE_VERSION = 1
+
+_disk = None  # namespace → {args key → value}, loaded on first use
+_disk_dirty = False
+_disk_lock = threading.Lock()
+
+
+def _disk_namespace(namespace: str) -> dict:
+    """The on-disk entries for one namespace, loading the cache file once."""
+    global _disk
+    with _disk_lock:
+        if _disk is None:
+            try:
+                with open(CHAIN_CACHE_PATH) as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            _disk = data.get("entries", {}) if data.get("version") == CHAIN_CACHE_VERSION else {}
+        return _disk.setdefault(namespace, {})
+
+
+def _save_disk():
+    """Write the disk cache back if it gained entries (registered with atexit)."""
+    if not _disk_dirty:
+        return
+    with _disk_lock:
+        data = json.dumps({"version": CHAIN_CACHE_VERSION, "entries": _disk})
+    try:
+        CHAIN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = CHAIN_CACHE_PATH.with_name(f"{CHAIN_CACHE_PATH.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(data)
+        os.replace(tmp_path, CHAIN_CACHE_PATH)
+    except OSError:
+        pass  # Read-only checkout — the next run just re-reads the chain
+
+
+atexit.register(_save_disk)
+
+
+def cached_read(ttl: float = DEFAULT_TTL, is_final=None, maxsize: int = 4096, persist: str = None):
+    """
+    Memoize a contract read by its arguments.
+
+    Args:
+        ttl: Seconds a cached value is served before re-reading
+        is_final: Optional predicate on the returned value; True means the
+                  record is immutable and is cached without expiry
+        maxsize: Entries kept before the oldest are evicted
+        persist: Namespace (e.g. contract name + address) under which final
+                 values are also kept in the on-disk cache; positional args
+                 only, and values must be JSON-serializable
+
+    The wrapper also gets peek(*args) — the cached value or None, never
+    reading the chain — and put(value, *args), which caches a value read
+    some other way (e.g. in a multicall batch) and returns it.
+    """
+    def decorator(func):
+        entries = {}  # args → (value, expires_at or None for terminal records)
+        lock = threading.Lock()
+
+        def disk_key(args) -> str:
+            return ",".join(map(str, args))
+
+        def store(key, value, persist_ok: bool = True):
+            global _disk_dirty
+            final = is_final is not None and is_final(value)
+            with lock:
+                entries.pop(key, None)
+                if len(entries) >= maxsize:
+                    entries.pop(next(iter(entries)))  # Oldest insertion
+                entries[key] = (value, None if final else time.monotonic() + ttl)
+            if final and persist is not None and persist_ok:
+                _disk_namespace(persist)[disk_key(key)] = value
+                _disk_dirty = True
+
+        def lookup(key, on_disk: bool):
+            """Cached value for key, or None; a persisted hit is kept in memory too."""
+            entry = entries.get(key)
+            if entry is not None and (entry[1] is None or entry[1] > time.monotonic()):
+                return entry[0]
+            if on_disk and persist is not None:
+                value = _disk_namespace(persist).get(disk_key(key))
+                if value is not None:
+                    with lock:
+                        entries[key] = (value, None)
+                    return value
+            return None
+
+        def peek(*args):
+            return lookup(args, True)
+
+        def put(value, *args):
+            store(args, value)
+            return value
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            value = lookup(key, not kwargs)
+            if value is None:
+                value = func(*args, **kwargs)
+                store(key, value, persist_ok=not kwargs)
+            return value
+
+        wrapper.cache_clear = entries.clear
+        wrapper.peek = peek
+        wrapper.put = put
+        _caches.append((entries, lock))
+        return wrapper
+    return decorator
+
+
+def clear_mutable():
+    """Drop every non-terminal cached read, e.g. after sending a transaction."""
+    for entries, lock in _caches:
+        with lock:
+            for key in [k for k, (_, expires_at) in entries.items() if expires_at is not None]:
+                del entries[key]
@@ -1,235 +1,614 @@
-"""
-Spectator contract interface — read-only wrappers + prediction market betting.
-
-Loads ABIs from Foundry build artifacts and provides view functions for
-Escrow, AgentRegistry, and PredictionMarket contracts on Monad mainnet.
-"""
-import json
-import os
-from pathlib import Path
-
-from dotenv import load_dotenv
-from web3 import Web3
-
-# ─── Paths ────────────────────────────────────────────────────────────────────
-
-# Project root (spectator/lib/ → spectator/ → skills/ → root)
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
-CONTRACTS_OUT = PROJECT_ROOT / "contracts" / "out"
-
-# Load .env before reading env vars
-load_dotenv(PROJECT_ROOT / ".env")
-
-# ─── Deployed Addresses ──────────────────────────────────────────────────────
-
-AGENT_REGISTRY_ADDRESS = os.getenv("AGENT_REGISTRY_ADDRESS", "")
-ESCROW_ADDRESS = os.getenv("ESCROW_ADDRESS", "")
-PREDICTION_MARKET_ADDRESS = os.getenv("PREDICTION_MARKET_ADDRESS", "")
-
-# ─── Monad Config ────────────────────────────────────────────────────────────
-
-MONAD_RPC_URL = os.getenv("MONAD_RPC_URL", "https://monad-mainnet.g.alchemy.com/v2/bl9zbJnm4_TpoPKha-QRB")
-MONAD_CHAIN_ID = int(os.getenv("MONAD_CHAIN_ID", "143"))
-
-# ─── Escrow Match Status ─────────────────────────────────────────────────────
-
-class MatchStatus:
-    CREATED = 0
-    ACTIVE = 1
-    SETTLED = 2
-    CANCELLED = 3
-
-# ─── Game Type Constants ─────────────────────────────────────────────────────
-
-class GameType:
-    RPS = 0
-    POKER = 1
-    AUCTION = 2
-
-# ─── ABI Loading ─────────────────────────────────────────────────────────────
-
-_abis = {}
-
-def _load_abi(contract_name: str) -> list:
-    """Load ABI from Foundry build artifact."""
-    if contract_name not in _abis:
-        artifact_path = CONTRACTS_OUT / f"{contract_name}.sol" / f"{contract_name}.json"
-        if not artifact_path.exists():
-            raise FileNotFoundError(f"ABI not found at {artifact_path}. Run 'forge build' first.")
-        with open(artifact_path) as f:
-            _abis[contract_name] = json.load(f)["abi"]
-    return _abis[contract_name]
-
-# ─── Lazy Web3 + Account Init ────────────────────────────────────────────────
-
-_w3 = None
-_account = None
-
-def get_w3() -> Web3:
-    """Get Web3 instance connected to Monad RPC. Lazy-initialized."""
-    global _w3
-    if _w3 is None:
-        _w3 = Web3(Web3.HTTPProvider(MONAD_RPC_URL))
-        if not _w3.is_connected():
-            raise ConnectionError(f"Cannot connect to Monad RPC at {MONAD_RPC_URL}")
-    return _w3
-
-def get_account():
-    """Get Account from DEPLOYER_PRIVATE_KEY. Lazy-initialized."""
-    global _account
-    if _account is None:
-        pk = os.getenv("DEPLOYER_PRIVATE_KEY", "")
-        if not pk:
-            raise ValueError("DEPLOYER_PRIVATE_KEY not set in .env")
-        _account = get_w3().eth.account.from_key(pk)
-    return _account
-
-def get_address() -> str:
-    """Get the checksummed address of the spectator wallet."""
-    return get_account().address
-
-# ─── Contract Instance Getters ────────────────────────────────────────────────
-
-_contracts = {}
-
-def _get_contract(name: str, address: str):
-    """Lazy-initialize a contract instance."""
-    if name not in _contracts:
-        abi = _load_abi(name)
-        addr = Web3.to_checksum_address(address)
-        _contracts[name] = get_w3().eth.contract(address=addr, abi=abi)
-    return _contracts[name]
-
-def get_escrow():
-    return _get_contract("Escrow", ESCROW_ADDRESS)
-
-def get_registry():
-    return _get_contract("AgentRegistry", AGENT_REGISTRY_ADDRESS)
-
-def get_prediction_market():
-    return _get_contract("PredictionMarket", PREDICTION_MARKET_ADDRESS)
-
-# ─── Transaction Helper ──────────────────────────────────────────────────────
-
-def send_tx(func, value=0):
-    """Build, sign, send, and wait for a contract function call."""
-    w3 = get_w3()
-    account = get_account()
-    tx = func.build_transaction({
-        "from": account.address,
-        "value": value,
-        "nonce": w3.eth.get_transaction_count(account.address),
-        "chainId": MONAD_CHAIN_ID,
-    })
-    try:
-        estimated = w3.eth.estimate_gas(tx)
-        tx["gas"] = int(estimated * 1.2)
-    except Exception:
-        tx["gas"] = 500000
-    signed = account.sign_transaction(tx)
-    tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
-    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
-    if receipt["status"] == 0:
-        raise Exception(f"Transaction reverted: {tx_hash.hex()}")
-    return receipt
-
-# ─── Utility Functions ────────────────────────────────────────────────────────
-
-def wei_to_mon(wei: int) -> float:
-    """Convert wei to MON (18 decimals)."""
-    return wei / 10**18
-
-def mon_to_wei(mon: float) -> int:
-    """Convert MON to wei (18 decimals)."""
-    return int(mon * 10**18)
-
-def get_balance(address: str = None) -> int:
-    """Get MON balance in wei."""
-    if address is None:
-        address = get_address()
-    return get_w3().eth.get_balance(Web3.to_checksum_address(address))
-
-# ─── Escrow View Functions ────────────────────────────────────────────────────
-
-def get_escrow_match(match_id: int) -> dict:
-    """Get escrow match details."""
-    result = get_escrow().functions.getMatch(match_id).call()
-    return {
-        "player1": result[0],
-        "player2": result[1],
-        "wager": result[2],
-        "gameContract": result[3],
-        "status": int(result[4]),
-        "createdAt": result[5],
-    }
-
-def get_next_match_id() -> int:
-    """Get the next match ID from Escrow."""
-    return get_escrow().functions.nextMatchId().call()
-
-# ─── AgentRegistry View Functions ─────────────────────────────────────────────
-
-def get_agent_info(address: str) -> dict:
-    """Get agent info from AgentRegistry."""
-    addr = Web3.to_checksum_address(address)
-    result = get_registry().functions.getAgent(addr).call()
-    return {
-        "wallet": result[0],
-        "gameTypes": result[1],
-        "minWager": result[2],
-        "maxWager": result[3],
-        "isOpen": result[4],
-        "exists": result[5],
-    }
-
-def get_elo(address: str, game_type: int = GameType.RPS) -> int:
-    """Get ELO rating for an agent."""
-    addr = Web3.to_checksum_address(address)
-    return get_registry().functions.elo(addr, game_type).call()
-
-# ─── PredictionMarket View Functions ──────────────────────────────────────────
-
-def get_market(market_id: int) -> dict:
-    """Get prediction market data."""
-    result = get_prediction_market().functions.getMarket(market_id).call()
-    return {
-        "matchId": result[0],
-        "reserveYES": result[1],
-        "reserveNO": result[2],
-        "seedLiquidity": result[3],
-        "player1": result[4],
-        "player2": result[5],
-        "resolved": result[6],
-        "winner": result[7],
-    }
-
-def get_market_price(market_id: int) -> tuple:
-    """Get current YES/NO prices (scaled to 1e18 = 1.0)."""
-    result = get_prediction_market().functions.getPrice(market_id).call()
-    return (result[0], result[1])
-
-def get_user_balances(market_id: int, user: str) -> tuple:
-    """Get user's YES/NO token balances for a market."""
-    addr = Web3.to_checksum_address(user)
-    result = get_prediction_market().functions.getUserBalances(market_id, addr).call()
-    return (result[0], result[1])
-
-def get_next_market_id() -> int:
-    """Get the next market ID from PredictionMarket."""
-    return get_prediction_market().functions.nextMarketId().call()
-
-# ─── PredictionMarket Transaction Functions ───────────────────────────────────
-
-def buy_yes(market_id: int, amount_wei: int):
-    """Buy YES tokens on a prediction market."""
-    return send_tx(
-        get_prediction_market().functions.buyYES(market_id),
-        value=amount_wei,
-    )
-
-def buy_no(market_id: int, amount_wei: int):
-    """Buy NO tokens on a prediction market."""
-    return send_tx(
-        get_prediction_market().functions.buyNO(market_id),
-        value=amount_wei,
-    )
+"""
+Spectator contract interface — read-only wrappers + prediction market betting.
+
+Loads ABIs from Foundry build artifacts and provides view functions for
+Escrow, AgentRegistry, and PredictionMarket contracts on Monad mainnet.
+"""
+import asyncio
+import json
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+from eth_account import Account
+from eth_utils.abi import get_abi_output_types
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+
+from ._cache import cached_read, clear_mutable
+
+# orjson parses large artifacts several times faster; stdlib json otherwise.
+# Both accept bytes.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# ─── Paths ────────────────────────────────────────────────────────────────────
+
+# Project root (spectator/lib/ → spectator/ → skills/ → root)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
+CONTRACTS_OUT = PROJECT_ROOT / "contracts" / "out"
+
+# Load .env before reading env vars
+load_dotenv(PROJECT_ROOT / ".env")
+
+# ─── Deployed Addresses ──────────────────────────────────────────────────────
+
+AGENT_REGISTRY_ADDRESS = os.getenv("AGENT_REGISTRY_ADDRESS", "")
+ESCROW_ADDRESS = os.getenv("ESCROW_ADDRESS", "")
+PREDICTION_MARKET_ADDRESS = os.getenv("PREDICTION_MARKET_ADDRESS", "")
+
+# Multicall3 — same deterministic address on every EVM chain, incl. Monad
+MULTICALL3_ADDRESS = os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
+
+# ─── Monad Config ────────────────────────────────────────────────────────────
+
+MONAD_RPC_URL = os.getenv("MONAD_RPC_URL", "https://monad-mainnet.g.alchemy.com/v2/bl9zbJnm4_TpoPKha-QRB")
+MONAD_CHAIN_ID = int(os.getenv("MONAD_CHAIN_ID", "143"))
+
+# ─── Escrow Match Status ─────────────────────────────────────────────────────
+
+class MatchStatus:
+    CREATED = 0
+    ACTIVE = 1
+    SETTLED = 2
+    CANCELLED = 3
+
+# ─── Game Type Constants ─────────────────────────────────────────────────────
+
+class GameType:
+    RPS = 0
+    POKER = 1
+    AUCTION = 2
+
+# ─── ABI Loading ─────────────────────────────────────────────────────────────
+
+# Precompiled ABIs from scripts/bundle_abis.py, when it has been run, with
+# the mtime of the artifact each was taken from (older bundles lack MTIMES)
+try:
+    from . import _abi_bundle
+    _bundled_abis = _abi_bundle.ABIS
+    _bundled_mtimes = getattr(_abi_bundle, "MTIMES", {})
+except ImportError:
+    _bundled_abis, _bundled_mtimes = {}, {}
+
+_abis = {}  # contract name → ABI, once loaded
+
+def _load_abi(contract_name: str) -> list:
+    """
+    Load ABI from the generated bundle, or else the Foundry build artifact.
+
+    A bundle entry is used only if its artifact hasn't been rebuilt since
+    bundle_abis.py ran (or there is no artifact at all).
+
+    The full artifact (bytecode, AST, metadata) is parsed only when it is newer
+    than a JSON copy of just its ABI, kept next to it in contracts/out/;
+    later runs parse the small ABI file instead.
+    """
+    if contract_name not in _abis:
+        artifact_path = CONTRACTS_OUT / f"{contract_name}.sol" / f"{contract_name}.json"
+        cache_path = artifact_path.with_name(f"{contract_name}.abi.json")
+        try:
+            artifact_mtime = artifact_path.stat().st_mtime
+        except FileNotFoundError:
+            if contract_name in _bundled_abis:
+                _abis[contract_name] = _bundled_abis[contract_name]
+                return _abis[contract_name]
+            raise FileNotFoundError(f"ABI not found at {artifact_path}. Run 'forge build' first.")
+        if contract_name in _bundled_abis and _bundled_mtimes.get(contract_name, -1) >= artifact_mtime:
+            _abis[contract_name] = _bundled_abis[contract_name]
+            return _abis[contract_name]
+        try:
+            if cache_path.stat().st_mtime >= artifact_mtime:
+                _abis[contract_name] = _json_loads(cache_path.read_bytes())
+                return _abis[contract_name]
+        except (OSError, ValueError):
+            pass  # No usable cache — parse the artifact
+        abi = _json_loads(artifact_path.read_bytes())["abi"]
+        _abis[contract_name] = abi
+        try:
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(abi, f, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Read-only checkout — just skip the cache
+    return _abis[contract_name]
+
+# ─── Lazy Web3 + Account Init ────────────────────────────────────────────────
+
+_w3 = None
+_account = None
+
+def get_w3() -> Web3:
+    """Get Web3 instance connected to Monad RPC. Lazy-initialized."""
+    global _w3
+    if _w3 is None:
+        _w3 = Web3(Web3.HTTPProvider(MONAD_RPC_URL))
+        if not _w3.is_connected():
+            raise ConnectionError(f"Cannot connect to Monad RPC at {MONAD_RPC_URL}")
+    return _w3
+
+def get_account():
+    """Get Account from DEPLOYER_PRIVATE_KEY. Lazy-initialized."""
+    global _account
+    if _account is None:
+        pk = os.getenv("DEPLOYER_PRIVATE_KEY", "")
+        if not pk:
+            raise ValueError("DEPLOYER_PRIVATE_KEY not set in .env")
+        # Key → account is local; no need to connect to the RPC for it
+        _account = Account.from_key(pk)
+    return _account
+
+@lru_cache(maxsize=1)
+def get_address() -> str:
+    """Get the checksummed address of the spectator wallet. Fixed per process."""
+    return get_account().address
+
+# ─── Address Checksumming ────────────────────────────────────────────────────
+
+@lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """EIP-55 checksum an address once per process (each call is a keccak256)."""
+    return Web3.to_checksum_address(address)
+
+# ─── Contract Instance Getters ────────────────────────────────────────────────
+
+_contracts = {}
+
+def _get_contract(name: str, address: str, abi: list = None):
+    """Lazy-initialize a contract instance (ABI from the build artifacts unless given)."""
+    if name not in _contracts:
+        if abi is None:
+            abi = _load_abi(name)
+        addr = _checksum(address)
+        _contracts[name] = get_w3().eth.contract(address=addr, abi=abi)
+    return _contracts[name]
+
+def get_escrow():
+    return _get_contract("Escrow", ESCROW_ADDRESS)
+
+def get_registry():
+    return _get_contract("AgentRegistry", AGENT_REGISTRY_ADDRESS)
+
+def get_prediction_market():
+    return _get_contract("PredictionMarket", PREDICTION_MARKET_ADDRESS)
+
+# ─── Multicall3 Batching ─────────────────────────────────────────────────────
+
+# Minimal Multicall3 ABI — only aggregate3 is used
+_MULTICALL3_ABI = [{
+    "type": "function",
+    "name": "aggregate3",
+    "stateMutability": "payable",
+    "inputs": [{
+        "name": "calls",
+        "type": "tuple[]",
+        "components": [
+            {"name": "target", "type": "address"},
+            {"name": "allowFailure", "type": "bool"},
+            {"name": "callData", "type": "bytes"},
+        ],
+    }],
+    "outputs": [{
+        "name": "returnData",
+        "type": "tuple[]",
+        "components": [
+            {"name": "success", "type": "bool"},
+            {"name": "returnData", "type": "bytes"},
+        ],
+    }],
+}]
+
+def get_multicall():
+    return _get_contract("Multicall3", MULTICALL3_ADDRESS, _MULTICALL3_ABI)
+
+# Upper bound on concurrent eth_calls when Multicall3 can't be used
+MAX_RPC_WORKERS = 16
+
+# Set once aggregate3 comes back empty: no Multicall3 deployed on this RPC's chain
+_multicall_missing = False
+
+def _call_concurrently(calls: list) -> list:
+    """Run view calls individually but in parallel. Same return shape as multicall()."""
+    def _one(fn):
+        try:
+            return fn.call()
+        except Exception:
+            return None
+
+    with ThreadPoolExecutor(max_workers=min(len(calls), MAX_RPC_WORKERS)) as pool:
+        return list(pool.map(_one, calls))
+
+# Calls per aggregate3 eth_call — keeps every-market scans (e.g. portfolio
+# balances) under RPC gas / response-size limits as the market count grows
+MULTICALL_CHUNK_SIZE = 500
+
+def multicall(calls: list) -> list:
+    """
+    Batch many view calls into Multicall3.aggregate3 eth_calls — one per
+    MULTICALL_CHUNK_SIZE calls, sent concurrently.
+
+    Args:
+        calls: Bound contract calls, e.g. [get_escrow().functions.getMatch(i), ...]
+
+    Returns:
+        Decoded results in call order, shaped like each .call() would return;
+        None for calls that reverted
+    """
+    if len(calls) <= MULTICALL_CHUNK_SIZE:
+        return _multicall_chunk(calls)
+    chunks = [calls[i:i + MULTICALL_CHUNK_SIZE] for i in range(0, len(calls), MULTICALL_CHUNK_SIZE)]
+    with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_RPC_WORKERS)) as pool:
+        return [r for chunk in pool.map(_multicall_chunk, chunks) for r in chunk]
+
+def _multicall_chunk(calls: list) -> list:
+    """One aggregate3 eth_call (or the concurrent fallback) for multicall()."""
+    global _multicall_missing
+    if not calls:
+        return []
+    if _multicall_missing:
+        return _call_concurrently(calls)
+    w3 = get_w3()
+    batch = [(fn.address, True, fn._encode_transaction_data()) for fn in calls]
+    # Only "no Multicall3 here" and a reverted batch fall back; transport
+    # errors (rate limits, timeouts) propagate rather than fanning out N calls
+    try:
+        raw = get_multicall().functions.aggregate3(batch).call()
+    except BadFunctionCallOutput:
+        # Empty return data — no contract at MULTICALL3_ADDRESS on this chain
+        _multicall_missing = True
+        return _call_concurrently(calls)
+    except ContractLogicError:
+        return _call_concurrently(calls)
+
+    results = []
+    for fn, (success, data) in zip(calls, raw):
+        if not success:
+            results.append(None)
+            continue
+        output_types = tuple(get_abi_output_types(fn.abi))
+        decode = _static_decoder(output_types)
+        if decode is not None and len(data) >= decode.size:
+            results.append(decode(data))
+            continue
+        decoded = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, w3.codec.decode(output_types, data))
+        # Match .call(): single return value is unwrapped, multiple come back as a list
+        results.append(decoded[0] if len(decoded) == 1 else list(decoded))
+    return results
+
+# ABI head word of each static type → (struct format, converter for the unpacked field)
+_WORD_FORMATS = {
+    "address": ("12x20s", lambda b: _checksum("0x" + b.hex())),
+    "bool": ("31x?", None),
+    "bytes32": ("32s", None),
+}
+
+def _word_format(abi_type: str):
+    """(struct format, converter) for one static ABI type, or None if it has no fixed word."""
+    if abi_type in _WORD_FORMATS:
+        return _WORD_FORMATS[abi_type]
+    if abi_type.startswith("uint") and abi_type[4:].isdigit():
+        return ("32s", lambda b: int.from_bytes(b, "big"))
+    if abi_type.startswith("int") and abi_type[3:].isdigit():
+        return ("32s", lambda b: int.from_bytes(b, "big", signed=True))
+    return None
+
+@lru_cache(maxsize=None)
+def _static_decoder(output_types: tuple):
+    """
+    Decoder for a call whose return data is a flat run of static words
+    (uints, ints, addresses, bools, bytes32 — alone or as one struct), so
+    multicall() can unpack it with one precompiled struct.Struct instead of
+    walking the ABI in eth_abi. Results are shaped like .call()'s.
+
+    Returns:
+        A callable taking the return bytes (with a .size attribute, the
+        minimum length it needs), or None when the shape has dynamic or
+        nested types and must go through the codec
+    """
+    if len(output_types) == 1 and output_types[0].startswith("(") and output_types[0].endswith(")"):
+        types, shape = output_types[0][1:-1].split(","), tuple
+    else:
+        types, shape = list(output_types), list
+    formats = [_word_format(t) for t in types]
+    if not types or None in formats:
+        return None
+
+    layout = struct.Struct(">" + "".join(fmt for fmt, _ in formats))
+    converters = [conv for _, conv in formats]
+
+    def decode(data):
+        values = [v if conv is None else conv(v) for conv, v in zip(converters, layout.unpack_from(data))]
+        if shape is list and len(values) == 1:
+            return values[0]  # Single return value is unwrapped, as with .call()
+        return shape(values)
+
+    decode.size = layout.size
+    return decode
+
+# ─── Transaction Helper ──────────────────────────────────────────────────────
+
+_next_nonce = None  # Next nonce for our account; None = fetch from the RPC
+
+def send_tx(func, value=0):
+    """Build, sign, send, and wait for a contract function call."""
+    global _next_nonce
+    w3 = get_w3()
+    account = get_account()
+    # Nonce is fetched once per process, then incremented locally
+    if _next_nonce is None:
+        _next_nonce = w3.eth.get_transaction_count(account.address, "pending")
+    try:
+        tx = func.build_transaction({
+            "from": account.address,
+            "value": value,
+            "nonce": _next_nonce,
+            "chainId": MONAD_CHAIN_ID,
+        })
+        try:
+            estimated = w3.eth.estimate_gas(tx)
+            tx["gas"] = int(estimated * 1.2)
+        except Exception:
+            tx["gas"] = 500000
+        signed = account.sign_transaction(tx)
+        tx_hash = w3.eth.send_raw_transaction(signed.raw_transaction)
+    except Exception:
+        _next_nonce = None  # Re-sync from the RPC on the next call
+        raise
+    _next_nonce += 1
+    receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+    if receipt["status"] == 0:
+        raise Exception(f"Transaction reverted: {tx_hash.hex()}")
+    return receipt
+
+# ─── Utility Functions ────────────────────────────────────────────────────────
+
+def wei_to_mon(wei: int) -> float:
+    """Convert wei to MON (18 decimals)."""
+    return wei / 10**18
+
+def mon_to_wei(mon: float) -> int:
+    """Convert MON to wei (18 decimals)."""
+    return int(mon * 10**18)
+
+def get_balance(address: str = None) -> int:
+    """Get MON balance in wei."""
+    if address is None:
+        address = get_address()
+    return get_w3().eth.get_balance(_checksum(address))
+
+# ─── Escrow View Functions ────────────────────────────────────────────────────
+
+@cached_read(
+    is_final=lambda m: m["status"] in (MatchStatus.SETTLED, MatchStatus.CANCELLED),
+    persist=f"Escrow:{ESCROW_ADDRESS}",
+)
+def get_escrow_match(match_id: int) -> dict:
+    """Get escrow match details."""
+    return _escrow_match_dict(get_escrow().functions.getMatch(match_id).call())
+
+def _escrow_match_dict(result) -> dict:
+    """Decode a getMatch() result tuple."""
+    return {
+        "player1": result[0],
+        "player2": result[1],
+        "wager": result[2],
+        "gameContract": result[3],
+        "status": int(result[4]),
+        "createdAt": result[5],
+    }
+
+@cached_read()
+def get_next_match_id() -> int:
+    """Get the next match ID from Escrow."""
+    return get_escrow().functions.nextMatchId().call()
+
+def batch_get_escrow_matches(match_ids) -> list:
+    """
+    get_escrow_match() for many ids in one eth_call, skipping ids already
+    cached (e.g. settled matches from the disk cache). None where a read failed.
+    """
+    escrow = get_escrow()
+    match_ids = list(match_ids)
+    matches = [get_escrow_match.peek(mid) for mid in match_ids]
+    missing = [i for i, m in enumerate(matches) if m is None]
+    results = multicall([escrow.functions.getMatch(match_ids[i]) for i in missing])
+    for i, r in zip(missing, results):
+        if r is not None:
+            matches[i] = get_escrow_match.put(_escrow_match_dict(r), match_ids[i])
+    return matches
+
+# ─── AgentRegistry View Functions ─────────────────────────────────────────────
+
+def get_agent_info(address: str) -> dict:
+    """Get agent info from AgentRegistry."""
+    addr = _checksum(address)
+    result = get_registry().functions.getAgent(addr).call()
+    return {
+        "wallet": result[0],
+        "gameTypes": result[1],
+        "minWager": result[2],
+        "maxWager": result[3],
+        "isOpen": result[4],
+        "exists": result[5],
+    }
+
+@cached_read(ttl=60)  # ELO only moves when a match settles
+def get_elo(address: str, game_type: int = GameType.RPS) -> int:
+    """Get ELO rating for an agent."""
+    addr = _checksum(address)
+    return get_registry().functions.elo(addr, game_type).call()
+
+# ─── PredictionMarket View Functions ──────────────────────────────────────────
+
+def _market_dict(result) -> dict:
+    """Decode a getMarket() result tuple."""
+    return {
+        "matchId": result[0],
+        "reserveYES": result[1],
+        "reserveNO": result[2],
+        "seedLiquidity": result[3],
+        "player1": result[4],
+        "player2": result[5],
+        "resolved": result[6],
+        "winner": result[7],
+    }
+
+@cached_read(is_final=lambda m: m["resolved"], persist=f"PredictionMarket:{PREDICTION_MARKET_ADDRESS}")
+def get_market(market_id: int) -> dict:
+    """Get prediction market data."""
+    return _market_dict(get_prediction_market().functions.getMarket(market_id).call())
+
+@cached_read()
+def get_market_price(market_id: int) -> tuple:
+    """Get current YES/NO prices (scaled to 1e18 = 1.0)."""
+    result = get_prediction_market().functions.getPrice(market_id).call()
+    return (result[0], result[1])
+
+def get_user_balances(market_id: int, user: str) -> tuple:
+    """Get user's YES/NO token balances for a market."""
+    addr = _checksum(user)
+    result = get_prediction_market().functions.getUserBalances(market_id, addr).call()
+    return (result[0], result[1])
+
+@cached_read()
+def get_next_market_id() -> int:
+    """Get the next market ID from PredictionMarket."""
+    return get_prediction_market().functions.nextMarketId().call()
+
+def batch_get_markets(market_ids) -> list:
+    """
+    get_market() for many ids in one eth_call, skipping ids already cached
+    (e.g. resolved markets from the disk cache). None where a read failed.
+    """
+    pm = get_prediction_market()
+    market_ids = list(market_ids)
+    markets = [get_market.peek(mk_id) for mk_id in market_ids]
+    missing = [i for i, m in enumerate(markets) if m is None]
+    results = multicall([pm.functions.getMarket(market_ids[i]) for i in missing])
+    for i, r in zip(missing, results):
+        if r is not None:
+            markets[i] = get_market.put(_market_dict(r), market_ids[i])
+    return markets
+
+def _price_from_reserves(market: dict) -> tuple:
+    """getPrice() computed locally — exact once a market resolves, as its reserves stop moving."""
+    total = market["reserveYES"] + market["reserveNO"]
+    if total == 0:
+        return (0, 0)
+    return (market["reserveNO"] * 10**18 // total, market["reserveYES"] * 10**18 // total)
+
+def batch_get_positions(market_ids, user: str) -> list:
+    """
+    A user's positions across many markets in two eth_calls: balances for
+    every market, then market data and prices for the markets actually held.
+    Held markets already cached as resolved need neither.
+
+    Returns:
+        One entry per market id: (yes_bal, no_bal, market_dict, (yes_price, no_price))
+        where the user holds tokens; None where they hold none or a read failed
+    """
+    pm = get_prediction_market()
+    addr = _checksum(user)
+    market_ids = list(market_ids)
+    balances = multicall([pm.functions.getUserBalances(mk_id, addr) for mk_id in market_ids])
+    held = [
+        (i, bal) for i, bal in enumerate(balances)
+        if bal is not None and (bal[0] > 0 or bal[1] > 0)
+    ]
+
+    positions = [None] * len(market_ids)
+    to_read = []
+    for i, bal in held:
+        market = get_market.peek(market_ids[i])
+        if market is not None and market["resolved"]:
+            positions[i] = (bal[0], bal[1], market, _price_from_reserves(market))
+        else:
+            to_read.append((i, bal))
+
+    calls = []
+    for i, _ in to_read:
+        calls.append(pm.functions.getMarket(market_ids[i]))
+        calls.append(pm.functions.getPrice(market_ids[i]))
+    details = multicall(calls)
+
+    for n, (i, bal) in enumerate(to_read):
+        market, price = details[2 * n], details[2 * n + 1]
+        if market is not None and price is not None:
+            market = get_market.put(_market_dict(market), market_ids[i])
+            positions[i] = (bal[0], bal[1], market, (price[0], price[1]))
+    return positions
+
+# ─── Async View Functions ─────────────────────────────────────────────────────
+# Concurrent variant of get_elo() for N-agent sweeps: each call is its own
+# RPC, but gather() overlaps them instead of paying N round trips back to back.
+
+_async_w3 = None
+_async_contracts = {}
+
+def get_async_w3() -> AsyncWeb3:
+    """Get AsyncWeb3 instance for Monad RPC. Lazy-initialized."""
+    global _async_w3
+    if _async_w3 is None:
+        _async_w3 = AsyncWeb3(AsyncHTTPProvider(MONAD_RPC_URL))
+    return _async_w3
+
+def _get_async_contract(name: str, address: str):
+    """Lazy-initialize an async contract instance."""
+    if name not in _async_contracts:
+        _async_contracts[name] = get_async_w3().eth.contract(
+            address=_checksum(address), abi=_load_abi(name),
+        )
+    return _async_contracts[name]
+
+async def get_elo_async(address: str, game_type: int = GameType.RPS) -> int:
+    """Async get_elo()."""
+    registry = _get_async_contract("AgentRegistry", AGENT_REGISTRY_ADDRESS)
+    return await registry.functions.elo(_checksum(address), game_type).call()
+
+def _gather(coros) -> list:
+    """Run coroutines concurrently; failed reads come back as None."""
+    async def run():
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        return [None if isinstance(r, Exception) else r for r in results]
+    return asyncio.run(run())
+
+def gather_elos(addresses, game_type: int = GameType.RPS) -> list:
+    """
+    get_elo() for many agents at once. None for reads that failed.
+    Shares get_elo()'s cache: ratings already read are reused, and each
+    remaining agent is read once however often it appears.
+    """
+    elos = {a: get_elo.peek(a, game_type) for a in addresses}
+    missing = [a for a, elo in elos.items() if elo is None]
+    for a, elo in zip(missing, _gather([get_elo_async(a, game_type) for a in missing])):
+        if elo is not None:
+            elos[a] = get_elo.put(elo, a, game_type)
+    return [elos[a] for a in addresses]
+
+# ─── PredictionMarket Transaction Functions ───────────────────────────────────
+
+def buy_yes(market_id: int, amount_wei: int):
+    """Buy YES tokens on a prediction market."""
+    receipt = send_tx(
+        get_prediction_market().functions.buyYES(market_id),
+        value=amount_wei,
+    )
+    clear_mutable()  # Prices and balances just moved
+    return receipt
+
+def buy_no(market_id: int, amount_wei: int):
+    """Buy NO tokens on a prediction market."""
+    receipt = send_tx(
+        get_prediction_market().functions.buyNO(market_id),
+        value=amount_wei,
+    )
+    clear_mutable()  # Prices and balances just moved
+    return receipt
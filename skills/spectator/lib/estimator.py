@@ -6,6 +6,15 @@ then compares with prediction market prices to find betting edges.
 """
 import math
 
+# 10^(d/400) == exp(d * ln(10)/400) — exp is cheaper than a generic pow and
+# the /400 is folded into the constant
+_LN10_OVER_400 = math.log(10) / 400.0
+
+# P(A wins) for every integer ELO gap elo_b - elo_a in [-_ELO_DIFF_MAX, _ELO_DIFF_MAX],
+# indexed by gap + _ELO_DIFF_MAX — built once so scans skip the exp
+_ELO_DIFF_MAX = 2000
+_WIN_PROB = [1.0 / (1.0 + math.exp(d * _LN10_OVER_400)) for d in range(-_ELO_DIFF_MAX, _ELO_DIFF_MAX + 1)]
+
 
 def estimate_win_probability(elo_a: int, elo_b: int) -> float:
     """
@@ -20,8 +29,11 @@ def estimate_win_probability(elo_a: int, elo_b: int) -> float:
     Returns:
         Probability of player A winning (0.0 to 1.0)
     """
-    exponent = (elo_b - elo_a) / 400.0
-    return 1.0 / (1.0 + math.pow(10, exponent))
+    diff = elo_b - elo_a
+    if type(diff) is int and -_ELO_DIFF_MAX <= diff <= _ELO_DIFF_MAX:
+        return _WIN_PROB[diff + _ELO_DIFF_MAX]
+    # Non-integer or extreme gaps: compute directly
+    return 1.0 / (1.0 + math.exp(diff * _LN10_OVER_400))
 
 
 def get_recommendation(
@@ -69,31 +81,55 @@ def get_recommendation(
     yes_edge = p1_win_prob - market_p1_prob       # Edge on YES (p1 wins)
     no_edge = (1 - p1_win_prob) - (1 - market_p1_prob)  # Edge on NO = -(yes_edge)
 
+    # Fields shared by every outcome; only the verdict differs
+    rec = {
+        "recommend": True,
+        "side": None,
+        "elo_prob": p1_win_prob,
+        "market_prob": market_p1_prob,
+    }
+
     # Determine if there's a profitable bet
     if yes_edge >= min_edge:
-        return {
-            "recommend": True,
-            "side": "yes",
-            "elo_prob": p1_win_prob,
-            "market_prob": market_p1_prob,
-            "edge": yes_edge,
-            "reason": f"Player1 underpriced by {yes_edge:.1%} — buy YES",
-        }
+        rec["side"] = "yes"
+        rec["edge"] = yes_edge
+        rec["reason"] = f"Player1 underpriced by {yes_edge:.1%} — buy YES"
     elif -yes_edge >= min_edge:
-        return {
-            "recommend": True,
-            "side": "no",
-            "elo_prob": p1_win_prob,
-            "market_prob": market_p1_prob,
-            "edge": -yes_edge,
-            "reason": f"Player2 underpriced by {-yes_edge:.1%} — buy NO",
-        }
+        rec["side"] = "no"
+        rec["edge"] = -yes_edge
+        rec["reason"] = f"Player2 underpriced by {-yes_edge:.1%} — buy NO"
     else:
-        return {
-            "recommend": False,
-            "side": None,
-            "elo_prob": p1_win_prob,
-            "market_prob": market_p1_prob,
-            "edge": max(abs(yes_edge), abs(no_edge)),
-            "reason": f"No significant edge (max {max(abs(yes_edge), abs(no_edge)):.1%})",
-        }
+        edge = max(abs(yes_edge), abs(no_edge))
+        rec["recommend"] = False
+        rec["edge"] = edge
+        rec["reason"] = f"No significant edge (max {edge:.1%})"
+    return rec
+
+
+def get_recommendations_bulk(rows, min_edge: float = 0.05) -> list:
+    """
+    Screen many markets at once and build full recommendations only for the
+    ones with an edge.
+
+    Args:
+        rows: Iterable of (elo_p1, elo_p2, yes_price, no_price) tuples
+        min_edge: Minimum edge required to recommend a bet (default 5%)
+
+    Returns:
+        List of (row_index, recommendation dict) for rows where
+        get_recommendation() would recommend a bet, in input order
+    """
+    table, offset, exp = _WIN_PROB, _ELO_DIFF_MAX, math.exp
+    flagged = []
+    for i, (elo_p1, elo_p2, yes_price, no_price) in enumerate(rows):
+        total_price = yes_price + no_price
+        if total_price == 0:
+            continue
+        diff = elo_p2 - elo_p1
+        if type(diff) is int and -offset <= diff <= offset:
+            p1_win_prob = table[diff + offset]
+        else:
+            p1_win_prob = 1.0 / (1.0 + exp(diff * _LN10_OVER_400))
+        if abs(p1_win_prob - yes_price / total_price) >= min_edge:
+            flagged.append((i, get_recommendation(elo_p1, elo_p2, yes_price, no_price, min_edge)))
+    return flagged
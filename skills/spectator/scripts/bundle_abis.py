@@ -0,0 +1,57 @@
+#!/usr/bin/env python3.13
+"""
+bundle_abis.py — Precompile the spectator's contract ABIs into a Python module.
+
+Usage: python3.13 skills/spectator/scripts/bundle_abis.py   (after `forge build`)
+
+Reads the Foundry artifacts the spectator uses from contracts/out/ and writes
+skills/spectator/lib/_abi_bundle.py with the ABIs as Python literals. The
+bundle is imported (and .pyc-cached) instead of parsing the full artifacts on
+every run. It records each artifact's mtime, and an entry whose artifact has
+been rebuilt since is ignored in favour of the artifact — re-run this after
+`forge build` to keep the fast path; delete the bundle to go back to reading
+the artifacts directly.
+"""
+import json
+import sys
+from pathlib import Path
+
+# scripts/ → spectator/ → skills/ → root
+_skill_dir = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = _skill_dir.parent.parent
+CONTRACTS_OUT = PROJECT_ROOT / "contracts" / "out"
+BUNDLE_PATH = _skill_dir / "lib" / "_abi_bundle.py"
+
+# Contracts lib/contracts.py loads ABIs for
+CONTRACTS = ("Escrow", "AgentRegistry", "PredictionMarket")
+
+
+def main():
+    abis = {}
+    mtimes = {}
+    for name in CONTRACTS:
+        artifact_path = CONTRACTS_OUT / f"{name}.sol" / f"{name}.json"
+        if not artifact_path.exists():
+            print(f"ERROR: ABI not found at {artifact_path}. Run 'forge build' first.")
+            sys.exit(1)
+        mtimes[name] = artifact_path.stat().st_mtime
+        with open(artifact_path) as f:
+            abis[name] = json.load(f)["abi"]
+
+    lines = [
+        '"""Contract ABIs generated by scripts/bundle_abis.py — do not edit."""',
+        "",
+        "ABIS = {",
+    ]
+    for name, abi in abis.items():
+        lines.append(f"    {name!r}: {abi!r},")
+    lines.append("}")
+    lines.append("")
+    lines.append("# Artifact mtime each ABI was read at — newer artifacts win over the bundle")
+    lines.append(f"MTIMES = {mtimes!r}")
+    BUNDLE_PATH.write_text("\n".join(lines) + "\n")
+    print(f"Wrote {len(abis)} ABIs to {BUNDLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,375 +1,712 @@
-#!/usr/bin/env python3.13
-"""
-spectate.py — CLI dispatcher for the Spectator Agent.
-
-Usage: python3.13 skills/spectator/scripts/spectate.py <command> [args]
-
-Commands:
-    watch                           Scan recent escrow matches, show active ones
-    analyze <match_id>              ELO-based win probability analysis
-    bet <market_id> <yes|no> <amt>  Buy YES/NO tokens on a prediction market
-    portfolio                       Show current market positions and P&L
-    accuracy                        Historical prediction accuracy stats
-"""
-import json
-import sys
-import time
-from pathlib import Path
-
-# ─── Path setup ──────────────────────────────────────────────────────────────
-# Add spectator's lib/ to sys.path so imports work when run from project root
-_skill_dir = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(_skill_dir))
-
-from lib.contracts import (
-    MatchStatus,
-    GameType,
-    get_address,
-    get_balance,
-    get_escrow_match,
-    get_next_match_id,
-    get_agent_info,
-    get_elo,
-    get_market,
-    get_market_price,
-    get_user_balances,
-    get_next_market_id,
-    buy_yes,
-    buy_no,
-    wei_to_mon,
-    mon_to_wei,
-)
-from lib.estimator import estimate_win_probability, get_recommendation
-
-# ─── Predictions Persistence ─────────────────────────────────────────────────
-# Track prediction history for accuracy stats
-
-_PREDICTIONS_PATH = _skill_dir / "data" / "predictions.json"
-
-
-def _load_predictions() -> dict:
-    """Load predictions from JSON file."""
-    try:
-        with open(_PREDICTIONS_PATH) as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"predictions": [], "total": 0, "correct": 0}
-
-
-def _save_predictions(data: dict):
-    """Save predictions to JSON file."""
-    _PREDICTIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(_PREDICTIONS_PATH, "w") as f:
-        json.dump(data, f, indent=2)
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# Commands
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def cmd_watch():
-    """Scan recent escrow matches and show active ones."""
-    next_id = get_next_match_id()
-
-    if next_id == 0:
-        print("No matches created yet.")
-        return
-
-    # Scan the most recent 20 matches (or all if fewer)
-    start = max(0, next_id - 20)
-    found = 0
-
-    print(f"Scanning matches {start} to {next_id - 1}...\n")
-
-    for mid in range(start, next_id):
-        try:
-            m = get_escrow_match(mid)
-            status = MatchStatus
-            status_name = {0: "CREATED", 1: "ACTIVE", 2: "SETTLED", 3: "CANCELLED"}.get(
-                m["status"], "UNKNOWN"
-            )
-
-            # Show CREATED and ACTIVE matches (interesting for spectators)
-            if m["status"] in (MatchStatus.CREATED, MatchStatus.ACTIVE):
-                found += 1
-                wager_mon = wei_to_mon(m["wager"])
-
-                print(f"Match #{mid}  [{status_name}]")
-                print(f"  Player 1: {m['player1']}")
-                print(f"  Player 2: {m['player2']}")
-                print(f"  Wager:    {wager_mon:.6f} MON")
-                print(f"  Game:     {m['gameContract']}")
-                print()
-        except Exception:
-            continue
-
-    if found == 0:
-        print("No active matches found. Check back later.")
-    else:
-        print(f"Found {found} active/pending match(es).")
-
-
-def cmd_analyze():
-    """
-    Analyze a match using ELO ratings and compare with market price.
-    Usage: analyze <match_id>
-    """
-    if len(sys.argv) < 3:
-        print("Usage: spectate.py analyze <match_id>")
-        sys.exit(1)
-
-    match_id = int(sys.argv[2])
-    m = get_escrow_match(match_id)
-
-    status_name = {0: "CREATED", 1: "ACTIVE", 2: "SETTLED", 3: "CANCELLED"}.get(
-        m["status"], "UNKNOWN"
-    )
-    wager_mon = wei_to_mon(m["wager"])
-
-    print(f"Match #{match_id}  [{status_name}]")
-    print(f"  Player 1: {m['player1']}")
-    print(f"  Player 2: {m['player2']}")
-    print(f"  Wager:    {wager_mon:.6f} MON\n")
-
-    # Get ELO ratings for both players (default to RPS)
-    try:
-        elo_p1 = get_elo(m["player1"], GameType.RPS)
-    except Exception:
-        elo_p1 = 1000  # Default ELO
-
-    try:
-        elo_p2 = get_elo(m["player2"], GameType.RPS)
-    except Exception:
-        elo_p2 = 1000
-
-    # Calculate win probability
-    p1_prob = estimate_win_probability(elo_p1, elo_p2)
-
-    print(f"ELO Analysis:")
-    print(f"  Player 1 ELO: {elo_p1}")
-    print(f"  Player 2 ELO: {elo_p2}")
-    print(f"  P1 win prob:  {p1_prob:.1%}")
-    print(f"  P2 win prob:  {1 - p1_prob:.1%}")
-
-    # Check if a prediction market exists for this match
-    try:
-        next_market = get_next_market_id()
-        market_found = False
-
-        for mk_id in range(next_market):
-            try:
-                market = get_market(mk_id)
-                if market["matchId"] == match_id:
-                    market_found = True
-                    prices = get_market_price(mk_id)
-                    yes_pct = prices[0] / 1e18 * 100
-                    no_pct = prices[1] / 1e18 * 100
-
-                    print(f"\nPrediction Market #{mk_id}:")
-                    print(f"  YES price: {yes_pct:.1f}%  (P1 wins)")
-                    print(f"  NO price:  {no_pct:.1f}%  (P2 wins)")
-
-                    # Get recommendation
-                    rec = get_recommendation(elo_p1, elo_p2, prices[0], prices[1])
-                    if rec["recommend"]:
-                        print(f"\n  RECOMMENDATION: Buy {rec['side'].upper()}")
-                        print(f"    Edge: {rec['edge']:.1%}")
-                        print(f"    {rec['reason']}")
-                    else:
-                        print(f"\n  No bet recommended: {rec['reason']}")
-
-                    # Save prediction for accuracy tracking
-                    preds = _load_predictions()
-                    preds["predictions"].append({
-                        "match_id": match_id,
-                        "market_id": mk_id,
-                        "elo_p1": elo_p1,
-                        "elo_p2": elo_p2,
-                        "p1_prob": round(p1_prob, 4),
-                        "predicted_winner": "p1" if p1_prob > 0.5 else "p2",
-                        "timestamp": int(time.time()),
-                        "resolved": False,
-                        "correct": None,
-                    })
-                    preds["total"] += 1
-                    _save_predictions(preds)
-                    break
-            except Exception:
-                continue
-
-        if not market_found:
-            print("\n  No prediction market found for this match.")
-
-    except Exception:
-        print("\n  Could not check prediction markets.")
-
-
-def cmd_bet():
-    """
-    Buy YES or NO tokens on a prediction market.
-    Usage: bet <market_id> <yes|no> <amount_MON>
-    """
-    if len(sys.argv) < 5:
-        print("Usage: spectate.py bet <market_id> <yes|no> <amount_MON>")
-        print("  Example: spectate.py bet 0 yes 0.001")
-        sys.exit(1)
-
-    market_id = int(sys.argv[2])
-    side = sys.argv[3].lower()
-    amount_mon = float(sys.argv[4])
-    amount_wei = mon_to_wei(amount_mon)
-
-    if side not in ("yes", "no"):
-        print("Error: side must be 'yes' or 'no'")
-        sys.exit(1)
-
-    # Show current prices before buying
-    prices = get_market_price(market_id)
-    yes_pct = prices[0] / 1e18 * 100
-    no_pct = prices[1] / 1e18 * 100
-    print(f"Market #{market_id} prices: YES {yes_pct:.1f}% / NO {no_pct:.1f}%")
-    print(f"  Buying {side.upper()} with {amount_mon} MON...")
-
-    if side == "yes":
-        receipt = buy_yes(market_id, amount_wei)
-    else:
-        receipt = buy_no(market_id, amount_wei)
-
-    print(f"  TX: {receipt['transactionHash'].hex()}")
-
-    # Show updated balances
-    addr = get_address()
-    balances = get_user_balances(market_id, addr)
-    print(f"  Your balances: YES={balances[0]}  NO={balances[1]}")
-
-    # Show updated prices
-    prices = get_market_price(market_id)
-    yes_pct = prices[0] / 1e18 * 100
-    no_pct = prices[1] / 1e18 * 100
-    print(f"  New prices:    YES {yes_pct:.1f}% / NO {no_pct:.1f}%")
-
-
-def cmd_portfolio():
-    """Show current prediction market positions and estimated P&L."""
-    addr = get_address()
-    balance = get_balance()
-    print(f"Wallet: {addr}")
-    print(f"Balance: {wei_to_mon(balance):.6f} MON\n")
-
-    try:
-        next_market = get_next_market_id()
-    except Exception:
-        print("Could not read prediction markets.")
-        return
-
-    if next_market == 0:
-        print("No prediction markets exist yet.")
-        return
-
-    print(f"Scanning {next_market} market(s)...\n")
-    found = 0
-
-    for mk_id in range(next_market):
-        try:
-            balances = get_user_balances(mk_id, addr)
-            yes_bal = balances[0]
-            no_bal = balances[1]
-
-            # Only show markets where we have a position
-            if yes_bal > 0 or no_bal > 0:
-                found += 1
-                market = get_market(mk_id)
-                prices = get_market_price(mk_id)
-                yes_pct = prices[0] / 1e18 * 100
-                no_pct = prices[1] / 1e18 * 100
-
-                resolved_str = "RESOLVED" if market["resolved"] else "OPEN"
-
-                print(f"Market #{mk_id}  [{resolved_str}]  (Match {market['matchId']})")
-                print(f"  YES tokens: {yes_bal}  (price: {yes_pct:.1f}%)")
-                print(f"  NO tokens:  {no_bal}  (price: {no_pct:.1f}%)")
-                if market["resolved"]:
-                    zero_addr = "0x" + "0" * 40
-                    if market["winner"] == zero_addr:
-                        print(f"  Outcome: DRAW")
-                    else:
-                        winner_short = market["winner"][:10] + "..."
-                        print(f"  Winner: {winner_short}")
-                print()
-        except Exception:
-            continue
-
-    if found == 0:
-        print("No active positions found.")
-    else:
-        print(f"Total: {found} market position(s).")
-
-
-def cmd_accuracy():
-    """Show historical prediction accuracy stats."""
-    preds = _load_predictions()
-
-    total = preds["total"]
-    if total == 0:
-        print("No predictions recorded yet.")
-        print("Use 'analyze <match_id>' to generate predictions.")
-        return
-
-    # Count resolved predictions
-    resolved = [p for p in preds["predictions"] if p.get("resolved")]
-    correct = preds["correct"]
-    unresolved = total - len(resolved)
-
-    print(f"Prediction Accuracy Stats\n")
-    print(f"  Total predictions: {total}")
-    print(f"  Resolved:          {len(resolved)}")
-    print(f"  Correct:           {correct}")
-    print(f"  Unresolved:        {unresolved}")
-
-    if len(resolved) > 0:
-        accuracy = correct / len(resolved) * 100
-        print(f"\n  Accuracy: {accuracy:.1f}%")
-    else:
-        print(f"\n  Accuracy: N/A (no resolved predictions yet)")
-
-    # Show recent predictions
-    recent = preds["predictions"][-5:]
-    if recent:
-        print(f"\nRecent predictions:")
-        for p in reversed(recent):
-            ts = time.strftime("%Y-%m-%d %H:%M", time.localtime(p["timestamp"]))
-            status = "CORRECT" if p.get("correct") else ("WRONG" if p.get("resolved") else "PENDING")
-            winner = p["predicted_winner"].upper()
-            prob = p["p1_prob"]
-            print(f"  {ts}  Match #{p['match_id']}  Predicted: {winner}  ({prob:.0%})  [{status}]")
-
-
-# ═══════════════════════════════════════════════════════════════════════════════
-# Main
-# ═══════════════════════════════════════════════════════════════════════════════
-
-def main():
-    if len(sys.argv) < 2:
-        print(__doc__)
-        sys.exit(1)
-
-    command = sys.argv[1]
-
-    commands = {
-        "watch": cmd_watch,
-        "analyze": cmd_analyze,
-        "bet": cmd_bet,
-        "portfolio": cmd_portfolio,
-        "accuracy": cmd_accuracy,
-    }
-
-    if command in commands:
-        commands[command]()
-    else:
-        print(f"Unknown command: {command}")
-        print(__doc__)
-        sys.exit(1)
-
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3.13
+"""
+spectate.py — CLI dispatcher for the Spectator Agent.
+
+Usage: python3.13 skills/spectator/scripts/spectate.py <command> [args]
+
+Commands:
+    watch                           Scan recent escrow matches, show active ones
+    analyze <match_id>              ELO-based win probability analysis
+    analyze-all                     Analyze every active match, one table
+    bet <market_id> <yes|no> <amt>  Buy YES/NO tokens on a prediction market
+    portfolio                       Show current market positions and P&L
+    accuracy                        Historical prediction accuracy stats
+"""
+import atexit
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# orjson encodes/decodes prediction lines several times faster; stdlib json
+# otherwise. Both sides work in bytes, one compact JSON document per line.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# ─── Path setup ──────────────────────────────────────────────────────────────
+# Add spectator's lib/ to sys.path so imports work when run from project root
+_skill_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_skill_dir))
+
+# lib.contracts (web3, ABIs) is imported inside the commands that touch the
+# chain, so local-only commands like `accuracy` start without loading it
+from lib.estimator import estimate_win_probability, get_recommendation, get_recommendations_bulk
+
+# ─── Atomic Writes ───────────────────────────────────────────────────────────
+# Data files are replaced whole via a temp file + os.replace, so a crash
+# mid-write leaves the previous version rather than a truncated one. Writes
+# aren't fsynced one by one; every file touched is fsynced once at exit.
+
+_unsynced = set()  # Paths written this process, fsynced by _fsync_written()
+
+
+def _fsync_written():
+    """fsync every data file written this run (registered with atexit)."""
+    for path in _unsynced:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    _unsynced.clear()
+
+
+atexit.register(_fsync_written)
+
+
+def _replace_bytes(path: Path, data: bytes):
+    """Write `data` to a temp file beside `path`, then atomically swap it in."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    _unsynced.add(path)
+
+
+def _replace_json(path: Path, obj):
+    """Atomically replace `path` with `obj` as indented JSON."""
+    _replace_bytes(path, json.dumps(obj, indent=2).encode())
+
+
+# ─── Predictions Persistence ─────────────────────────────────────────────────
+# Track prediction history for accuracy stats. Each prediction is one line
+# appended to a JSONL log, so recording one never rewrites the history; the
+# running counters live in a small stats file beside it.
+
+_DATA_DIR = _skill_dir / "data"
+_PREDICTIONS_LOG = _DATA_DIR / "predictions.jsonl"
+_STATS_PATH = _DATA_DIR / "prediction_stats.json"
+_LEGACY_PREDICTIONS_PATH = _DATA_DIR / "predictions.json"  # Pre-JSONL format
+
+
+def _load_stats() -> dict:
+    """Load prediction counters from JSON file."""
+    try:
+        with open(_STATS_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"total": 0, "correct": 0}
+
+
+def _save_stats(stats: dict):
+    """Save prediction counters to JSON file."""
+    _replace_json(_STATS_PATH, stats)
+
+
+def _migrate_legacy_predictions():
+    """Convert an old predictions.json into the JSONL log + stats, once."""
+    if _PREDICTIONS_LOG.exists() or not _LEGACY_PREDICTIONS_PATH.exists():
+        return
+    try:
+        with open(_LEGACY_PREDICTIONS_PATH) as f:
+            legacy = json.load(f)
+    except json.JSONDecodeError:
+        return
+    # Stats first: the log appearing is what marks the migration done
+    _save_stats({"total": legacy.get("total", 0), "correct": legacy.get("correct", 0)})
+    _replace_bytes(
+        _PREDICTIONS_LOG,
+        b"".join(_json_dumps(pred) + b"\n" for pred in legacy.get("predictions", [])),
+    )
+    _LEGACY_PREDICTIONS_PATH.rename(_LEGACY_PREDICTIONS_PATH.with_suffix(".json.migrated"))
+
+
+def _iter_predictions():
+    """Yield recorded predictions oldest first, one log line at a time."""
+    _migrate_legacy_predictions()
+    try:
+        with open(_PREDICTIONS_LOG, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield _json_loads(line)
+    except FileNotFoundError:
+        return
+
+
+def _append_predictions(predictions: list):
+    """Record predictions: append them to the log in one write and bump the total once."""
+    if not predictions:
+        return
+    _migrate_legacy_predictions()
+    _DATA_DIR.mkdir(parents=True, exist_ok=True)
+    with open(_PREDICTIONS_LOG, "ab") as f:
+        f.write(b"".join(_json_dumps(pred) + b"\n" for pred in predictions))
+    _unsynced.add(_PREDICTIONS_LOG)
+    stats = _load_stats()
+    stats["total"] += len(predictions)
+    _save_stats(stats)
+
+
+# ─── Market Index ────────────────────────────────────────────────────────────
+# match_id → market_id, extended incrementally with markets created since the
+# last run, so analyze doesn't re-read every market to find one. Tagged with
+# the PredictionMarket address it was built from; a redeploy starts it over.
+
+_MARKET_INDEX_PATH = _skill_dir / "data" / "market_index.json"
+
+
+def _load_market_index() -> dict:
+    """Load the market index from JSON file (empty if it belongs to another contract)."""
+    from lib.contracts import PREDICTION_MARKET_ADDRESS
+
+    market = PREDICTION_MARKET_ADDRESS.lower()
+    try:
+        with open(_MARKET_INDEX_PATH) as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        index = None
+    if index is None or index.get("market") != market:
+        index = {"market": market, "scanned_to": 0, "by_match": {}}
+    return index
+
+
+def _save_market_index(index: dict):
+    """Save the market index to JSON file."""
+    _replace_json(_MARKET_INDEX_PATH, index)
+
+
+def _refresh_market_index(index: dict) -> dict:
+    """Index markets created since the last scan into `index` (a market's match never changes)."""
+    from lib.contracts import batch_get_markets, get_next_market_id
+
+    by_match = index["by_match"]
+    next_market = get_next_market_id()
+    start = index["scanned_to"]
+    if start < next_market:
+        markets = batch_get_markets(range(start, next_market))
+        for mk_id, market in enumerate(markets, start):
+            if market is None:
+                break  # Failed read — resume from here next time
+            by_match.setdefault(str(market["matchId"]), mk_id)
+            index["scanned_to"] = mk_id + 1
+        _save_market_index(index)
+    return index
+
+
+def _find_market_for_match(match_id: int) -> int | None:
+    """Market id of the (first) prediction market for a match, or None."""
+    index = _load_market_index()
+    key = str(match_id)
+    if key not in index["by_match"]:
+        _refresh_market_index(index)
+    return index["by_match"].get(key)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Commands
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Escrow MatchStatus value → display name
+_STATUS_NAMES = ("CREATED", "ACTIVE", "SETTLED", "CANCELLED")
+
+# Valid `bet` sides
+_BET_SIDES = frozenset(("yes", "no"))
+
+
+def _status_name(status: int) -> str:
+    return _STATUS_NAMES[status] if 0 <= status < len(_STATUS_NAMES) else "UNKNOWN"
+
+
+# Market prices are scaled to 1e18 = 100%, so 1e16 wei-units = 1%
+_WEI_PER_PCT = 10**16
+
+
+def _price_pcts(prices: tuple) -> tuple:
+    """(yes_pct, no_pct) from get_market_price()'s 1e18-scaled ints."""
+    # int / int is exact-then-rounded; no lossy float product of a 256-bit int
+    return prices[0] / _WEI_PER_PCT, prices[1] / _WEI_PER_PCT
+
+
+# Matches scanned by watch / analyze-all: the most recent this many
+_SCAN_WINDOW = 20
+
+
+def _scan_recent_matches() -> list | None:
+    """
+    Read the most recent _SCAN_WINDOW escrow matches in one batched eth_call.
+
+    Returns:
+        [(match_id, match_dict), ...] for the reads that succeeded, or None
+        (after saying so) when no match has been created yet
+    """
+    from lib.contracts import batch_get_escrow_matches, get_next_match_id
+
+    next_id = get_next_match_id()
+
+    if next_id == 0:
+        print("No matches created yet.")
+        return None
+
+    # Scan the most recent matches (or all if fewer)
+    start = max(0, next_id - _SCAN_WINDOW)
+    print(f"Scanning matches {start} to {next_id - 1}...\n")
+
+    ids = range(start, next_id)
+    return [(mid, m) for mid, m in zip(ids, batch_get_escrow_matches(ids)) if m is not None]
+
+
+def _is_live(m: dict) -> bool:
+    """CREATED or ACTIVE — the matches worth a spectator's attention."""
+    from lib.contracts import MatchStatus
+
+    return m["status"] in (MatchStatus.CREATED, MatchStatus.ACTIVE)
+
+
+def cmd_watch():
+    """Scan recent escrow matches and show active ones."""
+    from lib.contracts import wei_to_mon
+
+    scanned = _scan_recent_matches()
+    if scanned is None:
+        return
+    found = 0
+
+    # Collect the listing and write it once instead of a print() per line
+    out = []
+    for mid, m in scanned:
+        try:
+            status_name = _status_name(m["status"])
+
+            # Show CREATED and ACTIVE matches (interesting for spectators)
+            if _is_live(m):
+                found += 1
+                wager_mon = wei_to_mon(m["wager"])
+
+                out.append(
+                    f"Match #{mid}  [{status_name}]\n"
+                    f"  Player 1: {m['player1']}\n"
+                    f"  Player 2: {m['player2']}\n"
+                    f"  Wager:    {wager_mon:.6f} MON\n"
+                    f"  Game:     {m['gameContract']}\n\n"
+                )
+        except Exception:
+            continue
+    sys.stdout.write("".join(out))
+
+    if found == 0:
+        print("No active matches found. Check back later.")
+    else:
+        print(f"Found {found} active/pending match(es).")
+
+
+def _analyze_core(
+    match_id: int, m: dict = None, elos: tuple = None, market_index: dict = None, recommend: bool = True,
+) -> dict:
+    """
+    ELO analysis of one match plus its market's price and recommendation.
+    Prints nothing and never exits, so it can run on worker threads.
+
+    Args:
+        match_id: Escrow match id
+        m: The match, if already read (otherwise fetched)
+        elos: (elo_p1, elo_p2), if already read (otherwise fetched)
+        market_index: An up-to-date market index to look the market up in
+                      (otherwise _find_market_for_match() refreshes it)
+        recommend: Build the recommendation; False leaves rec None for a
+                   caller that screens many matches at once
+
+    Returns:
+        dict with match_id, match, elo_p1, elo_p2, p1_prob, market_error
+        (bool), market_id, prices, rec and prediction; the last three are
+        None when there is no market or its price could not be read
+    """
+    from lib.contracts import GameType, gather_elos, get_escrow_match, get_market_price
+
+    if m is None:
+        m = get_escrow_match(match_id)
+
+    # Get ELO ratings for both players (default to RPS), fetched concurrently
+    if elos is None:
+        elos = gather_elos([m["player1"], m["player2"]], GameType.RPS)
+    elo_p1, elo_p2 = (1000 if elo is None else elo for elo in elos)  # Default ELO
+
+    # Calculate win probability
+    p1_prob = estimate_win_probability(elo_p1, elo_p2)
+
+    result = {
+        "match_id": match_id,
+        "match": m,
+        "elo_p1": elo_p1,
+        "elo_p2": elo_p2,
+        "p1_prob": p1_prob,
+        "market_error": False,
+        "market_id": None,
+        "prices": None,
+        "rec": None,
+        "prediction": None,
+    }
+
+    # Check if a prediction market exists for this match
+    try:
+        if market_index is None:
+            mk_id = _find_market_for_match(match_id)
+        else:
+            mk_id = market_index["by_match"].get(str(match_id))
+    except Exception:
+        result["market_error"] = True
+        return result
+    result["market_id"] = mk_id
+    if mk_id is None:
+        return result
+
+    try:
+        prices = get_market_price(mk_id)
+        rec = get_recommendation(elo_p1, elo_p2, prices[0], prices[1]) if recommend else None
+    except Exception:
+        return result
+    result["prices"] = prices
+    result["rec"] = rec
+    result["prediction"] = {
+        "match_id": match_id,
+        "market_id": mk_id,
+        "elo_p1": elo_p1,
+        "elo_p2": elo_p2,
+        "p1_prob": round(p1_prob, 4),
+        "predicted_winner": "p1" if p1_prob > 0.5 else "p2",
+        "timestamp": int(time.time()),
+        "resolved": False,
+        "correct": None,
+    }
+    return result
+
+
+def cmd_analyze():
+    """
+    Analyze a match using ELO ratings and compare with market price.
+    Usage: analyze <match_id>
+    """
+    from lib.contracts import wei_to_mon
+
+    if len(sys.argv) < 3:
+        print("Usage: spectate.py analyze <match_id>")
+        sys.exit(1)
+
+    match_id = int(sys.argv[2])
+    a = _analyze_core(match_id)
+    m = a["match"]
+    p1_prob = a["p1_prob"]
+
+    status_name = _status_name(m["status"])
+    wager_mon = wei_to_mon(m["wager"])
+
+    print(f"Match #{match_id}  [{status_name}]")
+    print(f"  Player 1: {m['player1']}")
+    print(f"  Player 2: {m['player2']}")
+    print(f"  Wager:    {wager_mon:.6f} MON\n")
+
+    print(f"ELO Analysis:")
+    print(f"  Player 1 ELO: {a['elo_p1']}")
+    print(f"  Player 2 ELO: {a['elo_p2']}")
+    print(f"  P1 win prob:  {p1_prob:.1%}")
+    print(f"  P2 win prob:  {1 - p1_prob:.1%}")
+
+    if a["market_error"]:
+        print("\n  Could not check prediction markets.")
+        return
+
+    if a["market_id"] is None:
+        print("\n  No prediction market found for this match.")
+        return
+
+    if a["prices"] is None:
+        return
+
+    yes_pct, no_pct = _price_pcts(a["prices"])
+
+    print(f"\nPrediction Market #{a['market_id']}:")
+    print(f"  YES price: {yes_pct:.1f}%  (P1 wins)")
+    print(f"  NO price:  {no_pct:.1f}%  (P2 wins)")
+
+    rec = a["rec"]
+    if rec["recommend"]:
+        print(f"\n  RECOMMENDATION: Buy {rec['side'].upper()}")
+        print(f"    Edge: {rec['edge']:.1%}")
+        print(f"    {rec['reason']}")
+    else:
+        print(f"\n  No bet recommended: {rec['reason']}")
+
+    # Save prediction for accuracy tracking
+    _append_predictions([a["prediction"]])
+
+
+def cmd_analyze_all():
+    """
+    Analyze every active/pending match among the recent ones and print a
+    single table of ELO odds, market prices and recommendations.
+    """
+    from lib.contracts import GameType, MAX_RPC_WORKERS, gather_elos
+
+    scanned = _scan_recent_matches()
+    if scanned is None:
+        return
+    live = [(mid, m) for mid, m in scanned if _is_live(m)]
+    if not live:
+        print("No active matches found. Check back later.")
+        return
+
+    # Every player's ELO in one gather, and the market index refreshed once,
+    # so the per-match workers below only read their market's price
+    players = [addr for _, m in live for addr in (m["player1"], m["player2"])]
+    elos = gather_elos(players, GameType.RPS)
+    try:
+        market_index = _refresh_market_index(_load_market_index())
+        market_error = False
+    except Exception:
+        market_index = {"by_match": {}}
+        market_error = True
+
+    def analyze(n):
+        mid, m = live[n]
+        a = _analyze_core(mid, m, (elos[2 * n], elos[2 * n + 1]), market_index, recommend=False)
+        a["market_error"] = market_error
+        return a
+
+    with ThreadPoolExecutor(max_workers=min(len(live), MAX_RPC_WORKERS)) as pool:
+        results = list(pool.map(analyze, range(len(live))))
+
+    # Screen every priced match in one pass; only those with an edge get a
+    # full recommendation dict
+    priced = [a for a in results if a["prices"] is not None]
+    rows = [(a["elo_p1"], a["elo_p2"], a["prices"][0], a["prices"][1]) for a in priced]
+    for i, rec in get_recommendations_bulk(rows):
+        priced[i]["rec"] = rec
+
+    # Collect the table and write it once instead of a print() per line
+    out = [f"{'Match':>7}  {'ELO P1/P2':>11}  {'P1 win':>6}  {'Market':>6}  {'YES':>6}  {'NO':>6}  Recommendation\n"]
+    for a in results:
+        elo_str = f"{a['elo_p1']}/{a['elo_p2']}"
+        row = f"{'#' + str(a['match_id']):>7}  {elo_str:>11}  {a['p1_prob']:>6.1%}  "
+        if a["prices"] is None:
+            if a["market_error"]:
+                note = "could not check prediction markets"
+            elif a["market_id"] is None:
+                note = "no prediction market"
+            else:
+                note = "could not read market price"
+            market_str = "-" if a["market_id"] is None else f"#{a['market_id']}"
+            out.append(row + f"{market_str:>6}  {'-':>6}  {'-':>6}  {note}\n")
+            continue
+        yes_pct, no_pct = _price_pcts(a["prices"])
+        rec = a["rec"]
+        verdict = f"Buy {rec['side'].upper()} (edge {rec['edge']:.1%})" if rec is not None else "No bet"
+        out.append(
+            row + f"{'#' + str(a['market_id']):>6}  {yes_pct:>5.1f}%  {no_pct:>5.1f}%  {verdict}\n"
+        )
+    sys.stdout.write("".join(out))
+
+    # Save predictions for accuracy tracking (here, not on the workers)
+    _append_predictions([a["prediction"] for a in results if a["prediction"] is not None])
+
+    print(f"\nAnalyzed {len(results)} active/pending match(es).")
+
+
+def cmd_bet():
+    """
+    Buy YES or NO tokens on a prediction market.
+    Usage: bet <market_id> <yes|no> <amount_MON>
+    """
+    from lib.contracts import buy_no, buy_yes, get_address, get_market_price, get_user_balances, mon_to_wei
+
+    if len(sys.argv) < 5:
+        print("Usage: spectate.py bet <market_id> <yes|no> <amount_MON>")
+        print("  Example: spectate.py bet 0 yes 0.001")
+        sys.exit(1)
+
+    market_id = int(sys.argv[2])
+    side = sys.argv[3].lower()
+    amount_mon = float(sys.argv[4])
+    amount_wei = mon_to_wei(amount_mon)
+
+    if side not in _BET_SIDES:
+        print("Error: side must be 'yes' or 'no'")
+        sys.exit(1)
+
+    # Show current prices before buying
+    prices = get_market_price(market_id)
+    yes_pct, no_pct = _price_pcts(prices)
+    print(f"Market #{market_id} prices: YES {yes_pct:.1f}% / NO {no_pct:.1f}%")
+    print(f"  Buying {side.upper()} with {amount_mon} MON...")
+
+    if side == "yes":
+        receipt = buy_yes(market_id, amount_wei)
+    else:
+        receipt = buy_no(market_id, amount_wei)
+
+    print(f"  TX: {receipt['transactionHash'].hex()}")
+
+    # Show updated balances
+    addr = get_address()
+    balances = get_user_balances(market_id, addr)
+    print(f"  Your balances: YES={balances[0]}  NO={balances[1]}")
+
+    # Show updated prices
+    prices = get_market_price(market_id)
+    yes_pct, no_pct = _price_pcts(prices)
+    print(f"  New prices:    YES {yes_pct:.1f}% / NO {no_pct:.1f}%")
+
+
+def cmd_portfolio():
+    """Show current prediction market positions and estimated P&L."""
+    from lib.contracts import (
+        batch_get_positions, get_address, get_balance, get_next_market_id, get_w3, wei_to_mon,
+    )
+
+    addr = get_address()
+    get_w3()  # Connect once before the reads below share it
+
+    # Wallet balance and market count are independent — overlap the two reads
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        balance_future = pool.submit(get_balance)
+        next_market_future = pool.submit(get_next_market_id)
+        balance = balance_future.result()
+    print(f"Wallet: {addr}")
+    print(f"Balance: {wei_to_mon(balance):.6f} MON\n")
+
+    try:
+        next_market = next_market_future.result()
+    except Exception:
+        print("Could not read prediction markets.")
+        return
+
+    if next_market == 0:
+        print("No prediction markets exist yet.")
+        return
+
+    print(f"Scanning {next_market} market(s)...\n")
+    found = 0
+
+    # Balances for every market, then details for held ones: two batched eth_calls
+    ids = range(next_market)
+    positions = batch_get_positions(ids, addr)
+
+    # Collect the listing and write it once instead of a print() per line
+    out = []
+    for mk_id, position in zip(ids, positions):
+        try:
+            # Only show markets where we have a position
+            if position is not None:
+                found += 1
+                yes_bal, no_bal, market, prices = position
+                yes_pct, no_pct = _price_pcts(prices)
+
+                resolved_str = "RESOLVED" if market["resolved"] else "OPEN"
+
+                out.append(
+                    f"Market #{mk_id}  [{resolved_str}]  (Match {market['matchId']})\n"
+                    f"  YES tokens: {yes_bal}  (price: {yes_pct:.1f}%)\n"
+                    f"  NO tokens:  {no_bal}  (price: {no_pct:.1f}%)\n"
+                )
+                if market["resolved"]:
+                    zero_addr = "0x" + "0" * 40
+                    if market["winner"] == zero_addr:
+                        out.append("  Outcome: DRAW\n")
+                    else:
+                        winner_short = market["winner"][:10] + "..."
+                        out.append(f"  Winner: {winner_short}\n")
+                out.append("\n")
+        except Exception:
+            continue
+    sys.stdout.write("".join(out))
+
+    if found == 0:
+        print("No active positions found.")
+    else:
+        print(f"Total: {found} market position(s).")
+
+
+def cmd_accuracy():
+    """Show historical prediction accuracy stats."""
+    _migrate_legacy_predictions()  # Before reading the stats it writes
+    stats = _load_stats()
+
+    total = stats["total"]
+    if total == 0:
+        print("No predictions recorded yet.")
+        print("Use 'analyze <match_id>' to generate predictions.")
+        return
+
+    # One streaming pass over the log: count resolved, keep only the last 5
+    resolved = 0
+    recent = deque(maxlen=5)
+    for p in _iter_predictions():
+        if p.get("resolved"):
+            resolved += 1
+        recent.append(p)
+    correct = stats["correct"]
+    unresolved = total - resolved
+
+    # Collect the report and write it once instead of a print() per line
+    out = [
+        f"Prediction Accuracy Stats\n\n"
+        f"  Total predictions: {total}\n"
+        f"  Resolved:          {resolved}\n"
+        f"  Correct:           {correct}\n"
+        f"  Unresolved:        {unresolved}\n"
+    ]
+
+    if resolved > 0:
+        accuracy = correct / resolved * 100
+        out.append(f"\n  Accuracy: {accuracy:.1f}%\n")
+    else:
+        out.append(f"\n  Accuracy: N/A (no resolved predictions yet)\n")
+
+    # Show recent predictions
+    if recent:
+        out.append(f"\nRecent predictions:\n")
+        for p in reversed(recent):
+            ts = time.strftime("%Y-%m-%d %H:%M", time.localtime(p["timestamp"]))
+            status = "CORRECT" if p.get("correct") else ("WRONG" if p.get("resolved") else "PENDING")
+            winner = p["predicted_winner"].upper()
+            prob = p["p1_prob"]
+            out.append(f"  {ts}  Match #{p['match_id']}  Predicted: {winner}  ({prob:.0%})  [{status}]\n")
+    sys.stdout.write("".join(out))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# Main
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _usage():
+    """Print usage and exit non-zero (no command given)."""
+    print(__doc__)
+    sys.exit(1)
+
+
+def _unknown():
+    """Report an unrecognised command, print usage and exit non-zero."""
+    print(f"Unknown command: {sys.argv[1]}")
+    print(__doc__)
+    sys.exit(1)
+
+
+# Command name → handler, built once at import
+_COMMANDS = {
+    "watch": cmd_watch,
+    "analyze": cmd_analyze,
+    "analyze-all": cmd_analyze_all,
+    "bet": cmd_bet,
+    "portfolio": cmd_portfolio,
+    "accuracy": cmd_accuracy,
+}
+
+
+def main():
+    if len(sys.argv) < 2:
+        _usage()
+    _COMMANDS.get(sys.argv[1], _unknown)()
+
+if __name__ == "__main__":
+    main()